@@ -0,0 +1,86 @@
+"""Microbenchmark: per-call request preparation from a binding dict vs a compiled plan.
+
+Run with `python benchmarks/invocation_plan.py`. Only request preparation is
+measured (path rendering, URL join, origin and parameter selection); no
+network I/O is performed.
+"""
+
+from __future__ import annotations
+
+import timeit
+from typing import Any, Dict
+from urllib.parse import quote
+
+from openapi_to_mcp.adapters.http_invoker import _build_request
+from openapi_to_mcp.adapters.upstream_pool import origin_of
+from openapi_to_mcp.domain.models import InvocationPlan
+
+_PATH_PARAM_COUNT = 8
+_NUMBER = 100_000
+
+
+def _binding() -> Dict[str, Any]:
+    names = [f"p{index}" for index in range(_PATH_PARAM_COUNT)]
+    return {
+        "tool_name": "deepResource",
+        "method": "get",
+        "path": "".join(f"/segment{index}/{{{name}}}" for index, name in enumerate(names)),
+        "server_url": "https://api.example.com/v1",
+        "path_params": names,
+        "query_params": ["limit", "cursor", "fields"],
+        "header_params": ["X-Trace"],
+        "cacheable": True,
+    }
+
+
+def _payload() -> Dict[str, Any]:
+    payload: Dict[str, Any] = {f"p{index}": f"value {index}" for index in range(_PATH_PARAM_COUNT)}
+    payload.update({"limit": 50, "fields": "id,name", "X-Trace": "abc"})
+    return payload
+
+
+def legacy_prepare(binding: Dict[str, Any], payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Per-call binding interpretation as done before compiled plans."""
+    method = str(binding.get("method", "")).upper()
+    path = str(binding.get("path", ""))
+    server_url = str(binding.get("server_url", "")).strip()
+    rendered = path
+    for key in binding.get("path_params", []):
+        rendered = rendered.replace(f"{{{key}}}", quote(str(payload[key]), safe=""))
+    url = f"{server_url.rstrip('/')}{rendered}"
+    return {
+        "method": method,
+        "url": url,
+        "origin": origin_of(url),
+        "operation": str(binding.get("tool_name") or f"{method} {path}"),
+        "query_params": {
+            name: payload[name]
+            for name in binding.get("query_params", [])
+            if name in payload and payload[name] is not None
+        },
+        "headers": {
+            name: str(payload[name])
+            for name in binding.get("header_params", [])
+            if name in payload and payload[name] is not None
+        },
+        "json_body": payload.get("body"),
+    }
+
+
+def main() -> None:
+    binding = _binding()
+    payload = _payload()
+    plan = InvocationPlan.from_binding(binding)
+    assert legacy_prepare(binding, payload)["url"] == _build_request(plan, payload).url
+
+    results = {
+        "binding dict": timeit.timeit(lambda: legacy_prepare(binding, payload), number=_NUMBER),
+        "compiled plan": timeit.timeit(lambda: _build_request(plan, payload), number=_NUMBER),
+    }
+    print(f"{_PATH_PARAM_COUNT} path parameters, {_NUMBER} calls")
+    for name, seconds in results.items():
+        print(f"{name:>14}: {seconds / _NUMBER * 1e6:7.2f} us/call")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Benchmark: JSON codecs on a multi-megabyte list payload.
+
+Run with `python benchmarks/json_codec.py`. The `orjson` row is skipped when
+the package is not installed.
+"""
+
+from __future__ import annotations
+
+import timeit
+from typing import Any, Dict, List
+
+from openapi_to_mcp.adapters.json_codec import JsonCodec, StdlibJsonCodec, build_json_codec
+from openapi_to_mcp.errors import ConfigurationError
+
+_ITEM_COUNT = 20_000
+_NUMBER = 5
+
+
+def _payload() -> List[Dict[str, Any]]:
+    return [
+        {
+            "id": index,
+            "name": f"item-{index}",
+            "price": index * 1.25,
+            "active": index % 2 == 0,
+            "tags": ["alpha", "beta", "gamma"],
+            "owner": {"id": index % 97, "email": f"owner{index % 97}@example.com"},
+        }
+        for index in range(_ITEM_COUNT)
+    ]
+
+
+def _codecs() -> List[JsonCodec]:
+    codecs: List[JsonCodec] = [StdlibJsonCodec()]
+    try:
+        codecs.append(build_json_codec("orjson"))
+    except ConfigurationError:
+        pass
+    return codecs
+
+
+def main() -> None:
+    payload = _payload()
+    encoded = StdlibJsonCodec().dumps(payload)
+    print(f"{_ITEM_COUNT} items, {len(encoded) / 1_000_000:.1f} MB, best of {_NUMBER} runs")
+    for codec in _codecs():
+        decode = min(timeit.repeat(lambda c=codec: c.loads(encoded), number=1, repeat=_NUMBER))
+        encode = min(timeit.repeat(lambda c=codec: c.dumps(payload), number=1, repeat=_NUMBER))
+        print(f"{codec.name:>7}: decode {decode * 1e3:7.1f} ms, encode {encode * 1e3:7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
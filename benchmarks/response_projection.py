@@ -0,0 +1,87 @@
+"""Benchmark: response projection on a large nested upstream body.
+
+Run with `python benchmarks/response_projection.py`. Each row decodes the
+upstream body, optionally projects it, and encodes the tool result, which is
+the work between the upstream socket and the MCP response. The `orjson` rows
+are skipped when the package is not installed.
+"""
+
+from __future__ import annotations
+
+import timeit
+from typing import Any, Dict, List, Optional
+
+from openapi_to_mcp.adapters.json_codec import JsonCodec, StdlibJsonCodec, build_json_codec
+from openapi_to_mcp.adapters.projection import Projection
+from openapi_to_mcp.errors import ConfigurationError
+
+_ITEM_COUNT = 5_000
+_NUMBER = 5
+_FIELDS = ["items.id", "items.name", "next"]
+
+
+def _payload() -> Dict[str, Any]:
+    return {
+        "next": "cursor-2",
+        "items": [
+            {
+                "id": index,
+                "name": f"order-{index}",
+                "status": "shipped",
+                "customer": {
+                    "id": index % 311,
+                    "email": f"customer{index % 311}@example.com",
+                    "address": {"street": f"{index} Main St", "city": "Springfield"},
+                },
+                "lines": [
+                    {"sku": f"SKU-{line}", "quantity": line + 1, "price": line * 2.5}
+                    for line in range(5)
+                ],
+                "history": [
+                    {"at": f"2026-01-{day:02d}", "event": "updated"} for day in range(1, 6)
+                ],
+            }
+            for index in range(_ITEM_COUNT)
+        ],
+    }
+
+
+def _codecs() -> List[JsonCodec]:
+    codecs: List[JsonCodec] = [StdlibJsonCodec()]
+    try:
+        codecs.append(build_json_codec("orjson"))
+    except ConfigurationError:
+        pass
+    return codecs
+
+
+def _round_trip(codec: JsonCodec, body: bytes, projection: Optional[Projection]) -> bytes:
+    decoded = codec.loads(body)
+    if projection is not None:
+        decoded = projection.apply(decoded)
+    return codec.dumps({"status_code": 200, "body": decoded})
+
+
+def main() -> None:
+    body = StdlibJsonCodec().dumps(_payload())
+    projection = Projection.from_paths(_FIELDS)
+    print(
+        f"{_ITEM_COUNT} nested items, {len(body) / 1_000_000:.1f} MB upstream body, "
+        f"fields={_FIELDS}, best of {_NUMBER} runs"
+    )
+    for codec in _codecs():
+        for label, selected in (("full", None), ("projected", projection)):
+            result = _round_trip(codec, body, selected)
+            seconds = min(
+                timeit.repeat(
+                    lambda c=codec, p=selected: _round_trip(c, body, p), number=1, repeat=_NUMBER
+                )
+            )
+            print(
+                f"{codec.name:>7} {label:>9}: {seconds * 1e3:7.1f} ms, "
+                f"result {len(result) / 1_000:8.1f} kB"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Benchmark: invoker calls over TCP loopback, a Unix domain socket, and in-process ASGI.
+
+Run with `python benchmarks/upstream_transports.py`. One small ASGI upstream
+is served by uvicorn on a loopback port and on a Unix socket, and is also
+mounted in-process; the same sequential calls go through `HttpxInvokerAdapter`
+for each transport.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import socket
+import tempfile
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Dict
+
+import uvicorn
+
+from openapi_to_mcp.adapters.http_invoker import HttpxInvokerAdapter
+from openapi_to_mcp.adapters.upstream_pool import UpstreamPoolManager
+
+_CALLS = 2_000
+_ORIGIN = "http://pets.internal"
+_BODY = b'{"id": 1, "name": "rex", "tags": ["good", "boy"]}'
+
+
+async def upstream(scope: Dict[str, Any], receive: Any, send: Any) -> None:
+    if scope["type"] != "http":
+        return
+    await send(
+        {
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [(b"content-type", b"application/json")],
+        }
+    )
+    await send({"type": "http.response.body", "body": _BODY})
+
+
+def _free_port() -> int:
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        return probe.getsockname()[1]
+
+
+async def _serve(config: uvicorn.Config) -> tuple[uvicorn.Server, asyncio.Task[None]]:
+    server = uvicorn.Server(config)
+    task = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.01)
+    return server, task
+
+
+async def _measure(label: str, server_url: str, pool: UpstreamPoolManager) -> None:
+    invoker = HttpxInvokerAdapter(pool=pool)
+    binding = {
+        "tool_name": "getPet",
+        "method": "get",
+        "path": "/pets/{petId}",
+        "server_url": server_url,
+        "path_params": ["petId"],
+    }
+    await invoker.invoke(binding, {"petId": "0"})
+    started = perf_counter()
+    for index in range(_CALLS):
+        await invoker.invoke(binding, {"petId": str(index)})
+    elapsed = perf_counter() - started
+    await pool.aclose()
+    print(f"{label:>5}: {elapsed / _CALLS * 1e6:8.1f} us/call")
+
+
+async def main() -> None:
+    port = _free_port()
+    with tempfile.TemporaryDirectory() as directory:
+        socket_path = str(Path(directory) / "upstream.sock")
+        tcp_server, tcp_task = await _serve(
+            uvicorn.Config(upstream, host="127.0.0.1", port=port, log_level="warning")
+        )
+        uds_server, uds_task = await _serve(
+            uvicorn.Config(upstream, uds=socket_path, log_level="warning")
+        )
+        print(f"{_CALLS} sequential calls per transport")
+        try:
+            await _measure("tcp", f"http://127.0.0.1:{port}", UpstreamPoolManager())
+            await _measure("uds", _ORIGIN, UpstreamPoolManager(uds_paths={_ORIGIN: socket_path}))
+            await _measure("asgi", _ORIGIN, UpstreamPoolManager(asgi_apps={_ORIGIN: upstream}))
+        finally:
+            tcp_server.should_exit = True
+            uds_server.should_exit = True
+            await asyncio.gather(tcp_task, uds_task)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
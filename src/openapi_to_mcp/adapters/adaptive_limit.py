@@ -0,0 +1,137 @@
+"""AIMD concurrency limiter driven by observed latency and errors."""
+
+from __future__ import annotations
+
+import asyncio
+from bisect import bisect_left, insort
+from collections import deque
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable, Dict, Optional
+
+if TYPE_CHECKING:
+    from openapi_to_mcp.adapters.bulkhead import SlotOutcome
+
+# The baseline is a low percentile of recent successful latencies, so a single
+# unusually fast response (a cached 404, say) moves it by at most one rank.
+_BASELINE_WINDOW = 100
+_BASELINE_PERCENTILE = 0.1
+
+
+@dataclass(frozen=True)
+class AimdLimits:
+    """Bounds and tuning for adaptive concurrency limits."""
+
+    initial_limit: int = 16
+    min_limit: int = 1
+    max_limit: int = 128
+    backoff_ratio: float = 0.9
+    latency_tolerance: float = 2.0
+
+
+class AimdConcurrencyLimiter:
+    """Grow the limit additively on healthy calls and shrink it on congestion.
+
+    A call counts as congested when it fails or its latency exceeds
+    `latency_tolerance` times the baseline of its operation, the 10th
+    percentile latency of that operation's last 100 successful calls. An origin
+    serves fast and slow operations alike, and one shared baseline would read
+    every healthy slow call as congestion.
+    """
+
+    def __init__(
+        self,
+        kind: str,
+        key: str,
+        limits: AimdLimits,
+        on_limit_changed: Optional[Callable[[str, str, int], None]] = None,
+    ) -> None:
+        self.kind = kind
+        self.key = key
+        self._limits = limits
+        self._limit = float(min(max(limits.initial_limit, limits.min_limit), limits.max_limit))
+        self._baselines: Dict[str, _LatencyBaseline] = {}
+        self._in_flight = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+        self._on_limit_changed = on_limit_changed
+        self._notify_limit()
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    async def acquire(self) -> None:
+        if self._in_flight < self.limit and not self._waiters:
+            self._in_flight += 1
+            return
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was granted just before cancellation; hand it back.
+                self._in_flight -= 1
+                self._wake_waiters()
+            else:
+                self._waiters.remove(waiter)
+            raise
+
+    def release(self, outcome: SlotOutcome | None = None) -> None:
+        was_saturated = self._in_flight >= self.limit
+        self._in_flight -= 1
+        if outcome is not None and not outcome.cancelled:
+            self._update_limit(outcome, was_saturated)
+        self._wake_waiters()
+
+    def _update_limit(self, outcome: SlotOutcome, was_saturated: bool) -> None:
+        previous = self.limit
+        latency = outcome.latency_seconds
+        congested = outcome.failed
+        if latency is not None and not outcome.failed:
+            baseline = self._baselines.get(outcome.operation)
+            if baseline is None:
+                baseline = self._baselines[outcome.operation] = _LatencyBaseline()
+            congested = latency > baseline.observe(latency) * self._limits.latency_tolerance
+
+        if congested:
+            decreased = self._limit * self._limits.backoff_ratio
+            self._limit = max(float(self._limits.min_limit), decreased)
+        elif was_saturated:
+            increased = self._limit + 1.0 / self._limit
+            self._limit = min(float(self._limits.max_limit), increased)
+
+        if self.limit != previous:
+            self._notify_limit()
+
+    def _wake_waiters(self) -> None:
+        while self._waiters and self._in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if waiter.done():
+                continue
+            self._in_flight += 1
+            waiter.set_result(None)
+
+    def _notify_limit(self) -> None:
+        if self._on_limit_changed is not None:
+            self._on_limit_changed(self.kind, self.key, self.limit)
+
+
+class _LatencyBaseline:
+    """Low percentile of one operation's recent successful latencies."""
+
+    def __init__(self) -> None:
+        self._recent: deque[float] = deque()
+        self._sorted: list[float] = []
+
+    def observe(self, latency: float) -> float:
+        """Add a latency and return the updated baseline."""
+        self._recent.append(latency)
+        insort(self._sorted, latency)
+        if len(self._recent) > _BASELINE_WINDOW:
+            expired = self._recent.popleft()
+            self._sorted.pop(bisect_left(self._sorted, expired))
+        return self._sorted[int((len(self._sorted) - 1) * _BASELINE_PERCENTILE)]
@@ -0,0 +1,74 @@
+"""Per-operation upstream timeouts learned from recent upstream latencies."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict
+
+from openapi_to_mcp.adapters.latency_tracker import LatencyTracker
+from openapi_to_mcp.metrics import RuntimeMetrics
+
+# Recompute an operation's timeout after this many new samples.
+_REFRESH_EVERY = 10
+
+
+@dataclass(frozen=True)
+class AdaptiveTimeoutPolicy:
+    """Percentile, headroom, and bounds for learned timeouts."""
+
+    percentile: float = 0.99
+    headroom: float = 2.0
+    min_seconds: float = 0.1
+    max_seconds: float = 10.0
+
+
+class AdaptiveTimeouts:
+    """Derive each operation's timeout from a rolling latency percentile.
+
+    The timeout is the percentile of recent successful latencies times
+    `headroom`, clamped to `[min_seconds, max_seconds]`. Operations without
+    enough samples have no learned timeout and keep the static default.
+    Timed-out calls count as censored samples at the time they gave up, so
+    a timeout learned below a latency shift grows back instead of failing
+    every call.
+    """
+
+    def __init__(
+        self,
+        policy: AdaptiveTimeoutPolicy,
+        latencies: LatencyTracker | None = None,
+        metrics: RuntimeMetrics | None = None,
+    ) -> None:
+        self._policy = policy
+        self._latencies = latencies or LatencyTracker()
+        self._metrics = metrics
+        self._timeouts: Dict[str, float] = {}
+        self._pending: Dict[str, int] = {}
+
+    def timeout_for(self, operation: str) -> float | None:
+        return self._timeouts.get(operation)
+
+    def record(self, operation: str, latency_seconds: float) -> None:
+        """Record the latency of a successful call."""
+        self._latencies.record(operation, latency_seconds)
+        pending = self._pending.get(operation, 0) + 1
+        if operation not in self._timeouts or pending >= _REFRESH_EVERY:
+            self._refresh(operation)
+            pending = 0
+        self._pending[operation] = pending
+
+    def record_timeout(self, operation: str, elapsed_seconds: float) -> None:
+        """Record a call that timed out after `elapsed_seconds`; its latency is at least that."""
+        self._latencies.record(operation, elapsed_seconds)
+        self._refresh(operation)
+        self._pending[operation] = 0
+
+    def _refresh(self, operation: str) -> None:
+        policy = self._policy
+        observed = self._latencies.percentile(operation, policy.percentile)
+        if observed is None:
+            return
+        timeout = min(max(observed * policy.headroom, policy.min_seconds), policy.max_seconds)
+        self._timeouts[operation] = timeout
+        if self._metrics is not None:
+            self._metrics.set_operation_timeout(operation=operation, timeout_seconds=timeout)
@@ -0,0 +1,71 @@
+"""Admission control that sheds calls instead of queueing them indefinitely."""
+
+from __future__ import annotations
+
+from openapi_to_mcp.errors import OverloadedError
+from openapi_to_mcp.metrics import RuntimeMetrics
+
+_SERVICE_TIME_WEIGHT = 0.2
+
+
+class AdmissionController:
+    """Reject calls when the global slot queue is too deep or too slow to drain.
+
+    The expected wait follows Little's law: calls ahead in the queue times the
+    smoothed service time, divided by the global in-flight limit. Only calls
+    waiting for a global slot are counted, so a backlog on one origin's
+    bulkhead does not shed calls to other origins. A bound of `0` disables
+    that check.
+    """
+
+    def __init__(
+        self,
+        max_in_flight: int,
+        max_queue_depth: int = 0,
+        max_queue_wait_seconds: float = 0.0,
+        metrics: RuntimeMetrics | None = None,
+    ) -> None:
+        self._max_in_flight = max(max_in_flight, 1)
+        self._max_queue_depth = max_queue_depth
+        self._max_queue_wait_seconds = max_queue_wait_seconds
+        self._metrics = metrics
+        self._queued = 0
+        self._service_seconds: float | None = None
+
+    @property
+    def queued(self) -> int:
+        return self._queued
+
+    def estimated_wait_seconds(self) -> float:
+        if self._service_seconds is None:
+            return 0.0
+        return self._queued * self._service_seconds / self._max_in_flight
+
+    def enter(self) -> None:
+        """Join the queue or raise `OverloadedError` without waiting."""
+        estimated = self.estimated_wait_seconds()
+        if self._max_queue_depth > 0 and self._queued >= self._max_queue_depth:
+            self._reject("queue_depth", estimated)
+        if self._max_queue_wait_seconds > 0 and estimated > self._max_queue_wait_seconds:
+            self._reject("queue_wait", estimated)
+        self._queued += 1
+
+    def leave(self) -> None:
+        self._queued -= 1
+
+    def on_completed(self, service_seconds: float) -> None:
+        if self._service_seconds is None:
+            self._service_seconds = service_seconds
+        else:
+            self._service_seconds += (service_seconds - self._service_seconds) * (
+                _SERVICE_TIME_WEIGHT
+            )
+
+    def _reject(self, reason: str, estimated: float) -> None:
+        if self._metrics is not None:
+            self._metrics.on_load_shed(reason=reason)
+        raise OverloadedError(
+            f"Invoker overloaded ({reason}: {self._queued} queued, "
+            f"~{estimated:.3f}s expected wait); retry later.",
+            retry_after_seconds=max(estimated, 1.0),
+        )
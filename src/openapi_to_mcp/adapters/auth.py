@@ -0,0 +1,205 @@
+"""Outbound credentials for OpenAPI API-key and OAuth2 client-credentials schemes."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from time import monotonic
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+
+import httpx
+
+from openapi_to_mcp.adapters.singleflight import SingleFlight
+from openapi_to_mcp.adapters.upstream_pool import UpstreamPoolManager, origin_of
+from openapi_to_mcp.domain.models import SecurityRequirement
+from openapi_to_mcp.errors import InvocationError
+from openapi_to_mcp.metrics import RuntimeMetrics
+
+logger = logging.getLogger(__name__)
+
+# Lifetime assumed when a token response omits `expires_in`.
+_DEFAULT_EXPIRES_IN = 3600.0
+
+TokenKey = Tuple[str, Tuple[str, ...]]
+
+
+@dataclass(frozen=True)
+class _Token:
+    value: str
+    expires_at: float
+
+
+class TokenCache:
+    """Client-credentials tokens shared across calls, keyed by scheme and scopes.
+
+    Concurrent misses share one token request. Once a cached token is within
+    `refresh_ahead_seconds` of expiry it is still served while a background
+    refresh replaces it, so calls only wait on the token endpoint when no
+    usable token exists at all.
+    """
+
+    def __init__(
+        self,
+        pool: UpstreamPoolManager,
+        clients: Mapping[str, Tuple[str, str]],
+        refresh_ahead_seconds: float = 60.0,
+        metrics: RuntimeMetrics | None = None,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        self._pool = pool
+        self._clients = dict(clients)
+        self._refresh_ahead_seconds = refresh_ahead_seconds
+        self._metrics = metrics
+        self._clock = clock
+        self._tokens: Dict[TokenKey, _Token] = {}
+        self._refreshes = SingleFlight()
+        self._background: Dict[TokenKey, asyncio.Task[str]] = {}
+
+    def has_client(self, scheme: str) -> bool:
+        return scheme in self._clients
+
+    async def token(self, requirement: SecurityRequirement) -> str:
+        key = (requirement.scheme, tuple(sorted(requirement.scopes)))
+        cached = self._tokens.get(key)
+        now = self._clock()
+        if cached is None or cached.expires_at <= now:
+            return await self._refresh(key, requirement.token_url, mode="blocking")
+        if cached.expires_at - now <= self._refresh_ahead_seconds:
+            self._refresh_ahead(key, requirement.token_url)
+        return cached.value
+
+    def invalidate(self, requirement: SecurityRequirement) -> None:
+        """Drop a token the upstream rejected so the next call fetches a new one."""
+        self._tokens.pop((requirement.scheme, tuple(sorted(requirement.scopes))), None)
+
+    async def aclose(self) -> None:
+        tasks = list(self._background.values())
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _refresh_ahead(self, key: TokenKey, token_url: str) -> None:
+        if key in self._background or key in self._refreshes:
+            # A refresh for this key is already pending; its result replaces the token.
+            return
+        task = asyncio.ensure_future(self._refresh(key, token_url, mode="ahead"))
+        self._background[key] = task
+        task.add_done_callback(lambda done: self._background_done(key, done))
+
+    def _background_done(self, key: TokenKey, task: asyncio.Task[str]) -> None:
+        if self._background.get(key) is task:
+            del self._background[key]
+        if not task.cancelled() and task.exception() is not None:
+            # The current token stays in use; the next call past expiry retries.
+            logger.warning("token_refresh_ahead_failed", exc_info=task.exception())
+
+    async def _refresh(self, key: TokenKey, token_url: str, *, mode: str) -> str:
+        return await self._refreshes.do(key, lambda: self._fetch(key, token_url, mode=mode))
+
+    async def _fetch(self, key: TokenKey, token_url: str, *, mode: str) -> str:
+        # Runs once per coalesced refresh, so each token request is recorded once.
+        try:
+            value = await self._request_token(key, token_url)
+        except Exception:
+            if self._metrics is not None:
+                self._metrics.on_token_refresh(scheme=key[0], mode=mode, failed=True)
+            raise
+        if self._metrics is not None:
+            self._metrics.on_token_refresh(scheme=key[0], mode=mode, failed=False)
+        return value
+
+    async def _request_token(self, key: TokenKey, token_url: str) -> str:
+        scheme, scopes = key
+        client_id, client_secret = self._clients[scheme]
+        form = {"grant_type": "client_credentials"}
+        if scopes:
+            form["scope"] = " ".join(scopes)
+        requested_at = self._clock()
+        try:
+            async with self._pool.lease(origin_of(token_url)) as client:
+                response = await client.post(
+                    token_url, data=form, auth=httpx.BasicAuth(client_id, client_secret)
+                )
+            response.raise_for_status()
+            payload = response.json()
+        except (httpx.HTTPError, ValueError) as exc:
+            raise InvocationError(f"Token request for scheme '{scheme}' failed: {exc}") from exc
+        value = payload.get("access_token") if isinstance(payload, dict) else None
+        if not isinstance(value, str) or not value:
+            raise InvocationError(f"Token response for scheme '{scheme}' has no access_token.")
+        expires_in = payload.get("expires_in", _DEFAULT_EXPIRES_IN)
+        if not isinstance(expires_in, (int, float)) or isinstance(expires_in, bool):
+            expires_in = _DEFAULT_EXPIRES_IN
+        self._tokens[key] = _Token(value=value, expires_at=requested_at + float(expires_in))
+        return value
+
+
+class OutboundAuth:
+    """Attach credentials for the first security alternative that can be satisfied.
+
+    API keys come from configuration per scheme name; OAuth2 schemes use the
+    token cache. When no alternative is satisfiable the call goes out as is.
+    """
+
+    def __init__(
+        self,
+        api_keys: Optional[Mapping[str, str]] = None,
+        tokens: TokenCache | None = None,
+    ) -> None:
+        self._api_keys = dict(api_keys or {})
+        self._tokens = tokens
+
+    async def apply(
+        self,
+        security: Iterable[Tuple[SecurityRequirement, ...]],
+        headers: Mapping[str, str],
+        params: Mapping[str, object],
+    ) -> Tuple[Dict[str, str], Dict[str, object]]:
+        headers = dict(headers)
+        params = dict(params)
+        alternative = self._satisfiable(security)
+        cookies: List[str] = []
+        for requirement in alternative or ():
+            if requirement.kind == "oauth2":
+                assert self._tokens is not None
+                token = await self._tokens.token(requirement)
+                headers["Authorization"] = f"Bearer {token}"
+                continue
+            value = self._api_keys[requirement.scheme]
+            if requirement.location == "query":
+                params[requirement.name] = value
+            elif requirement.location == "cookie":
+                cookies.append(f"{requirement.name}={value}")
+            else:
+                headers[requirement.name] = value
+        if cookies:
+            existing = headers.get("Cookie")
+            headers["Cookie"] = "; ".join(([existing] if existing else []) + cookies)
+        return headers, params
+
+    def on_unauthorized(self, security: Iterable[Tuple[SecurityRequirement, ...]]) -> None:
+        alternative = self._satisfiable(security)
+        if self._tokens is None or not alternative:
+            return
+        for requirement in alternative:
+            if requirement.kind == "oauth2":
+                self._tokens.invalidate(requirement)
+
+    async def aclose(self) -> None:
+        if self._tokens is not None:
+            await self._tokens.aclose()
+
+    def _satisfiable(
+        self, security: Iterable[Tuple[SecurityRequirement, ...]]
+    ) -> Tuple[SecurityRequirement, ...] | None:
+        for alternative in security:
+            if all(self._can_satisfy(requirement) for requirement in alternative):
+                return alternative
+        return None
+
+    def _can_satisfy(self, requirement: SecurityRequirement) -> bool:
+        if requirement.kind == "oauth2":
+            return self._tokens is not None and self._tokens.has_client(requirement.scheme)
+        return requirement.kind == "apiKey" and requirement.scheme in self._api_keys
@@ -0,0 +1,162 @@
+"""Concurrency partitions that isolate upstream origins and operations."""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import AsyncExitStack, asynccontextmanager
+from dataclasses import dataclass
+from time import perf_counter
+from typing import AsyncIterator, Dict, Mapping, Optional, Protocol
+
+from openapi_to_mcp.adapters.adaptive_limit import AimdConcurrencyLimiter, AimdLimits
+from openapi_to_mcp.adapters.upstream_pool import origin_of
+from openapi_to_mcp.metrics import RuntimeMetrics
+
+
+@dataclass
+class SlotOutcome:
+    """Observed result of the work done while holding partition slots."""
+
+    latency_seconds: float | None = None
+    failed: bool = False
+    cancelled: bool = False
+    operation: str = ""
+
+
+class Partition(Protocol):
+    """Concurrency partition contract shared by static and adaptive limiters."""
+
+    kind: str
+    key: str
+
+    @property
+    def limit(self) -> int:
+        """Current number of allowed in-flight calls."""
+
+    @property
+    def in_flight(self) -> int:
+        """Current number of in-flight calls."""
+
+    async def acquire(self) -> None:
+        """Wait for a free slot."""
+
+    def release(self, outcome: SlotOutcome | None = None) -> None:
+        """Return a slot and report the call outcome."""
+
+
+class ConcurrencyPartition:
+    """Bounded slot pool for one partition key."""
+
+    def __init__(self, kind: str, key: str, limit: int) -> None:
+        self.kind = kind
+        self.key = key
+        self._limit = limit
+        self._semaphore = asyncio.Semaphore(limit)
+        self._in_flight = 0
+
+    @property
+    def limit(self) -> int:
+        return self._limit
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    async def acquire(self) -> None:
+        await self._semaphore.acquire()
+        self._in_flight += 1
+
+    def release(self, outcome: SlotOutcome | None = None) -> None:
+        del outcome
+        self._in_flight -= 1
+        self._semaphore.release()
+
+
+class BulkheadRegistry:
+    """Resolve per-origin and per-operation partitions for an invocation."""
+
+    def __init__(
+        self,
+        origin_max_in_flight: int = 0,
+        origin_overrides: Optional[Mapping[str, int]] = None,
+        operation_max_in_flight: int = 0,
+        operation_overrides: Optional[Mapping[str, int]] = None,
+        adaptive_limits: AimdLimits | None = None,
+        metrics: RuntimeMetrics | None = None,
+    ) -> None:
+        self._origin_max_in_flight = origin_max_in_flight
+        self._origin_overrides = {
+            origin_of(origin): limit for origin, limit in (origin_overrides or {}).items()
+        }
+        self._operation_max_in_flight = operation_max_in_flight
+        self._operation_overrides = dict(operation_overrides or {})
+        self._adaptive_limits = adaptive_limits
+        self._metrics = metrics
+        self._partitions: Dict[tuple[str, str], Partition] = {}
+
+    def partition(self, kind: str, key: str) -> Partition | None:
+        """Return the partition for a key, or None when the kind is unbounded."""
+        existing = self._partitions.get((kind, key))
+        if existing is not None:
+            return existing
+        created: Partition
+        if kind == "origin" and self._adaptive_limits is not None:
+            created = AimdConcurrencyLimiter(
+                kind=kind,
+                key=key,
+                limits=self._adaptive_limits,
+                on_limit_changed=self._on_limit_changed,
+            )
+        else:
+            limit = self._limit_for(kind, key)
+            if limit <= 0:
+                return None
+            created = ConcurrencyPartition(kind=kind, key=key, limit=limit)
+        self._partitions[(kind, key)] = created
+        return created
+
+    @asynccontextmanager
+    async def slot(self, origin: str, operation: str) -> AsyncIterator[SlotOutcome]:
+        """Hold one slot in the operation partition, then in the origin partition.
+
+        The caller records latency and failure on the yielded outcome; an
+        exception raised inside the block counts as a failure.
+        """
+        outcome = SlotOutcome(operation=operation)
+        async with AsyncExitStack() as stack:
+            for kind, key in (("operation", operation), ("origin", origin)):
+                partition = self.partition(kind, key)
+                if partition is None:
+                    continue
+                wait_started = perf_counter()
+                await partition.acquire()
+                stack.callback(self._release, partition, outcome)
+                if self._metrics is not None:
+                    self._metrics.on_partition_acquired(
+                        kind=kind,
+                        key=key,
+                        wait_seconds=perf_counter() - wait_started,
+                    )
+            try:
+                yield outcome
+            except asyncio.CancelledError:
+                # Cancellation (for example a losing hedge) says nothing about upstream health.
+                outcome.cancelled = True
+                raise
+            except BaseException:
+                outcome.failed = True
+                raise
+
+    def _on_limit_changed(self, kind: str, key: str, limit: int) -> None:
+        if self._metrics is not None:
+            self._metrics.set_concurrency_limit(kind=kind, key=key, limit=limit)
+
+    def _release(self, partition: Partition, outcome: SlotOutcome) -> None:
+        partition.release(outcome)
+        if self._metrics is not None:
+            self._metrics.on_partition_released(kind=partition.kind, key=partition.key)
+
+    def _limit_for(self, kind: str, key: str) -> int:
+        if kind == "origin":
+            return self._origin_overrides.get(key, self._origin_max_in_flight)
+        return self._operation_overrides.get(key, self._operation_max_in_flight)
@@ -0,0 +1,178 @@
+"""Circuit breakers that fail fast for unhealthy upstream origins and operations."""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass
+from time import monotonic
+from typing import Callable, Deque, Dict, List, Optional
+
+from openapi_to_mcp.errors import CircuitOpenError
+from openapi_to_mcp.metrics import RuntimeMetrics
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+@dataclass(frozen=True)
+class CircuitBreakerPolicy:
+    """Thresholds for opening a breaker and probing recovery."""
+
+    failure_rate_threshold: float = 0.5
+    minimum_calls: int = 20
+    window_seconds: float = 30.0
+    open_seconds: float = 30.0
+    half_open_max_calls: int = 1
+
+
+class CircuitBreaker:
+    """Closed/open/half-open breaker over a rolling window of one-second buckets."""
+
+    def __init__(
+        self,
+        kind: str,
+        key: str,
+        policy: CircuitBreakerPolicy,
+        clock: Callable[[], float] = monotonic,
+        on_state_changed: Optional[Callable[[str, str, str], None]] = None,
+    ) -> None:
+        self.kind = kind
+        self.key = key
+        self._policy = policy
+        self._clock = clock
+        self._on_state_changed = on_state_changed
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._probes = 0
+        # Each bucket is [second, calls, failures].
+        self._buckets: Deque[List[int]] = deque()
+
+    @property
+    def state(self) -> str:
+        if self._state == OPEN and self._clock() - self._opened_at >= self._policy.open_seconds:
+            self._transition(HALF_OPEN)
+        return self._state
+
+    def allow(self) -> bool:
+        """Return True when a call may proceed; half-open admits a few probes."""
+        state = self.state
+        if state == CLOSED:
+            return True
+        if state == HALF_OPEN and self._probes < self._policy.half_open_max_calls:
+            self._probes += 1
+            return True
+        return False
+
+    def release_probe(self) -> None:
+        """Return an admitted probe that never reached the upstream."""
+        if self._state == HALF_OPEN and self._probes > 0:
+            self._probes -= 1
+
+    def record(self, failed: bool) -> None:
+        if self._state == HALF_OPEN:
+            self._transition(OPEN if failed else CLOSED)
+            return
+        if self._state == OPEN:
+            return
+        now = self._clock()
+        second = int(now)
+        if self._buckets and self._buckets[-1][0] == second:
+            bucket = self._buckets[-1]
+        else:
+            bucket = [second, 0, 0]
+            self._buckets.append(bucket)
+        bucket[1] += 1
+        bucket[2] += int(failed)
+        self._trim(now)
+        calls = sum(entry[1] for entry in self._buckets)
+        if calls < self._policy.minimum_calls:
+            return
+        failures = sum(entry[2] for entry in self._buckets)
+        if failures / calls >= self._policy.failure_rate_threshold:
+            self._transition(OPEN)
+
+    def _trim(self, now: float) -> None:
+        oldest = now - self._policy.window_seconds
+        while self._buckets and self._buckets[0][0] + 1 <= oldest:
+            self._buckets.popleft()
+
+    def _transition(self, state: str) -> None:
+        if state == self._state:
+            return
+        self._state = state
+        self._probes = 0
+        if state == OPEN:
+            self._opened_at = self._clock()
+        if state == CLOSED:
+            self._buckets.clear()
+        if self._on_state_changed is not None:
+            self._on_state_changed(self.kind, self.key, state)
+
+
+class CircuitBreakerRegistry:
+    """Resolve one breaker per origin and per operation on that origin for an invocation."""
+
+    def __init__(
+        self,
+        policy: CircuitBreakerPolicy,
+        metrics: RuntimeMetrics | None = None,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        self._policy = policy
+        self._metrics = metrics
+        self._clock = clock
+        self._breakers: Dict[tuple[str, str], CircuitBreaker] = {}
+
+    def breaker(self, kind: str, key: str) -> CircuitBreaker:
+        breaker = self._breakers.get((kind, key))
+        if breaker is None:
+            breaker = CircuitBreaker(
+                kind=kind,
+                key=key,
+                policy=self._policy,
+                clock=self._clock,
+                on_state_changed=self._on_state_changed,
+            )
+            self._breakers[(kind, key)] = breaker
+        return breaker
+
+    def is_open(self, origin: str, operation: str) -> bool:
+        """Return True while a call would be rejected; unlike `acquire`, takes no probe."""
+        return any(
+            self.breaker(kind, key).state == OPEN for kind, key in _partitions(origin, operation)
+        )
+
+    def acquire(self, origin: str, operation: str) -> None:
+        """Admit a call or raise `CircuitOpenError` without touching the upstream."""
+        admitted: list[CircuitBreaker] = []
+        for kind, key in _partitions(origin, operation):
+            breaker = self.breaker(kind, key)
+            if not breaker.allow():
+                for previous in admitted:
+                    previous.release_probe()
+                if self._metrics is not None:
+                    self._metrics.on_circuit_rejected(kind=kind, key=key)
+                raise CircuitOpenError(
+                    f"Circuit open for {kind} {key}; failing fast until the upstream recovers."
+                )
+            admitted.append(breaker)
+
+    def release(self, origin: str, operation: str) -> None:
+        """Undo `acquire` for a call that was cancelled before completing."""
+        for kind, key in _partitions(origin, operation):
+            self.breaker(kind, key).release_probe()
+
+    def record(self, origin: str, operation: str, failed: bool) -> None:
+        for kind, key in _partitions(origin, operation):
+            self.breaker(kind, key).record(failed)
+
+    def _on_state_changed(self, kind: str, key: str, state: str) -> None:
+        if self._metrics is not None:
+            self._metrics.set_circuit_state(kind=kind, key=key, state=state)
+
+
+def _partitions(origin: str, operation: str) -> tuple[tuple[str, str], ...]:
+    # Operation breakers are per origin too, so one failing replica does not trip
+    # the operation on the others.
+    return (("operation", f"{origin} {operation}"), ("origin", origin))
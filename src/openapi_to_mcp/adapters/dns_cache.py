@@ -0,0 +1,128 @@
+"""Cached DNS resolution for upstream connections."""
+
+from __future__ import annotations
+
+import asyncio
+import ipaddress
+import socket
+from dataclasses import dataclass
+from time import monotonic
+from typing import Awaitable, Callable, Dict, Iterable, List, Tuple
+
+import httpcore
+
+from openapi_to_mcp.metrics import RuntimeMetrics
+
+
+@dataclass
+class _Entry:
+    addresses: List[str]
+    expires_at: float
+
+
+class DnsCache:
+    """Resolve host names once per TTL instead of once per new connection.
+
+    Entries are dropped when every cached address fails to connect, so a
+    moved upstream is re-resolved without waiting for the TTL.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 60.0,
+        metrics: RuntimeMetrics | None = None,
+        clock: Callable[[], float] = monotonic,
+        resolver: Callable[[str, int], Awaitable[List[str]]] | None = None,
+    ) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._metrics = metrics
+        self._clock = clock
+        self._resolver = resolver or _getaddrinfo
+        self._entries: Dict[Tuple[str, int], _Entry] = {}
+
+    async def resolve(self, host: str, port: int) -> List[str]:
+        if _is_ip_address(host):
+            return [host]
+        key = (host, port)
+        entry = self._entries.get(key)
+        if entry is not None and entry.expires_at > self._clock():
+            self._on_lookup("hit")
+            return entry.addresses
+        self._on_lookup("miss")
+        addresses = await self._resolver(host, port)
+        self._entries[key] = _Entry(addresses, self._clock() + self._ttl_seconds)
+        return addresses
+
+    def invalidate(self, host: str, port: int) -> None:
+        self._entries.pop((host, port), None)
+
+    def _on_lookup(self, result: str) -> None:
+        if self._metrics is not None:
+            self._metrics.on_dns_cache_lookup(result)
+
+
+class CachingNetworkBackend(httpcore.AsyncNetworkBackend):
+    """httpcore backend that connects to cached addresses.
+
+    TLS still verifies and sends SNI for the original host name, because
+    httpcore passes the origin host to `start_tls` separately.
+    """
+
+    def __init__(
+        self, cache: DnsCache, backend: httpcore.AsyncNetworkBackend | None = None
+    ) -> None:
+        self._cache = cache
+        self._backend = backend or httpcore.AnyIOBackend()
+
+    async def connect_tcp(
+        self,
+        host: str,
+        port: int,
+        timeout: float | None = None,
+        local_address: str | None = None,
+        socket_options: Iterable[httpcore.SOCKET_OPTION] | None = None,
+    ) -> httpcore.AsyncNetworkStream:
+        try:
+            addresses = await self._cache.resolve(host, port)
+        except OSError as exc:
+            raise httpcore.ConnectError(str(exc)) from exc
+        error: Exception | None = None
+        for address in addresses:
+            try:
+                return await self._backend.connect_tcp(
+                    address,
+                    port,
+                    timeout=timeout,
+                    local_address=local_address,
+                    socket_options=socket_options,
+                )
+            except (httpcore.ConnectError, httpcore.ConnectTimeout) as exc:
+                error = exc
+        self._cache.invalidate(host, port)
+        raise error or httpcore.ConnectError(f"No addresses resolved for {host}.")
+
+    async def connect_unix_socket(
+        self,
+        path: str,
+        timeout: float | None = None,
+        socket_options: Iterable[httpcore.SOCKET_OPTION] | None = None,
+    ) -> httpcore.AsyncNetworkStream:
+        return await self._backend.connect_unix_socket(
+            path, timeout=timeout, socket_options=socket_options
+        )
+
+    async def sleep(self, seconds: float) -> None:
+        await self._backend.sleep(seconds)
+
+
+async def _getaddrinfo(host: str, port: int) -> List[str]:
+    infos = await asyncio.get_running_loop().getaddrinfo(host, port, type=socket.SOCK_STREAM)
+    return list(dict.fromkeys(str(info[4][0]) for info in infos))
+
+
+def _is_ip_address(host: str) -> bool:
+    try:
+        ipaddress.ip_address(host.strip("[]"))
+    except ValueError:
+        return False
+    return True
@@ -0,0 +1,110 @@
+"""Hedged requests for read-only operations with a long latency tail."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from dataclasses import dataclass
+from typing import Awaitable, Callable, FrozenSet, TypeVar
+
+from openapi_to_mcp.adapters.latency_tracker import LatencyTracker
+from openapi_to_mcp.adapters.retry import RetryBudget
+from openapi_to_mcp.metrics import RuntimeMetrics
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class HedgePolicy:
+    """When to send a second request for a slow read-only call."""
+
+    percentile: float = 0.95
+    min_delay_seconds: float = 0.005
+    budget_ratio: float = 0.05
+    operations: FrozenSet[str] = frozenset()
+
+    def applies_to(self, operation: str) -> bool:
+        return not self.operations or operation in self.operations
+
+
+class Hedger:
+    """Race a delayed hedge against the primary attempt and cancel the loser.
+
+    The hedge delay is the configured latency percentile of the operation,
+    so roughly `1 - percentile` of calls are hedged. A token-bucket budget
+    per operation caps the extra load. When the caller passes `dispatched`,
+    the delay starts once the primary sets it, so time spent queueing for
+    capacity does not trigger hedges.
+    """
+
+    def __init__(
+        self,
+        policy: HedgePolicy,
+        latencies: LatencyTracker,
+        metrics: RuntimeMetrics | None = None,
+    ) -> None:
+        self._policy = policy
+        self._latencies = latencies
+        self._metrics = metrics
+        self._budgets: dict[str, RetryBudget] = {}
+
+    def delay_for(self, operation: str) -> float | None:
+        if not self._policy.applies_to(operation):
+            return None
+        delay = self._latencies.percentile(operation, self._policy.percentile)
+        if delay is None:
+            return None
+        return max(delay, self._policy.min_delay_seconds)
+
+    async def run(
+        self,
+        operation: str,
+        attempt: Callable[[], Awaitable[T]],
+        dispatched: asyncio.Event | None = None,
+    ) -> T:
+        delay = self.delay_for(operation)
+        if delay is None:
+            return await attempt()
+
+        budget = self._budgets.get(operation)
+        if budget is None:
+            budget = self._budgets[operation] = RetryBudget(
+                ratio=self._policy.budget_ratio, min_retries_per_second=0.0, max_tokens=1.0
+            )
+        budget.on_request()
+
+        primary = asyncio.ensure_future(attempt())
+        pending: set[asyncio.Future[T]] = {primary}
+        try:
+            if dispatched is not None:
+                sent = asyncio.ensure_future(dispatched.wait())
+                try:
+                    await asyncio.wait({primary, sent}, return_when=asyncio.FIRST_COMPLETED)
+                finally:
+                    sent.cancel()
+            done, _ = await asyncio.wait(pending, timeout=delay)
+            if done or not budget.try_acquire():
+                return await primary
+            hedge = asyncio.ensure_future(attempt())
+            pending.add(hedge)
+            errors: list[BaseException] = []
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for finished in done:
+                    error = finished.exception()
+                    if error is None:
+                        self._on_hedge("hedge" if finished is hedge else "primary")
+                        return finished.result()
+                    errors.append(error)
+            self._on_hedge("failed")
+            raise errors[0]
+        finally:
+            for task in pending:
+                task.cancel()
+            for task in pending:
+                with contextlib.suppress(asyncio.CancelledError, Exception):
+                    await task
+
+    def _on_hedge(self, winner: str) -> None:
+        if self._metrics is not None:
+            self._metrics.on_hedge(winner=winner)
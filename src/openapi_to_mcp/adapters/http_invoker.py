@@ -3,14 +3,89 @@
 from __future__ import annotations
 
 import asyncio
-from time import perf_counter
-from typing import Any, Callable, Dict, Optional
+import math
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from time import monotonic, perf_counter
+from typing import (
+    Any,
+    AsyncContextManager,
+    AsyncIterator,
+    Dict,
+    Hashable,
+    Iterable,
+    Mapping,
+    Optional,
+    Tuple,
+)
 from urllib.parse import quote
 
 import httpx
 
-from openapi_to_mcp.errors import InvocationError
+from openapi_to_mcp.adapters.adaptive_timeout import AdaptiveTimeouts
+from openapi_to_mcp.adapters.admission import AdmissionController
+from openapi_to_mcp.adapters.auth import OutboundAuth
+from openapi_to_mcp.adapters.bulkhead import BulkheadRegistry, SlotOutcome
+from openapi_to_mcp.adapters.circuit_breaker import CircuitBreakerRegistry
+from openapi_to_mcp.adapters.hedging import Hedger
+from openapi_to_mcp.adapters.json_codec import JsonCodec, build_json_codec
+from openapi_to_mcp.adapters.latency_tracker import LatencyTracker
+from openapi_to_mcp.adapters.load_balancer import LoadBalancer
+from openapi_to_mcp.adapters.pagination import Paginator
+from openapi_to_mcp.adapters.projection import Projection
+from openapi_to_mcp.adapters.rate_limiter import RateLimitPacer
+from openapi_to_mcp.adapters.response_cache import ResponseCache
+from openapi_to_mcp.adapters.retry import RetryBudget, RetryPolicy
+from openapi_to_mcp.adapters.scheduler import FairScheduler
+from openapi_to_mcp.adapters.singleflight import SingleFlight
+from openapi_to_mcp.adapters.upstream_pool import UpstreamPoolManager, origin_of
+from openapi_to_mcp.domain.models import (
+    InvocationPlan,
+    OperationTimeouts,
+    Pagination,
+    SecurityRequirement,
+)
+from openapi_to_mcp.errors import (
+    CircuitOpenError,
+    DeadlineExceededError,
+    InvocationError,
+    OverloadedError,
+)
 from openapi_to_mcp.metrics import RuntimeMetrics
+from openapi_to_mcp.request_context import DEADLINE_HEADER, current_deadline, current_session_id
+
+_SAFE_METHODS = frozenset({"GET", "HEAD"})
+# Coalesced callers share the leader's deadline, so only deadlines this close are merged.
+_DEADLINE_BUCKET_SECONDS = 0.1
+# Raised locally before reaching the upstream; never held against its health.
+_LOCAL_REJECTIONS = (CircuitOpenError, OverloadedError)
+# Response extension key set to the byte cap when a body was cut short.
+_TRUNCATED = "openapi_to_mcp.truncated"
+_BODY_FRAMING_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding"})
+
+
+@dataclass
+class _OutboundRequest:
+    method: str
+    url: str
+    origin: str
+    operation: str
+    query_params: Dict[str, Any]
+    headers: Dict[str, str]
+    json_body: Any
+    passthrough: bool = False
+    max_response_bytes: int = 0
+    idempotent: bool = False
+    # Alternate server prefixes; `url` starts with the first one.
+    base_urls: Tuple[str, ...] = ()
+    tags: Tuple[str, ...] = ()
+    timeouts: Optional[OperationTimeouts] = None
+    # Monotonic time after which the call is abandoned.
+    deadline: Optional[float] = None
+    security: Tuple[Tuple[SecurityRequirement, ...], ...] = ()
+    # Set once an attempt holds its slots and goes to the upstream.
+    dispatched: Optional[asyncio.Event] = None
 
 
 class HttpxInvokerAdapter:
@@ -19,96 +94,635 @@ class HttpxInvokerAdapter:
     def __init__(
         self,
         timeout_seconds: float = 10.0,
-        client_factory: Optional[Callable[[], httpx.AsyncClient]] = None,
+        pool: Optional[UpstreamPoolManager] = None,
+        bulkheads: Optional[BulkheadRegistry] = None,
+        response_cache: Optional[ResponseCache] = None,
+        singleflight: Optional[SingleFlight] = None,
+        codec: Optional[JsonCodec] = None,
+        passthrough: bool = False,
+        header_allowlist: Iterable[str] = (),
+        max_response_bytes: int = 0,
+        max_response_bytes_overrides: Optional[Mapping[str, int]] = None,
+        timeout_overrides: Optional[Mapping[str, OperationTimeouts]] = None,
+        deadline_header: str = DEADLINE_HEADER,
+        adaptive_timeouts: Optional[AdaptiveTimeouts] = None,
+        auth: Optional[OutboundAuth] = None,
+        paginator: Optional[Paginator] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        latencies: Optional[LatencyTracker] = None,
+        hedger: Optional[Hedger] = None,
+        breakers: Optional[CircuitBreakerRegistry] = None,
+        balancer: Optional[LoadBalancer] = None,
+        pacer: Optional[RateLimitPacer] = None,
+        admission: Optional[AdmissionController] = None,
+        scheduler: Optional[FairScheduler] = None,
         metrics: RuntimeMetrics | None = None,
         max_connections: int = 100,
         max_keepalive_connections: int = 20,
         max_in_flight: int = 128,
     ) -> None:
-        self._timeout_seconds = timeout_seconds
-        self._client_factory = client_factory
         self._metrics = metrics
-        self._limits = httpx.Limits(
+        self._timeout_seconds = timeout_seconds
+        self._pool = pool or UpstreamPoolManager(
+            timeout_seconds=timeout_seconds,
             max_connections=max_connections,
             max_keepalive_connections=max_keepalive_connections,
         )
+        self._bulkheads = bulkheads or BulkheadRegistry()
+        self._response_cache = response_cache
+        self._singleflight = singleflight
+        self._codec = codec or build_json_codec()
+        self._passthrough = passthrough
+        self._header_allowlist = tuple(name.lower() for name in header_allowlist)
+        self._max_response_bytes = max_response_bytes
+        self._max_response_bytes_overrides = dict(max_response_bytes_overrides or {})
+        self._timeout_overrides = dict(timeout_overrides or {})
+        self._deadline_header = deadline_header
+        self._adaptive_timeouts = adaptive_timeouts
+        self._auth = auth
+        self._paginator = paginator or Paginator(codec=self._codec, metrics=metrics)
+        self._retry_policy = retry_policy
+        self._retry_budgets: Dict[str, RetryBudget] = {}
+        self._latencies = latencies
+        self._hedger = hedger
+        self._breakers = breakers
+        self._balancer = balancer
+        self._pacer = pacer
+        self._admission = admission
+        self._scheduler = scheduler
         self._semaphore = asyncio.Semaphore(max_in_flight)
 
-    async def invoke(self, binding: Dict[str, Any], payload: Dict[str, Any]) -> Dict[str, Any]:
-        method = str(binding.get("method", "")).upper()
-        path = str(binding.get("path", ""))
-        server_url = str(binding.get("server_url", "")).strip()
+    async def invoke(
+        self, binding: Dict[str, Any] | InvocationPlan, payload: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        plan = binding if isinstance(binding, InvocationPlan) else _compile_binding(binding)
+        request = _build_request(plan, payload)
+        projection = _requested_projection(plan, payload)
+        request.passthrough = self._passthrough if plan.passthrough is None else plan.passthrough
+        if projection is not None:
+            # Projection needs the decoded body, so it overrides passthrough.
+            request.passthrough = False
+        request.max_response_bytes = self._max_response_bytes_overrides.get(
+            plan.tool_name, self._max_response_bytes
+        )
+        request.timeouts = plan.timeouts
+        override = self._timeout_overrides.get(plan.tool_name)
+        if override is not None:
+            request.timeouts = override if plan.timeouts is None else plan.timeouts.merged(override)
+        deadline = current_deadline()
+        if request.timeouts is not None and request.timeouts.total is not None:
+            own_deadline = monotonic() + request.timeouts.total
+            deadline = own_deadline if deadline is None else min(deadline, own_deadline)
+        request.deadline = deadline
+        if deadline is None:
+            result = await self._dispatch(plan, request)
+        else:
+            remaining = deadline - monotonic()
+            try:
+                if remaining <= 0:
+                    raise TimeoutError
+                async with asyncio.timeout(remaining):
+                    result = await self._dispatch(plan, request)
+            except TimeoutError as exc:
+                if self._metrics is not None:
+                    self._metrics.on_deadline_exceeded()
+                raise DeadlineExceededError(
+                    f"Deadline exceeded for {request.method} {request.url}."
+                ) from exc
+        if projection is None or result.get("truncated"):
+            return result
+        # Results may be shared through the cache or coalescing; project into a copy.
+        return {**result, "body": projection.apply(result["body"])}
+
+    async def _dispatch(self, plan: InvocationPlan, request: _OutboundRequest) -> Dict[str, Any]:
+        if plan.pagination is not None:
+            return await self._paginate(plan.pagination, request)
+        cacheable = self._response_cache is not None and plan.cacheable
+        coalesce = self._singleflight is not None and plan.method in _SAFE_METHODS
+        if not cacheable and not coalesce:
+            return await self._fetch(request, None)
 
-        if not method or not path:
-            raise InvocationError("Invalid binding: missing method or path.")
+        key = ResponseCache.key_for(
+            request.operation,
+            request.method,
+            request.url,
+            request.query_params,
+            request.headers,
+            request.json_body,
+        )
+        cache_key = key if cacheable else None
+        if coalesce and self._singleflight is not None:
+            # The shared call runs under the leader's deadline and forwards it upstream, and
+            # its result shape follows the leader's passthrough, which projection turns off.
+            flight_key = (key, request.passthrough, _deadline_bucket(request.deadline))
+            return await self._singleflight.do(
+                flight_key, lambda: self._fetch(request, cache_key)
+            )
+        return await self._fetch(request, cache_key)
 
-        url_path = _render_path(path, binding.get("path_params", []), payload)
-        url = _build_url(server_url, url_path)
+    async def _fetch(
+        self, request: _OutboundRequest, cache_key: Hashable | None
+    ) -> Dict[str, Any]:
+        cache = self._response_cache if cache_key is not None else None
+        cached = None
+        if cache is not None:
+            cached = cache.lookup(cache_key)
+            if cached is not None and cache.is_fresh(cached):
+                self._on_cache_lookup("hit")
+                return self._normalize_response(cached.response, request.passthrough)
+            if cached is not None and request.method in _SAFE_METHODS:
+                # Conditional headers only revalidate safe reads; on a PUT or POST
+                # they would turn into preconditions on the write.
+                request.headers.update(cached.validators())
 
-        query_params = {
-            name: payload[name]
-            for name in binding.get("query_params", [])
-            if name in payload and payload[name] is not None
-        }
-        headers = {
-            name: str(payload[name])
-            for name in binding.get("header_params", [])
-            if name in payload and payload[name] is not None
+        response = await self._send_with_retries(request)
+
+        if cache is not None:
+            if cached is not None and response.status_code == 304:
+                cache.refresh(cache_key, cached, response)
+                self._on_cache_lookup("revalidated")
+                return self._normalize_response(cached.response, request.passthrough)
+            self._on_cache_lookup("miss")
+            if not response.extensions.get(_TRUNCATED):
+                cache.store(cache_key, response)
+
+        return self._normalize_response(response, request.passthrough)
+
+    async def _paginate(
+        self, pagination: Pagination, request: _OutboundRequest
+    ) -> Dict[str, Any]:
+        """Follow pages into one result; pages bypass the response cache and coalescing."""
+
+        async def fetch(url: Optional[str], params: Mapping[str, Any]) -> httpx.Response:
+            if url is None:
+                page = replace(request, query_params=dict(params))
+            else:
+                page = replace(request, url=url, query_params={}, base_urls=())
+            return await self._send_with_retries(page)
+
+        collected = await self._paginator.collect(pagination, request.query_params, fetch)
+        if collected.summary is None:
+            return self._normalize_response(collected.first, request.passthrough)
+        return {
+            "status_code": collected.first.status_code,
+            "headers": self._response_headers(collected.first),
+            "body": collected.body,
+            "pagination": collected.summary,
         }
-        json_body = payload.get("body")
 
+    async def _send_with_retries(self, request: _OutboundRequest) -> httpx.Response:
+        policy = self._retry_policy
+        if policy is None or policy.max_attempts <= 1 or not request.idempotent:
+            return await self._attempt(request)
+
+        budget = self._retry_budgets.get(request.origin)
+        if budget is None:
+            budget = self._retry_budgets[request.origin] = policy.new_budget()
+        budget.on_request()
+        attempt = 1
+        while True:
+            try:
+                response = await self._attempt(request)
+            except InvocationError as exc:
+                if attempt >= policy.max_attempts or not isinstance(
+                    exc.__cause__, httpx.TransportError
+                ):
+                    raise
+                reason = "transport"
+                delay = policy.backoff_seconds(attempt)
+                failure: InvocationError | None = exc
+            else:
+                if attempt >= policy.max_attempts or (
+                    response.status_code not in policy.retry_statuses
+                ):
+                    return response
+                reason = str(response.status_code)
+                retry_after = policy.retry_after_seconds(response.headers.get("retry-after"))
+                if retry_after is not None and retry_after > policy.max_delay_seconds:
+                    # The upstream asked for a longer pause than we are willing to hold the call.
+                    return response
+                delay = policy.backoff_seconds(attempt) if retry_after is None else retry_after
+                failure = None
+
+            if not budget.try_acquire():
+                if self._metrics is not None:
+                    self._metrics.on_retry_budget_exhausted(origin=request.origin)
+                if failure is not None:
+                    raise failure
+                return response
+            if self._metrics is not None:
+                self._metrics.on_retry(origin=request.origin, reason=reason)
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _attempt(self, request: _OutboundRequest) -> httpx.Response:
+        if self._auth is not None and request.security:
+            # Resolve credentials before breakers, balancers, and slots see the call, so an
+            # identity provider outage is not counted against the API and holds no capacity.
+            headers, params = await self._auth.apply(
+                request.security, request.headers, request.query_params
+            )
+            request = replace(request, headers=headers, query_params=params)
+        if self._hedger is None or request.method not in _SAFE_METHODS:
+            return await self._send(request)
+        dispatched = asyncio.Event()
+        hedged = replace(request, dispatched=dispatched)
+        return await self._hedger.run(
+            request.operation, lambda: self._send(hedged), dispatched=dispatched
+        )
+
+    async def _send(self, request: _OutboundRequest) -> httpx.Response:
+        balancer = self._balancer
+        if balancer is None or not request.base_urls:
+            return await self._send_guarded(request)
+        # Route each attempt separately so retries and hedges can land on another server.
+        remaining = list(request.base_urls)
+        while True:
+            base_url = balancer.choose(remaining, skip=lambda url: self._circuit_open(url, request))
+            routed = replace(
+                request,
+                url=base_url + request.url[len(request.base_urls[0]) :],
+                origin=_base_origin(base_url),
+            )
+            try:
+                return await self._send_routed(balancer, routed, base_url)
+            except CircuitOpenError:
+                # Servers with an open breaker fail fast, so try the others before giving up.
+                remaining.remove(base_url)
+                if not remaining:
+                    raise
+
+    def _circuit_open(self, base_url: str, request: _OutboundRequest) -> bool:
+        breakers = self._breakers
+        return breakers is not None and breakers.is_open(_base_origin(base_url), request.operation)
+
+    async def _send_routed(
+        self, balancer: LoadBalancer, request: _OutboundRequest, base_url: str
+    ) -> httpx.Response:
+        balancer.on_start(base_url)
+        started = perf_counter()
+        try:
+            response = await self._send_guarded(request)
+        except _LOCAL_REJECTIONS:
+            balancer.on_finish(base_url, None, failed=False)
+            raise
+        except InvocationError:
+            balancer.on_finish(base_url, perf_counter() - started, failed=True)
+            raise
+        except BaseException:
+            balancer.on_finish(base_url, None, failed=False)
+            raise
+        balancer.on_finish(
+            base_url, perf_counter() - started, failed=response.status_code >= 500
+        )
+        return response
+
+    async def _send_guarded(self, request: _OutboundRequest) -> httpx.Response:
+        breakers = self._breakers
+        if breakers is None:
+            await self._pace(request)
+            return await self._send_through_slots(request)
+        # Check the breaker first so calls to an open circuit neither wait nor spend tokens.
+        breakers.acquire(request.origin, request.operation)
+        try:
+            await self._pace(request)
+            response = await self._send_through_slots(request)
+        except _LOCAL_REJECTIONS:
+            breakers.release(request.origin, request.operation)
+            raise
+        except InvocationError:
+            breakers.record(request.origin, request.operation, failed=True)
+            raise
+        except BaseException:
+            breakers.release(request.origin, request.operation)
+            raise
+        breakers.record(request.origin, request.operation, failed=response.status_code >= 500)
+        return response
+
+    async def _pace(self, request: _OutboundRequest) -> None:
+        if self._pacer is not None:
+            # Wait for pacing before taking any slot so queued calls do not hold capacity.
+            await self._pacer.acquire(request.origin)
+
+    async def _send_through_slots(self, request: _OutboundRequest) -> httpx.Response:
+        method = request.method
+        url = request.url
+        content = None
+        if request.json_body is not None:
+            content = self._codec.dumps(request.json_body)
+            if not any(name.lower() == "content-type" for name in request.headers):
+                request.headers["Content-Type"] = "application/json"
+        headers: Dict[str, str] = request.headers
+        params: Dict[str, Any] = request.query_params
         wait_started = perf_counter()
-        async with self._semaphore:
+        async with self._slots(request) as outcome:
             wait_seconds = perf_counter() - wait_started
+            if request.dispatched is not None:
+                request.dispatched.set()
             if self._metrics is not None:
                 self._metrics.on_invocation_started(wait_seconds=wait_seconds)
+            # Time spent queueing counts against the deadline, so read it after the slot.
+            timeout = self._attempt_timeout(request)
+            if request.deadline is not None and self._deadline_header:
+                remaining = max(request.deadline - monotonic(), 0.0)
+                headers = {**headers, self._deadline_header: f"{remaining:.3f}"}
+            started = perf_counter()
             try:
-                async with self._make_client() as client:
-                    response = await client.request(
-                        method=method,
-                        url=url,
-                        params=query_params,
-                        headers=headers,
-                        json=json_body,
-                    )
+                async with self._pool.lease(request.origin) as client:
+                    if request.max_response_bytes > 0:
+                        response = await _read_capped(
+                            client,
+                            client.build_request(
+                                method=method,
+                                url=url,
+                                params=params,
+                                headers=headers,
+                                content=content,
+                                timeout=timeout,
+                            ),
+                            request.max_response_bytes,
+                        )
+                    else:
+                        response = await client.request(
+                            method=method,
+                            url=url,
+                            params=params,
+                            headers=headers,
+                            content=content,
+                            timeout=timeout,
+                        )
             except httpx.HTTPError as exc:
                 if self._metrics is not None:
                     self._metrics.on_invocation_error()
+                if self._adaptive_timeouts is not None and isinstance(
+                    exc, httpx.TimeoutException
+                ):
+                    self._adaptive_timeouts.record_timeout(
+                        request.operation, perf_counter() - started
+                    )
                 raise InvocationError(f"HTTP invocation failed for {method} {url}.") from exc
             finally:
+                outcome.latency_seconds = perf_counter() - started
                 if self._metrics is not None:
                     self._metrics.on_invocation_finished()
+            outcome.failed = _is_congestion_status(response.status_code)
+        if self._pacer is not None:
+            self._pacer.observe(request.origin, response)
+        if self._auth is not None and request.security and response.status_code == 401:
+            self._auth.on_unauthorized(request.security)
+        if self._latencies is not None and outcome.latency_seconds is not None:
+            self._latencies.record(request.operation, outcome.latency_seconds)
+        if (
+            self._adaptive_timeouts is not None
+            and outcome.latency_seconds is not None
+            and not outcome.failed
+        ):
+            self._adaptive_timeouts.record(request.operation, outcome.latency_seconds)
+        if self._metrics is not None:
+            self._metrics.on_response_received(
+                size_bytes=len(response.content),
+                truncated=bool(response.extensions.get(_TRUNCATED)),
+            )
+        return response
+
+    @asynccontextmanager
+    async def _slots(self, request: _OutboundRequest) -> AsyncIterator[SlotOutcome]:
+        """Hold bulkhead and global slots; admission control may shed before the global queue."""
+        async with (
+            self._bulkheads.slot(request.origin, request.operation) as outcome,
+            self._admitted_global_slot(request, outcome),
+        ):
+            yield outcome
 
-        body: Any
+    @asynccontextmanager
+    async def _admitted_global_slot(
+        self, request: _OutboundRequest, outcome: SlotOutcome
+    ) -> AsyncIterator[None]:
+        # Only calls queued for the global limit count, matching the wait estimate, so a
+        # saturated bulkhead cannot shed calls to other origins.
+        admission = self._admission
+        if admission is None:
+            async with self._global_slot(request):
+                yield
+            return
         try:
-            body = response.json()
-        except ValueError:
-            body = response.text
+            admission.enter()
+        except OverloadedError:
+            # A shed call never reached the upstream, so it says nothing about its health.
+            outcome.cancelled = True
+            raise
+        queued = True
+        try:
+            async with self._global_slot(request):
+                admission.leave()
+                queued = False
+                try:
+                    yield
+                finally:
+                    if outcome.latency_seconds is not None:
+                        admission.on_completed(outcome.latency_seconds)
+        finally:
+            if queued:
+                admission.leave()
+
+    def _attempt_timeout(self, request: _OutboundRequest) -> Any:
+        """Per-attempt httpx timeouts, capped by whatever is left of the deadline.
+
+        Declared timeouts win; a learned timeout replaces the static default.
+        """
+        timeouts = request.timeouts
+        learned = None
+        if self._adaptive_timeouts is not None:
+            learned = self._adaptive_timeouts.timeout_for(request.operation)
+        if timeouts is None and request.deadline is None and learned is None:
+            return httpx.USE_CLIENT_DEFAULT
+        default = self._timeout_seconds if learned is None else learned
+        cap = None if request.deadline is None else max(request.deadline - monotonic(), 0.0)
+
+        def bounded(seconds: float | None) -> float:
+            value = default if seconds is None else seconds
+            return value if cap is None else min(value, cap)
+
+        return httpx.Timeout(
+            bounded(None),
+            connect=bounded(timeouts.connect if timeouts is not None else None),
+            read=bounded(timeouts.read if timeouts is not None else None),
+        )
+
+    def _global_slot(self, request: _OutboundRequest) -> AsyncContextManager[Any]:
+        if self._scheduler is None:
+            return self._semaphore
+        return self._scheduler.slot(current_session_id(), request.operation, request.tags)
+
+    def _response_headers(self, response: httpx.Response) -> Dict[str, str]:
+        if self._header_allowlist:
+            return {
+                name: response.headers[name]
+                for name in self._header_allowlist
+                if name in response.headers
+            }
+        return dict(response.headers)
+
+    def _normalize_response(self, response: httpx.Response, passthrough: bool) -> Dict[str, Any]:
+        headers = self._response_headers(response)
+        truncated = bool(response.extensions.get(_TRUNCATED))
+        result: Dict[str, Any]
+        if passthrough:
+            # Forward the upstream text as-is instead of building an object tree.
+            result = {
+                "status_code": response.status_code,
+                "headers": headers,
+                "body": response.text,
+                "passthrough": True,
+            }
+        else:
+            body: Any
+            try:
+                body = response.text if truncated else self._codec.loads(response.content)
+            except ValueError:
+                body = response.text
+            result = {
+                "status_code": response.status_code,
+                "headers": headers,
+                "body": body,
+            }
+        if truncated:
+            result["truncated"] = True
+            result["max_response_bytes"] = response.extensions[_TRUNCATED]
+        return result
+
+    def _on_cache_lookup(self, result: str) -> None:
+        if self._metrics is not None:
+            self._metrics.on_response_cache_lookup(result)
 
-        return {
-            "status_code": response.status_code,
-            "headers": dict(response.headers),
-            "body": body,
-        }
 
-    def _make_client(self) -> httpx.AsyncClient:
-        if self._client_factory is not None:
-            return self._client_factory()
-        return httpx.AsyncClient(timeout=self._timeout_seconds, limits=self._limits)
+async def _read_capped(
+    client: httpx.AsyncClient, request: httpx.Request, max_bytes: int
+) -> httpx.Response:
+    """Stream a response body and stop reading once it exceeds `max_bytes`.
 
+    The cap applies to decoded bytes, so compressed bodies cannot expand past it.
+    Aborting the stream closes the connection instead of draining the rest.
+    """
+    upstream = await client.send(request, stream=True)
+    chunks: list[bytes] = []
+    size = 0
+    truncated = False
+    try:
+        async for chunk in upstream.aiter_bytes():
+            remaining = max_bytes - size
+            if len(chunk) > remaining:
+                chunks.append(chunk[:remaining])
+                truncated = True
+                break
+            chunks.append(chunk)
+            size += len(chunk)
+    finally:
+        await upstream.aclose()
 
-def _build_url(server_url: str, path: str) -> str:
-    if path.startswith("http://") or path.startswith("https://"):
-        return path
-    if not server_url:
+    extensions = dict(upstream.extensions)
+    if truncated:
+        extensions[_TRUNCATED] = max_bytes
+    return httpx.Response(
+        upstream.status_code,
+        headers=[
+            (name, value)
+            for name, value in upstream.headers.multi_items()
+            if name not in _BODY_FRAMING_HEADERS
+        ],
+        content=b"".join(chunks),
+        request=request,
+        extensions=extensions,
+    )
+
+
+def _is_congestion_status(status_code: int) -> bool:
+    return status_code == 429 or status_code >= 500
+
+
+def _compile_binding(binding: Dict[str, Any]) -> InvocationPlan:
+    if not binding.get("method") or not binding.get("path"):
+        raise InvocationError("Invalid binding: missing method or path.")
+    return InvocationPlan.from_binding(binding)
+
+
+def _requested_projection(plan: InvocationPlan, payload: Dict[str, Any]) -> Projection | None:
+    fields = payload.get(plan.projection_argument) if plan.projection_argument else None
+    if not fields:
+        return None
+    if isinstance(fields, str):
+        fields = [fields]
+    if not isinstance(fields, list):
+        raise InvocationError(f"{plan.projection_argument} must be a list of field paths.")
+    return Projection.from_paths(fields)
+
+
+def _build_request(plan: InvocationPlan, payload: Dict[str, Any]) -> _OutboundRequest:
+    path = _render_path(plan, payload)
+    base_url = plan.base_url
+    base_urls = plan.base_urls
+    if plan.server_arguments and any(
+        payload.get(argument) is not None for argument, _ in plan.server_arguments
+    ):
+        base_url = _select_server(plan, payload)
+        base_urls = ()
+    if base_url is None:
         raise InvocationError("No server_url available for relative path invocation.")
-    return f"{server_url.rstrip('/')}{path}"
+    url = base_url + path
+    return _OutboundRequest(
+        method=plan.method,
+        url=url,
+        origin=origin_of(url) if plan.absolute_path else _base_origin(base_url),
+        operation=plan.tool_name,
+        idempotent=plan.idempotent,
+        base_urls=base_urls,
+        tags=plan.tags,
+        security=plan.security,
+        query_params={
+            name: payload[name]
+            for name in plan.query_params
+            if name in payload and payload[name] is not None
+        },
+        headers={
+            name: str(payload[name])
+            for name in plan.header_params
+            if name in payload and payload[name] is not None
+        },
+        json_body=payload.get("body"),
+    )
+
+
+def _select_server(plan: InvocationPlan, payload: Dict[str, Any]) -> str:
+    selection = tuple(
+        default if payload.get(argument) is None else str(payload[argument])
+        for argument, default in plan.server_arguments
+    )
+    base_url = plan.server_variants.get(selection)
+    if base_url is None:
+        arguments = ", ".join(argument for argument, _ in plan.server_arguments)
+        raise InvocationError(f"Unsupported server variable value for: {arguments}")
+    return base_url
+
+
+def _deadline_bucket(deadline: Optional[float]) -> Optional[int]:
+    return None if deadline is None else math.floor(deadline / _DEADLINE_BUCKET_SECONDS)
+
+
+@lru_cache(maxsize=1024)
+def _base_origin(base_url: str) -> str:
+    # Rendered path segments are percent-encoded, so they cannot change the origin.
+    return origin_of(base_url)
 
 
-def _render_path(path: str, path_params: list[str], payload: Dict[str, Any]) -> str:
-    rendered = path
-    for key in path_params:
+def _render_path(plan: InvocationPlan, payload: Dict[str, Any]) -> str:
+    for key in plan.path_params:
         if key not in payload:
             raise InvocationError(f"Missing required path parameter: {key}")
-        rendered = rendered.replace(f"{{{key}}}", quote(str(payload[key]), safe=""))
-    return rendered
+    literals = plan.path_literals
+    if not plan.path_placeholders:
+        return literals[0]
+    parts = [literals[0]]
+    for index, key in enumerate(plan.path_placeholders, start=1):
+        parts.append(quote(str(payload[key]), safe=""))
+        parts.append(literals[index])
+    return "".join(parts)
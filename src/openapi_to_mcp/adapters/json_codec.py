@@ -0,0 +1,77 @@
+"""JSON codecs for upstream bodies and fallback MCP responses."""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+from typing import Any, Protocol
+
+from openapi_to_mcp.errors import ConfigurationError
+
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - environment dependent
+    orjson = None  # type: ignore
+
+
+class JsonCodec(Protocol):
+    """Encode Python objects to UTF-8 JSON bytes and decode them back."""
+
+    name: str
+
+    def dumps(self, value: Any) -> bytes:
+        """Serialize a value to compact UTF-8 JSON."""
+
+    def loads(self, data: bytes | str) -> Any:
+        """Parse JSON text; raise ValueError when it is not valid JSON."""
+
+
+class StdlibJsonCodec:
+    """Codec backed by the standard library `json` module."""
+
+    name = "stdlib"
+
+    def dumps(self, value: Any) -> bytes:
+        return json.dumps(
+            value, ensure_ascii=False, separators=(",", ":"), default=_encode_default
+        ).encode("utf-8")
+
+    def loads(self, data: bytes | str) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec:
+    """Codec backed by `orjson`, falling back to stdlib for values it rejects."""
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        if orjson is None:
+            raise ConfigurationError("JSON_CODEC=orjson requires the 'orjson' package.")
+        self._fallback = StdlibJsonCodec()
+
+    def dumps(self, value: Any) -> bytes:
+        try:
+            return orjson.dumps(value)
+        except TypeError:
+            # orjson rejects integers above 64 bits and non-string keys.
+            return self._fallback.dumps(value)
+
+    def loads(self, data: bytes | str) -> Any:
+        return orjson.loads(data)
+
+
+def _encode_default(value: Any) -> Any:
+    # Match orjson, which serializes dataclass instances natively.
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.asdict(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def build_json_codec(name: str = "auto") -> JsonCodec:
+    """Return the named codec; `auto` prefers orjson when it is installed."""
+    if name == "stdlib" or (name == "auto" and orjson is None):
+        return StdlibJsonCodec()
+    if name in {"auto", "orjson"}:
+        return OrjsonCodec()
+    raise ConfigurationError("JSON_CODEC must be one of: auto, orjson, stdlib.")
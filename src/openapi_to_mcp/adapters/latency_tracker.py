@@ -0,0 +1,30 @@
+"""Rolling per-key latency samples for percentile-derived delays."""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import Deque, Dict
+
+
+class LatencyTracker:
+    """Keep the most recent latencies per key and answer percentile queries."""
+
+    def __init__(self, window_size: int = 200, min_samples: int = 20) -> None:
+        self._window_size = window_size
+        self._min_samples = min_samples
+        self._samples: Dict[str, Deque[float]] = {}
+
+    def record(self, key: str, latency_seconds: float) -> None:
+        samples = self._samples.get(key)
+        if samples is None:
+            samples = self._samples[key] = deque(maxlen=self._window_size)
+        samples.append(latency_seconds)
+
+    def percentile(self, key: str, quantile: float) -> float | None:
+        """Return the nearest-rank quantile, or None until `min_samples` are recorded."""
+        samples = self._samples.get(key)
+        if samples is None or len(samples) < self._min_samples:
+            return None
+        ordered = sorted(samples)
+        index = min(len(ordered) - 1, max(0, int(quantile * len(ordered) + 0.5) - 1))
+        return ordered[index]
@@ -0,0 +1,101 @@
+"""Client-side load balancing across the servers declared for an operation."""
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass
+from time import monotonic
+from typing import Callable, Dict, Sequence
+
+from openapi_to_mcp.adapters.upstream_pool import origin_of
+from openapi_to_mcp.metrics import RuntimeMetrics
+
+# Cost floor so in-flight calls still count before an endpoint has latency samples.
+_MIN_LATENCY_SECONDS = 0.001
+
+
+@dataclass(frozen=True)
+class LoadBalancerPolicy:
+    """Latency smoothing and passive health ejection settings."""
+
+    ewma_weight: float = 0.3
+    eject_consecutive_failures: int = 5
+    eject_seconds: float = 30.0
+
+
+@dataclass
+class _Endpoint:
+    ewma_seconds: float = 0.0
+    in_flight: int = 0
+    consecutive_failures: int = 0
+    ejected_until: float = 0.0
+
+
+class LoadBalancer:
+    """Power-of-two-choices over EWMA latency weighted by in-flight calls.
+
+    An endpoint is ejected for `eject_seconds` after `eject_consecutive_failures`
+    failures in a row and re-admitted once that period ends. When every
+    candidate is ejected the balancer fails open and picks among all of them.
+    """
+
+    def __init__(
+        self,
+        policy: LoadBalancerPolicy,
+        metrics: RuntimeMetrics | None = None,
+        clock: Callable[[], float] = monotonic,
+        rng: random.Random | None = None,
+    ) -> None:
+        self._policy = policy
+        self._metrics = metrics
+        self._clock = clock
+        self._rng = rng or random.Random()
+        self._endpoints: Dict[str, _Endpoint] = {}
+
+    def choose(self, base_urls: Sequence[str], skip: Callable[[str], bool] | None = None) -> str:
+        """Pick a server; skipped and ejected servers are used only when no other is left."""
+        now = self._clock()
+        usable = [url for url in base_urls if skip is None or not skip(url)] or list(base_urls)
+        healthy = [url for url in usable if self._endpoint(url).ejected_until <= now]
+        candidates = healthy or usable
+        if len(candidates) == 1:
+            return candidates[0]
+        first, second = self._rng.sample(candidates, 2)
+        return first if self._cost(first) <= self._cost(second) else second
+
+    def on_start(self, base_url: str) -> None:
+        self._endpoint(base_url).in_flight += 1
+
+    def on_finish(self, base_url: str, latency_seconds: float | None, failed: bool) -> None:
+        """Record a finished call; pass None latency for calls that were cancelled."""
+        endpoint = self._endpoint(base_url)
+        endpoint.in_flight -= 1
+        if latency_seconds is None:
+            return
+        if endpoint.ewma_seconds == 0.0:
+            endpoint.ewma_seconds = latency_seconds
+        else:
+            endpoint.ewma_seconds += (latency_seconds - endpoint.ewma_seconds) * (
+                self._policy.ewma_weight
+            )
+        if not failed:
+            endpoint.consecutive_failures = 0
+            return
+        endpoint.consecutive_failures += 1
+        if endpoint.consecutive_failures >= self._policy.eject_consecutive_failures:
+            endpoint.consecutive_failures = 0
+            # Re-admitted servers start without latency history so they get probe traffic.
+            endpoint.ewma_seconds = 0.0
+            endpoint.ejected_until = self._clock() + self._policy.eject_seconds
+            if self._metrics is not None:
+                self._metrics.on_endpoint_ejected(origin=origin_of(base_url))
+
+    def _cost(self, base_url: str) -> float:
+        endpoint = self._endpoint(base_url)
+        return max(endpoint.ewma_seconds, _MIN_LATENCY_SECONDS) * (endpoint.in_flight + 1)
+
+    def _endpoint(self, base_url: str) -> _Endpoint:
+        endpoint = self._endpoints.get(base_url)
+        if endpoint is None:
+            endpoint = self._endpoints[base_url] = _Endpoint()
+        return endpoint
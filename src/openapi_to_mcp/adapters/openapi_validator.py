@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import re
 from copy import deepcopy
 from typing import Any, Dict, List
 
@@ -18,6 +19,7 @@ _ALLOWED_HTTP_METHODS = {
     "head",
     "trace",
 }
+_SERVER_VARIABLE = re.compile(r"\{([^{}]+)\}")
 
 
 class OpenApiValidatorAdapter:
@@ -38,14 +40,16 @@ class OpenApiValidatorAdapter:
         if not isinstance(paths, dict) or not paths:
             raise OpenApiValidationError("Missing or invalid 'paths' section.")
 
-        root_server_url = _extract_first_server_url(spec.get("servers"))
+        has_root_server = _has_server_url(spec.get("servers"))
+        warnings.extend(_server_variable_warnings(spec.get("servers")))
         for path, path_item in paths.items():
             if not isinstance(path, str) or not path.startswith("/"):
                 raise OpenApiValidationError("Each path key must be a string starting with '/'.")
             if not isinstance(path_item, dict):
                 raise OpenApiValidationError(f"Path item must be an object for '{path}'.")
 
-            path_server_url = _extract_first_server_url(path_item.get("servers"))
+            has_path_server = _has_server_url(path_item.get("servers"))
+            warnings.extend(_server_variable_warnings(path_item.get("servers")))
             for method, operation in path_item.items():
                 if method not in _ALLOWED_HTTP_METHODS:
                     # Non-method keys such as parameters are allowed at path-item level.
@@ -56,9 +60,10 @@ class OpenApiValidatorAdapter:
                     )
                 if not operation.get("operationId"):
                     warnings.append(f"Missing operationId for {method.upper()} {path}.")
-                operation_server_url = _extract_first_server_url(operation.get("servers"))
-                resolved_server_url = operation_server_url or path_server_url or root_server_url
-                if not resolved_server_url:
+                warnings.extend(_server_variable_warnings(operation.get("servers")))
+                if not (
+                    _has_server_url(operation.get("servers")) or has_path_server or has_root_server
+                ):
                     raise OpenApiValidationError(
                         f"Missing server URL for operation '{method.upper()} {path}'. "
                         "Define servers at operation, path, or root level."
@@ -67,13 +72,30 @@ class OpenApiValidatorAdapter:
         return OpenApiValidationResult(spec=spec, warnings=warnings)
 
 
-def _extract_first_server_url(servers: Any) -> str | None:
-    if not isinstance(servers, list) or not servers:
-        return None
-    first = servers[0]
-    if not isinstance(first, dict):
-        return None
-    url = first.get("url")
-    if isinstance(url, str) and url.strip():
-        return url.strip()
-    return None
+def _has_server_url(servers: Any) -> bool:
+    if not isinstance(servers, list):
+        return False
+    return any(
+        isinstance(server, dict)
+        and isinstance(server.get("url"), str)
+        and bool(server["url"].strip())
+        for server in servers
+    )
+
+
+def _server_variable_warnings(servers: Any) -> List[str]:
+    if not isinstance(servers, list):
+        return []
+    warnings: List[str] = []
+    for server in servers:
+        if not isinstance(server, dict) or not isinstance(server.get("url"), str):
+            continue
+        variables = server.get("variables")
+        variables = variables if isinstance(variables, dict) else {}
+        for name in _SERVER_VARIABLE.findall(server["url"]):
+            variable = variables.get(name)
+            if not isinstance(variable, dict) or "default" not in variable:
+                warnings.append(
+                    f"Server URL '{server['url']}' uses variable '{name}' without a default."
+                )
+    return warnings
@@ -0,0 +1,265 @@
+"""Following paginated list operations and merging their pages into one result."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Mapping, Optional
+from urllib.parse import urljoin
+
+import httpx
+
+from openapi_to_mcp.adapters.json_codec import JsonCodec, build_json_codec
+from openapi_to_mcp.adapters.upstream_pool import origin_of
+from openapi_to_mcp.domain.models import Pagination
+from openapi_to_mcp.errors import InvocationError
+from openapi_to_mcp.metrics import RuntimeMetrics
+
+# Sends one page: an absolute URL to follow (None keeps the tool URL) and query parameters.
+FetchPage = Callable[[Optional[str], Mapping[str, Any]], Awaitable[httpx.Response]]
+
+
+@dataclass
+class CollectedPages:
+    """The first page response and, when it could be paginated, the merged body.
+
+    `summary` is None when the first page was not a successful JSON page with
+    an item array; callers then return the first page as a normal result.
+    """
+
+    first: httpx.Response
+    body: Any = None
+    summary: Optional[Dict[str, Any]] = None
+
+
+@dataclass
+class _Aggregate:
+    max_items: int
+    max_bytes: int
+    items: List[Any] = field(default_factory=list)
+    size: int = 0
+    pages: int = 0
+
+    @property
+    def full(self) -> bool:
+        return len(self.items) >= self.max_items
+
+    def add(self, page_items: List[Any], size: int) -> Optional[int]:
+        """Append a page's items; None when the byte limit excludes the page."""
+        if self.pages and self.max_bytes > 0 and self.size + size > self.max_bytes:
+            return None
+        self.size += size
+        self.pages += 1
+        added = page_items[: max(self.max_items - len(self.items), 0)]
+        self.items.extend(added)
+        return len(added)
+
+
+class Paginator:
+    """Fetch the pages of a list operation and merge their items into one body.
+
+    Items are appended as each page arrives and fetching stops at the page,
+    item, or byte limit; the summary then carries the continuation for the
+    next unfetched page when one is known. Cursor and link pages depend on
+    the page before them and are fetched in order. Offset pages are fetched
+    `concurrency` at a time, so up to `concurrency - 1` requests past the
+    last page may be wasted. Links to another origin are not followed.
+    """
+
+    def __init__(
+        self,
+        max_pages: int = 10,
+        max_items: int = 1000,
+        max_bytes: int = 0,
+        concurrency: int = 4,
+        codec: JsonCodec | None = None,
+        metrics: RuntimeMetrics | None = None,
+    ) -> None:
+        self._max_pages = max_pages
+        self._max_items = max_items
+        self._max_bytes = max_bytes
+        self._concurrency = max(concurrency, 1)
+        self._codec = codec or build_json_codec()
+        self._metrics = metrics
+
+    async def collect(
+        self, pagination: Pagination, params: Mapping[str, Any], fetch: FetchPage
+    ) -> CollectedPages:
+        params = dict(params)
+        page_size = 0
+        if pagination.style == "offset":
+            page_size = _as_count(params.get(pagination.limit_param)) or pagination.page_size
+            if page_size:
+                params[pagination.limit_param] = page_size
+        first = await fetch(None, params)
+        body = self._page_body(first)
+        first_items = _items_at(body, pagination.items)
+        if first_items is None:
+            return CollectedPages(first=first)
+
+        aggregate = _Aggregate(
+            max_items=pagination.max_items or self._max_items,
+            max_bytes=pagination.max_bytes or self._max_bytes,
+        )
+        added = aggregate.add(first_items, len(first.content)) or 0
+        max_pages = pagination.max_pages or self._max_pages
+        complete: bool
+        continuation: Any = None
+        if pagination.style == "offset":
+            start = _as_count(params.get(pagination.offset_param))
+            page_size = page_size or len(first_items)
+            if added < len(first_items):
+                complete, continuation = False, start + added
+            elif not first_items or len(first_items) < page_size:
+                complete = True
+            else:
+                complete, continuation = await self._follow_offsets(
+                    pagination, params, fetch, aggregate, max_pages, page_size, start + added
+                )
+        elif added < len(first_items):
+            complete = False
+        else:
+            complete, continuation = await self._follow_tokens(
+                pagination,
+                params,
+                fetch,
+                aggregate,
+                max_pages,
+                self._next_token(pagination, first, body),
+                origin_of(str(first.url)),
+            )
+
+        summary = {
+            "style": pagination.style,
+            "pages": aggregate.pages,
+            "items": len(aggregate.items),
+            "complete": complete,
+            "next": continuation,
+        }
+        if self._metrics is not None:
+            self._metrics.on_pagination_completed(
+                style=pagination.style, pages=aggregate.pages, complete=complete
+            )
+        return CollectedPages(
+            first=first, body=_with_items(body, pagination.items, aggregate.items), summary=summary
+        )
+
+    async def _follow_tokens(
+        self,
+        pagination: Pagination,
+        params: Dict[str, Any],
+        fetch: FetchPage,
+        aggregate: _Aggregate,
+        max_pages: int,
+        token: Any,
+        origin: str,
+    ) -> tuple[bool, Any]:
+        """Walk cursor or link pages one at a time; returns (complete, continuation)."""
+        while token is not None:
+            if aggregate.pages >= max_pages or aggregate.full:
+                return False, token
+            if pagination.style == "link" and origin_of(token) != origin:
+                return False, token
+            try:
+                if pagination.style == "link":
+                    response = await fetch(token, {})
+                else:
+                    response = await fetch(None, {**params, pagination.cursor_param: token})
+            except InvocationError:
+                return False, token
+            body = self._page_body(response)
+            page_items = _items_at(body, pagination.items)
+            if page_items is None:
+                return False, token
+            added = aggregate.add(page_items, len(response.content))
+            if added is None:
+                return False, token
+            if added < len(page_items):
+                return False, None
+            token = self._next_token(pagination, response, body)
+        return True, None
+
+    async def _follow_offsets(
+        self,
+        pagination: Pagination,
+        params: Dict[str, Any],
+        fetch: FetchPage,
+        aggregate: _Aggregate,
+        max_pages: int,
+        page_size: int,
+        offset: int,
+    ) -> tuple[bool, Any]:
+        """Fetch offset pages in concurrent windows; returns (complete, continuation)."""
+        while True:
+            if aggregate.pages >= max_pages or aggregate.full:
+                return False, offset
+            window = min(self._concurrency, max_pages - aggregate.pages)
+            offsets = [offset + index * page_size for index in range(window)]
+            responses = await asyncio.gather(
+                *(fetch(None, {**params, pagination.offset_param: value}) for value in offsets),
+                return_exceptions=True,
+            )
+            for value, response in zip(offsets, responses, strict=True):
+                if isinstance(response, InvocationError):
+                    return False, value
+                if isinstance(response, BaseException):
+                    raise response
+                page_items = _items_at(self._page_body(response), pagination.items)
+                if page_items is None:
+                    return False, value
+                added = aggregate.add(page_items, len(response.content))
+                if added is None:
+                    return False, value
+                if added < len(page_items):
+                    return False, value + added
+                if len(page_items) < page_size:
+                    return True, None
+                offset = value + added
+
+    def _page_body(self, response: httpx.Response) -> Any:
+        if not 200 <= response.status_code < 300:
+            return None
+        try:
+            return self._codec.loads(response.content)
+        except ValueError:
+            return None
+
+    @staticmethod
+    def _next_token(pagination: Pagination, response: httpx.Response, body: Any) -> Any:
+        if pagination.style == "link":
+            url = response.links.get("next", {}).get("url")
+            return urljoin(str(response.url), url) if url else None
+        token = _lookup(body, pagination.next_cursor)
+        return token if token not in (None, "", False) else None
+
+
+def _lookup(body: Any, path: str) -> Any:
+    for part in path.split(".") if path else ():
+        if not isinstance(body, dict):
+            return None
+        body = body.get(part)
+    return body
+
+
+def _items_at(body: Any, path: str) -> Optional[List[Any]]:
+    items = _lookup(body, path)
+    return items if isinstance(items, list) else None
+
+
+def _with_items(body: Any, path: str, items: List[Any]) -> Any:
+    if not path:
+        return items
+    *parents, leaf = path.split(".")
+    target = body
+    for part in parents:
+        target = target[part]
+    target[leaf] = items
+    return body
+
+
+def _as_count(value: Any) -> int:
+    try:
+        count = int(value)
+    except (TypeError, ValueError):
+        return 0
+    return max(count, 0)
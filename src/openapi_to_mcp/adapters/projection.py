@@ -0,0 +1,86 @@
+"""Response projection that keeps only the requested fields of a JSON body."""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from openapi_to_mcp.errors import InvocationError
+
+# Segment that maps the rest of a path over every element of an array.
+WILDCARD = "*"
+_MAX_CACHED_PROJECTIONS = 256
+
+# Nested selections: segment -> sub-selection, where None keeps the whole value.
+ProjectionTree = Dict[str, Optional["ProjectionTree"]]
+
+
+class Projection:
+    """A compiled set of field paths applied to decoded JSON bodies.
+
+    Paths are JSON pointers (`/items/0/name`) or dotted paths (`items.name`).
+    Arrays are traversed element-wise unless the segment is an index, and `*`
+    selects every element explicitly. Missing fields are left out rather than
+    reported, so one projection can serve heterogeneous items.
+    """
+
+    __slots__ = ("tree",)
+
+    def __init__(self, tree: ProjectionTree) -> None:
+        self.tree = tree
+
+    @classmethod
+    def from_paths(cls, paths: Iterable[str]) -> "Projection":
+        paths = tuple(paths)
+        for path in paths:
+            if not isinstance(path, str) or not path.strip("/."):
+                raise InvocationError(f"Invalid field path {path!r}; use '/a/b' or 'a.b'.")
+        return _compile(paths)
+
+    def apply(self, value: Any) -> Any:
+        if isinstance(value, (str, bytes)):
+            # A raw or non-JSON body has no fields; returning it would hide the request.
+            raise InvocationError("Field projection needs a JSON body; the response is not JSON.")
+        return _project(value, self.tree)
+
+
+@lru_cache(maxsize=_MAX_CACHED_PROJECTIONS)
+def _compile(paths: Tuple[str, ...]) -> Projection:
+    tree: ProjectionTree = {}
+    for path in paths:
+        segments = _segments(path)
+        node = tree
+        for segment in segments[:-1]:
+            child = node.get(segment, {})
+            if child is None:
+                # A shorter path already keeps this whole subtree.
+                break
+            node = node.setdefault(segment, child)  # type: ignore[assignment]
+        else:
+            node[segments[-1]] = None
+    return Projection(tree)
+
+
+def _segments(path: str) -> list[str]:
+    if path.startswith("/"):
+        return [part.replace("~1", "/").replace("~0", "~") for part in path[1:].split("/")]
+    return path.split(".")
+
+
+def _project(value: Any, tree: Optional[ProjectionTree]) -> Any:
+    if tree is None:
+        return value
+    if isinstance(value, dict):
+        return {
+            key: _project(value[key], subtree) for key, subtree in tree.items() if key in value
+        }
+    if isinstance(value, list):
+        if WILDCARD in tree:
+            return [_project(item, tree[WILDCARD]) for item in value]
+        indexes = [key for key in tree if key.isdigit()]
+        if indexes:
+            return [
+                _project(value[int(key)], tree[key]) for key in indexes if int(key) < len(value)
+            ]
+        return [_project(item, tree) for item in value]
+    return value
@@ -0,0 +1,153 @@
+"""Per-origin pacing that keeps calls under upstream rate limits."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from time import monotonic, time
+from typing import Awaitable, Callable, Dict, Mapping, Optional
+
+import httpx
+
+from openapi_to_mcp.adapters.retry import RetryPolicy
+from openapi_to_mcp.adapters.upstream_pool import origin_of
+from openapi_to_mcp.errors import RateLimitedError
+from openapi_to_mcp.metrics import RuntimeMetrics
+
+# Reset values above this are Unix timestamps rather than seconds to wait.
+_EPOCH_THRESHOLD = 1_000_000_000.0
+_THROTTLED_STATUSES = frozenset({429, 503})
+
+
+@dataclass
+class _Bucket:
+    """Token bucket; tokens may go negative to queue reservations in order."""
+
+    rate: float
+    burst: float
+    tokens: float
+    updated_at: float
+    paused_until: float = 0.0
+
+
+class RateLimitPacer:
+    """Delay calls locally instead of letting them run into upstream 429s.
+
+    Origins with a static rate start paced. Others are paced once they publish
+    `X-RateLimit-*` or `RateLimit-*` headers: the remaining quota is spread
+    evenly until the window resets. `Retry-After` on a 429 or 503 pauses the
+    origin, and an exhausted quota pauses it until the reset.
+    """
+
+    def __init__(
+        self,
+        static_rates: Optional[Mapping[str, float]] = None,
+        max_wait_seconds: float = 5.0,
+        metrics: RuntimeMetrics | None = None,
+        clock: Callable[[], float] = monotonic,
+        wall_clock: Callable[[], float] = time,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ) -> None:
+        self._static_rates = {
+            origin_of(origin): rate for origin, rate in (static_rates or {}).items()
+        }
+        self._max_wait_seconds = max_wait_seconds
+        self._metrics = metrics
+        self._clock = clock
+        self._wall_clock = wall_clock
+        self._sleep = sleep
+        self._buckets: Dict[str, _Bucket] = {}
+
+    async def acquire(self, origin: str) -> None:
+        """Reserve one call for an origin and wait until it may be sent."""
+        bucket = self._bucket(origin)
+        if bucket is None:
+            return
+        now = self._clock()
+        self._refill(bucket, now)
+        wait = max(bucket.paused_until - now, 0.0)
+        if bucket.tokens < 1.0:
+            wait = max(wait, (1.0 - bucket.tokens) / bucket.rate)
+        if wait > self._max_wait_seconds:
+            raise RateLimitedError(
+                f"Upstream rate limit for {origin} needs a {wait:.1f}s wait; "
+                f"limit is {self._max_wait_seconds:.1f}s.",
+                retry_after_seconds=wait,
+            )
+        bucket.tokens -= 1.0
+        if wait <= 0.0:
+            return
+        if self._metrics is not None:
+            self._metrics.on_rate_limit_wait(origin=origin, wait_seconds=wait)
+        try:
+            await self._sleep(wait)
+        except asyncio.CancelledError:
+            bucket.tokens += 1.0
+            raise
+
+    def observe(self, origin: str, response: httpx.Response) -> None:
+        """Learn pacing from rate-limit headers and throttling responses."""
+        headers = response.headers
+        now = self._clock()
+        if response.status_code in _THROTTLED_STATUSES:
+            retry_after = RetryPolicy.retry_after_seconds(headers.get("retry-after"))
+            if retry_after is not None:
+                bucket = self._learned_bucket(origin, now)
+                bucket.paused_until = max(bucket.paused_until, now + retry_after)
+
+        remaining = _header_float(headers, "remaining")
+        if remaining is None:
+            return
+        reset = self._reset_seconds(_header_float(headers, "reset"))
+        bucket = self._learned_bucket(origin, now)
+        self._refill(bucket, now)
+        if remaining < 1.0 and reset is not None:
+            bucket.paused_until = max(bucket.paused_until, now + reset)
+        if reset is not None and reset > 0.0 and remaining >= 1.0:
+            rate = remaining / reset
+            static = self._static_rates.get(origin)
+            bucket.rate = rate if static is None else min(rate, static)
+            bucket.burst = max(1.0, min(remaining, bucket.rate))
+        bucket.tokens = min(bucket.tokens, remaining, bucket.burst)
+
+    def _bucket(self, origin: str) -> _Bucket | None:
+        bucket = self._buckets.get(origin)
+        if bucket is None and origin in self._static_rates:
+            rate = self._static_rates[origin]
+            burst = max(1.0, rate)
+            bucket = _Bucket(rate=rate, burst=burst, tokens=burst, updated_at=self._clock())
+            self._buckets[origin] = bucket
+        return bucket
+
+    def _learned_bucket(self, origin: str, now: float) -> _Bucket:
+        bucket = self._bucket(origin)
+        if bucket is None:
+            # No pacing until headers give a rate; start with a generous bucket.
+            bucket = _Bucket(rate=1000.0, burst=1000.0, tokens=1000.0, updated_at=now)
+            self._buckets[origin] = bucket
+        return bucket
+
+    def _reset_seconds(self, reset: float | None) -> float | None:
+        if reset is None:
+            return None
+        if reset > _EPOCH_THRESHOLD:
+            return max(reset - self._wall_clock(), 0.0)
+        return reset
+
+    @staticmethod
+    def _refill(bucket: _Bucket, now: float) -> None:
+        elapsed = max(now - bucket.updated_at, 0.0)
+        bucket.tokens = min(bucket.burst, bucket.tokens + elapsed * bucket.rate)
+        bucket.updated_at = now
+
+
+def _header_float(headers: httpx.Headers, field: str) -> float | None:
+    for prefix in ("x-ratelimit-", "ratelimit-"):
+        value = headers.get(prefix + field)
+        if value is None:
+            continue
+        try:
+            return float(value.split(",")[0].split(";")[0].strip())
+        except ValueError:
+            return None
+    return None
@@ -0,0 +1,213 @@
+"""In-memory HTTP response cache with byte-bounded LRU eviction."""
+
+from __future__ import annotations
+
+import json
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from time import monotonic
+from typing import Any, Callable, Dict, Hashable, Mapping, Optional
+
+import httpx
+
+from openapi_to_mcp.metrics import RuntimeMetrics
+
+_CACHEABLE_STATUS_CODES = {200, 203, 204, 300, 301, 404, 405, 410, 414, 501}
+
+
+@dataclass
+class CachedResponse:
+    """A stored upstream response and its freshness deadline."""
+
+    response: httpx.Response
+    expires_at: float
+    size: int
+
+    def is_fresh(self, now: float) -> bool:
+        return now < self.expires_at
+
+    def validators(self) -> Dict[str, str]:
+        """Return conditional request headers for revalidation."""
+        headers: Dict[str, str] = {}
+        etag = self.response.headers.get("etag")
+        if etag:
+            headers["If-None-Match"] = etag
+        last_modified = self.response.headers.get("last-modified")
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        return headers
+
+
+class ResponseCache:
+    """Private HTTP cache honoring Cache-Control, Expires, and validators.
+
+    The bridge calls upstreams with its own configuration, so it behaves as a
+    private cache: `private` responses are stored and `s-maxage` is ignored.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int,
+        metrics: RuntimeMetrics | None = None,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        self._max_bytes = max_bytes
+        self._metrics = metrics
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, CachedResponse] = OrderedDict()
+        self._size_bytes = 0
+
+    @property
+    def size_bytes(self) -> int:
+        return self._size_bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def key_for(
+        operation: str,
+        method: str,
+        url: str,
+        query_params: Mapping[str, Any],
+        headers: Mapping[str, str],
+        body: Any = None,
+    ) -> Hashable:
+        request_url = httpx.URL(url, params=query_params)
+        return (
+            operation,
+            method,
+            str(request_url),
+            tuple(sorted((name.lower(), value) for name, value in headers.items())),
+            None if body is None else json.dumps(body, sort_keys=True, default=str),
+        )
+
+    def lookup(self, key: Hashable) -> CachedResponse | None:
+        """Return a stored entry, fresh or stale, and mark it recently used."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def is_fresh(self, entry: CachedResponse) -> bool:
+        return entry.is_fresh(self._clock())
+
+    def store(self, key: Hashable, response: httpx.Response) -> bool:
+        """Store a response when its status and headers allow it."""
+        lifetime = self._freshness_lifetime(response)
+        if lifetime is None:
+            self._remove(key)
+            return False
+        size = _response_size(response)
+        if size > self._max_bytes:
+            self._remove(key)
+            return False
+        self._remove(key)
+        self._entries[key] = CachedResponse(
+            response=response,
+            expires_at=self._clock() + lifetime,
+            size=size,
+        )
+        self._size_bytes += size
+        self._evict_overflow()
+        return True
+
+    def refresh(self, key: Hashable, entry: CachedResponse, not_modified: httpx.Response) -> None:
+        """Extend freshness of an entry after a `304 Not Modified` revalidation."""
+        for name in ("cache-control", "expires", "date", "etag", "last-modified", "age"):
+            if name in not_modified.headers:
+                entry.response.headers[name] = not_modified.headers[name]
+        lifetime = self._freshness_lifetime(entry.response)
+        if lifetime is None:
+            self._remove(key)
+            return
+        entry.expires_at = self._clock() + lifetime
+        size = _response_size(entry.response)
+        if self._entries.get(key) is entry:
+            self._size_bytes += size - entry.size
+        entry.size = size
+        self._evict_overflow()
+
+    def _remove(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size_bytes -= entry.size
+
+    def _evict_overflow(self) -> None:
+        while self._size_bytes > self._max_bytes and self._entries:
+            _, evicted = self._entries.popitem(last=False)
+            self._size_bytes -= evicted.size
+            if self._metrics is not None:
+                self._metrics.on_response_cache_eviction()
+
+    @staticmethod
+    def _freshness_lifetime(response: httpx.Response) -> float | None:
+        """Return seconds of freshness, `0` for revalidate-only, or None to skip storing."""
+        if response.status_code not in _CACHEABLE_STATUS_CODES:
+            return None
+        directives = _parse_cache_control(response.headers.get("cache-control", ""))
+        if "no-store" in directives or response.headers.get("vary", "").strip() == "*":
+            return None
+        has_validators = "etag" in response.headers or "last-modified" in response.headers
+
+        lifetime: Optional[float] = None
+        if "no-cache" in directives:
+            lifetime = 0.0
+        elif "max-age" in directives:
+            lifetime = _parse_seconds(directives["max-age"])
+        elif "expires" in response.headers:
+            lifetime = _expires_lifetime(response.headers)
+
+        if lifetime is None:
+            return 0.0 if has_validators else None
+        age = _parse_seconds(response.headers.get("age")) or 0.0
+        lifetime = max(lifetime - age, 0.0)
+        if lifetime == 0.0 and not has_validators:
+            return None
+        return lifetime
+
+
+def _parse_cache_control(value: str) -> Dict[str, Optional[str]]:
+    directives: Dict[str, Optional[str]] = {}
+    for part in value.split(","):
+        name, _, argument = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = argument.strip('"') if argument else None
+    return directives
+
+
+def _parse_seconds(value: Optional[str]) -> float | None:
+    if value is None:
+        return None
+    try:
+        return max(float(int(value)), 0.0)
+    except ValueError:
+        return None
+
+
+def _expires_lifetime(headers: httpx.Headers) -> float:
+    expires = _parse_http_date(headers.get("expires"))
+    if expires is None:
+        # Invalid Expires values mean "already expired".
+        return 0.0
+    date = _parse_http_date(headers.get("date")) or datetime.now(tz=timezone.utc)
+    return max((expires - date).total_seconds(), 0.0)
+
+
+def _parse_http_date(value: Optional[str]) -> datetime | None:
+    if not value:
+        return None
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+def _response_size(response: httpx.Response) -> int:
+    header_bytes = sum(len(name) + len(value) for name, value in response.headers.raw)
+    return len(response.content) + header_bytes
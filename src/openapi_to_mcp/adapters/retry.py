@@ -0,0 +1,95 @@
+"""Retry policy with jittered backoff, Retry-After support, and a retry budget."""
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from time import monotonic
+from typing import Callable, FrozenSet, Optional
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Attempt limits and backoff for retrying idempotent calls."""
+
+    max_attempts: int = 3
+    base_delay_seconds: float = 0.1
+    max_delay_seconds: float = 5.0
+    retry_statuses: FrozenSet[int] = frozenset({429, 502, 503, 504})
+    budget_ratio: float = 0.1
+    budget_min_retries_per_second: float = 1.0
+
+    def new_budget(self) -> "RetryBudget":
+        return RetryBudget(
+            ratio=self.budget_ratio,
+            min_retries_per_second=self.budget_min_retries_per_second,
+        )
+
+    def backoff_seconds(
+        self, attempt: int, rng: Callable[[float, float], float] = random.uniform
+    ) -> float:
+        """Return a full-jitter exponential delay after the given attempt number."""
+        ceiling = min(self.max_delay_seconds, self.base_delay_seconds * 2 ** (attempt - 1))
+        return rng(0.0, ceiling)
+
+    @staticmethod
+    def retry_after_seconds(value: Optional[str]) -> float | None:
+        """Parse a `Retry-After` header; None when absent or invalid."""
+        if not value:
+            return None
+        value = value.strip()
+        if value.isdigit():
+            return float(value)
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max((retry_at - datetime.now(tz=timezone.utc)).total_seconds(), 0.0)
+
+
+class RetryBudget:
+    """Token bucket that limits retries to a fraction of recent requests.
+
+    Every first attempt deposits `ratio` tokens and every retry withdraws one.
+    A small time-based refill keeps low-traffic operations retryable.
+    """
+
+    def __init__(
+        self,
+        ratio: float = 0.1,
+        min_retries_per_second: float = 1.0,
+        max_tokens: float = 10.0,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        self._ratio = ratio
+        self._min_retries_per_second = min_retries_per_second
+        self._max_tokens = max_tokens
+        self._clock = clock
+        self._tokens = max_tokens
+        self._refilled_at = clock()
+
+    @property
+    def tokens(self) -> float:
+        self._refill()
+        return self._tokens
+
+    def on_request(self) -> None:
+        self._tokens = min(self._max_tokens, self._tokens + self._ratio)
+
+    def try_acquire(self) -> bool:
+        self._refill()
+        if self._tokens < 1.0:
+            return False
+        self._tokens -= 1.0
+        return True
+
+    def _refill(self) -> None:
+        now = self._clock()
+        elapsed = now - self._refilled_at
+        self._refilled_at = now
+        refilled = self._tokens + elapsed * self._min_retries_per_second
+        self._tokens = min(self._max_tokens, refilled)
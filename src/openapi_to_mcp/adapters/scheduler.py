@@ -0,0 +1,144 @@
+"""Weighted fair scheduling of outbound slots across sessions and tools."""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import AsyncIterator, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from openapi_to_mcp.metrics import RuntimeMetrics
+
+DEFAULT_CLASS = "default"
+# Sweep idle flows once this many are tracked.
+_FLOW_SWEEP_THRESHOLD = 1024
+
+
+@dataclass
+class _Flow:
+    finish: float = 0.0
+    pending: int = 0
+
+
+@dataclass(order=True)
+class _Waiter:
+    start: float
+    sequence: int
+    future: asyncio.Future[None] = field(compare=False)
+
+
+class FairScheduler:
+    """Start-time fair queuing over `(session, tool)` flows.
+
+    Each call costs `1 / weight` of virtual time, where the weight comes from
+    the highest-weighted class among the tool's OpenAPI tags. A flow that
+    keeps many calls queued only advances its own tags, so other sessions and
+    tools are served in between instead of waiting behind it.
+
+    Fairness covers the global gate only: the invoker enters the FIFO origin
+    and operation bulkheads first, so a flow that fills one partition still
+    delays other flows' calls to that partition.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        tag_classes: Optional[Mapping[str, str]] = None,
+        class_weights: Optional[Mapping[str, int]] = None,
+        metrics: RuntimeMetrics | None = None,
+    ) -> None:
+        self._capacity = capacity
+        self._tag_classes = dict(tag_classes or {})
+        self._class_weights = {DEFAULT_CLASS: 1, **(class_weights or {})}
+        self._metrics = metrics
+        self._in_flight = 0
+        self._virtual_time = 0.0
+        self._flows: Dict[Tuple[str, str], _Flow] = {}
+        self._queue: List[_Waiter] = []
+        self._sequence = itertools.count()
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def queued(self) -> int:
+        return sum(1 for waiter in self._queue if not waiter.future.done())
+
+    def class_for(self, tags: Iterable[str]) -> str:
+        classes = [self._tag_classes[tag] for tag in tags if tag in self._tag_classes]
+        if not classes:
+            return DEFAULT_CLASS
+        return max(classes, key=lambda name: self._class_weights.get(name, 1))
+
+    @asynccontextmanager
+    async def slot(
+        self, session: str, operation: str, tags: Iterable[str] = ()
+    ) -> AsyncIterator[None]:
+        scheduling_class = self.class_for(tags)
+        key = (session, operation)
+        wait_started = perf_counter()
+        await self._acquire(key, self._class_weights.get(scheduling_class, 1))
+        if self._metrics is not None:
+            self._metrics.on_scheduler_wait(
+                scheduling_class=scheduling_class, wait_seconds=perf_counter() - wait_started
+            )
+        try:
+            yield
+        finally:
+            self._release(key)
+
+    async def _acquire(self, key: Tuple[str, str], weight: int) -> None:
+        flow = self._flows.get(key)
+        if flow is None:
+            flow = self._flows[key] = _Flow()
+        start = max(self._virtual_time, flow.finish)
+        flow.finish = start + 1.0 / weight
+        flow.pending += 1
+        waiter = _Waiter(
+            start=start,
+            sequence=next(self._sequence),
+            future=asyncio.get_running_loop().create_future(),
+        )
+        heapq.heappush(self._queue, waiter)
+        self._dispatch()
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter.future.done() and not waiter.future.cancelled():
+                # The slot was granted just before cancellation; hand it back.
+                self._release(key)
+            else:
+                flow.pending -= 1
+            raise
+
+    def _release(self, key: Tuple[str, str]) -> None:
+        self._in_flight -= 1
+        flow = self._flows.get(key)
+        if flow is not None:
+            flow.pending -= 1
+        self._dispatch()
+        if len(self._flows) > _FLOW_SWEEP_THRESHOLD:
+            self._sweep()
+
+    def _dispatch(self) -> None:
+        """Grant free slots to queued calls in start-tag order."""
+        while self._queue and self._in_flight < self._capacity:
+            waiter = heapq.heappop(self._queue)
+            if waiter.future.done():
+                continue
+            self._in_flight += 1
+            self._virtual_time = max(self._virtual_time, waiter.start)
+            waiter.future.set_result(None)
+
+    def _sweep(self) -> None:
+        idle = [
+            key
+            for key, flow in self._flows.items()
+            if flow.pending <= 0 and flow.finish <= self._virtual_time
+        ]
+        for key in idle:
+            del self._flows[key]
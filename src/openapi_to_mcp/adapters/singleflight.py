@@ -0,0 +1,46 @@
+"""Coalescing of identical concurrent calls into one shared execution."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Awaitable, Callable, Dict, Hashable, TypeVar
+
+from openapi_to_mcp.metrics import RuntimeMetrics
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Run at most one call per key at a time and fan its result out.
+
+    The shared call runs in its own task, so a cancelled caller does not
+    cancel the call for the others. Callers receive the same result object
+    and must treat it as read-only.
+    """
+
+    def __init__(self, metrics: RuntimeMetrics | None = None) -> None:
+        self._metrics = metrics
+        self._calls: Dict[Hashable, asyncio.Future[object]] = {}
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._calls
+
+    async def do(self, key: Hashable, work: Callable[[], Awaitable[T]]) -> T:
+        call = self._calls.get(key)
+        if call is None:
+            call = asyncio.ensure_future(work())
+            self._calls[key] = call
+            call.add_done_callback(lambda done: self._forget(key, done))
+        elif self._metrics is not None:
+            self._metrics.on_invocation_coalesced()
+        return await asyncio.shield(call)  # type: ignore[return-value]
+
+    def _forget(self, key: Hashable, done: asyncio.Future[object]) -> None:
+        if self._calls.get(key) is done:
+            del self._calls[key]
+        if not done.cancelled():
+            # Mark the exception retrieved when every caller was cancelled.
+            done.exception()
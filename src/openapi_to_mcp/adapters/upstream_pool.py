@@ -0,0 +1,260 @@
+"""Long-lived HTTP client pools keyed by upstream origin."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import importlib.util
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from time import monotonic
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, Mapping, Optional
+
+import httpx
+
+from openapi_to_mcp.adapters.dns_cache import CachingNetworkBackend, DnsCache
+from openapi_to_mcp.adapters.pooled_transport import PooledTransport
+from openapi_to_mcp.errors import ConfigurationError, InvocationError
+from openapi_to_mcp.metrics import RuntimeMetrics
+
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+@dataclass(frozen=True)
+class OriginLimits:
+    """Connection limits applied to one upstream origin."""
+
+    max_connections: int
+    max_keepalive_connections: int
+
+
+@dataclass
+class _OriginPool:
+    client: httpx.AsyncClient
+    last_used: float
+    transport: PooledTransport | None = None
+    active_leases: int = 0
+
+
+class UpstreamPoolManager:
+    """Keep one pooled HTTPX client per upstream origin for the app lifetime.
+
+    Origins listed in `uds_paths` connect over that Unix domain socket, and
+    origins in `asgi_apps` are served in-process by that ASGI application.
+    URLs, Host headers, and pooling are unchanged for both.
+    """
+
+    def __init__(
+        self,
+        timeout_seconds: float = 10.0,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        origin_limits: Optional[Mapping[str, OriginLimits]] = None,
+        idle_timeout_seconds: float = 300.0,
+        http2_enabled: bool = False,
+        http2_origins: Iterable[str] = (),
+        client_factory: Optional[Callable[[str], httpx.AsyncClient]] = None,
+        dns_cache: Optional[DnsCache] = None,
+        uds_paths: Optional[Mapping[str, str]] = None,
+        asgi_apps: Optional[Mapping[str, Callable[..., Any]]] = None,
+        metrics: RuntimeMetrics | None = None,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        self._timeout_seconds = timeout_seconds
+        self._default_limits = OriginLimits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+        )
+        self._origin_limits = {
+            origin_of(origin): limits for origin, limits in (origin_limits or {}).items()
+        }
+        self._idle_timeout_seconds = idle_timeout_seconds
+        self._http2_enabled = http2_enabled
+        self._http2_origins = frozenset(origin_of(origin) for origin in http2_origins)
+        if (http2_enabled or self._http2_origins) and importlib.util.find_spec("h2") is None:
+            raise ConfigurationError(
+                "HTTP/2 upstream mode requires the 'h2' package (install httpx[http2])."
+            )
+        self._client_factory = client_factory
+        self._dns_cache = dns_cache
+        self._uds_paths = {origin_of(origin): path for origin, path in (uds_paths or {}).items()}
+        self._asgi_apps = {origin_of(origin): app for origin, app in (asgi_apps or {}).items()}
+        self._metrics = metrics
+        self._clock = clock
+        self._pools: Dict[str, _OriginPool] = {}
+        self._eviction_task: asyncio.Task[None] | None = None
+        self._closed = False
+
+    @property
+    def origins(self) -> list[str]:
+        return sorted(self._pools)
+
+    def limits_for(self, origin: str) -> OriginLimits:
+        return self._origin_limits.get(origin, self._default_limits)
+
+    def uses_http2(self, origin: str) -> bool:
+        return self._http2_enabled or origin in self._http2_origins
+
+    def open_connections(self, origin: str) -> int:
+        """Return open connections for an origin, or 0 when not observable."""
+        pool = self._pools.get(origin)
+        if pool is None or pool.transport is None:
+            return 0
+        return pool.transport.open_connections
+
+    @asynccontextmanager
+    async def lease(self, origin: str) -> AsyncIterator[httpx.AsyncClient]:
+        """Borrow the shared client for an origin; idle eviction skips leased pools."""
+        if self._closed:
+            raise InvocationError("Upstream connection pools are closed.")
+        pool = self._pools.get(origin)
+        if pool is None:
+            pool = self._build_pool(origin)
+            self._pools[origin] = pool
+        pool.active_leases += 1
+        if self._metrics is not None:
+            self._metrics.on_connection_pool_leased(
+                origin=origin,
+                protocol_version="2" if self.uses_http2(origin) else "1.1",
+                active_streams=pool.active_leases,
+                open_connections=self.open_connections(origin),
+            )
+        try:
+            yield pool.client
+        finally:
+            pool.active_leases -= 1
+            pool.last_used = self._clock()
+
+    async def evict_idle(self) -> int:
+        """Close clients whose origin saw no traffic within the idle timeout."""
+        now = self._clock()
+        # Detach every expired pool before the first await, so no task can lease
+        # a pool between the idle check and its close.
+        expired = {
+            origin: pool
+            for origin, pool in self._pools.items()
+            if pool.active_leases == 0 and now - pool.last_used >= self._idle_timeout_seconds
+        }
+        for origin in expired:
+            del self._pools[origin]
+        for origin, pool in expired.items():
+            await pool.client.aclose()
+            if self._metrics is not None:
+                self._metrics.on_connection_pool_closed(origin)
+        return len(expired)
+
+    async def warm_up(
+        self, urls: Iterable[str], connections: int, timeout_seconds: float = 5.0
+    ) -> Dict[str, int]:
+        """Resolve each origin and open keep-alive connections before traffic arrives.
+
+        Connections are opened with concurrent `HEAD /` requests; any HTTP
+        response counts, since only the connection matters. Failures are
+        ignored so an unreachable upstream never blocks startup. Returns the
+        number of connections warmed per origin.
+        """
+        origins = sorted({origin for origin in map(_warmable_origin, urls) if origin})
+        warmed = await asyncio.gather(
+            *(self._warm_origin(origin, connections, timeout_seconds) for origin in origins)
+        )
+        return dict(zip(origins, warmed, strict=True))
+
+    async def _warm_origin(self, origin: str, connections: int, timeout_seconds: float) -> int:
+        url = httpx.URL(origin)
+        if self._dns_cache is not None and url.host and url.port:
+            with contextlib.suppress(OSError, TimeoutError):
+                async with asyncio.timeout(timeout_seconds):
+                    await self._dns_cache.resolve(url.host, url.port)
+        count = min(connections, self.limits_for(origin).max_keepalive_connections)
+        if origin in self._asgi_apps:
+            # In-process upstreams have no connections to open.
+            count = 0
+        elif self.uses_http2(origin):
+            # One HTTP/2 connection multiplexes every stream.
+            count = min(count, 1)
+        if count <= 0:
+            return 0
+        async with self.lease(origin) as client:
+            responses = await asyncio.gather(
+                *(client.head(origin + "/", timeout=timeout_seconds) for _ in range(count)),
+                return_exceptions=True,
+            )
+        warmed = sum(1 for response in responses if isinstance(response, httpx.Response))
+        if self._metrics is not None:
+            self._metrics.on_connection_pool_warmed(origin=origin, connections=warmed)
+        return warmed
+
+    async def start(self) -> None:
+        self._closed = False
+        if self._eviction_task is None:
+            self._eviction_task = asyncio.create_task(self._run_eviction())
+
+    async def aclose(self) -> None:
+        self._closed = True
+        if self._eviction_task is not None:
+            self._eviction_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._eviction_task
+            self._eviction_task = None
+        pools = list(self._pools.values())
+        self._pools.clear()
+        for pool in pools:
+            await pool.client.aclose()
+
+    async def _run_eviction(self) -> None:
+        interval = max(self._idle_timeout_seconds / 2.0, 1.0)
+        while True:
+            await asyncio.sleep(interval)
+            await self.evict_idle()
+
+    def _build_pool(self, origin: str) -> _OriginPool:
+        if self._client_factory is not None:
+            return _OriginPool(client=self._client_factory(origin), last_used=self._clock())
+        asgi_app = self._asgi_apps.get(origin)
+        if asgi_app is not None:
+            client = httpx.AsyncClient(
+                timeout=self._timeout_seconds, transport=httpx.ASGITransport(app=asgi_app)
+            )
+            return _OriginPool(client=client, last_used=self._clock())
+        limits = self.limits_for(origin)
+        uds_path = self._uds_paths.get(origin)
+        network_backend = None
+        if self._dns_cache is not None and uds_path is None:
+            network_backend = CachingNetworkBackend(self._dns_cache)
+        transport = PooledTransport(
+            limits=httpx.Limits(
+                max_connections=limits.max_connections,
+                max_keepalive_connections=limits.max_keepalive_connections,
+                # Idle connections live as long as the idle pool itself, so warmed ones survive
+                # until traffic arrives instead of the 5 s HTTPX default.
+                keepalive_expiry=self._idle_timeout_seconds,
+            ),
+            http2=self.uses_http2(origin),
+            uds=uds_path,
+            network_backend=network_backend,
+        )
+        client = httpx.AsyncClient(timeout=self._timeout_seconds, transport=transport)
+        return _OriginPool(client=client, last_used=self._clock(), transport=transport)
+
+
+def _warmable_origin(url: str) -> str | None:
+    try:
+        return origin_of(url)
+    except InvocationError:
+        # Relative or templated server URLs have no origin to warm.
+        return None
+
+
+def origin_of(url: str) -> str:
+    """Return the normalized `scheme://host:port` origin of an absolute URL."""
+    try:
+        parsed = httpx.URL(url)
+    except (httpx.InvalidURL, TypeError) as exc:
+        raise InvocationError(f"Invalid upstream URL: {url}") from exc
+    scheme = parsed.scheme.lower()
+    if not scheme or not parsed.host:
+        raise InvocationError(f"Upstream URL must be absolute: {url}")
+    port = parsed.port or _DEFAULT_PORTS.get(scheme)
+    if port is None:
+        return f"{scheme}://{parsed.host}"
+    return f"{scheme}://{parsed.host}:{port}"
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, List
+import re
+from typing import Any, Dict, List, Tuple
+from urllib.parse import urljoin
 
 from openapi_to_mcp.domain.models import ApiOperation
 
@@ -16,6 +18,7 @@ _ALLOWED_HTTP_METHODS = {
     "head",
     "trace",
 }
+_SERVER_VARIABLE = re.compile(r"\{([^{}]+)\}")
 
 
 class OperationMapper:
@@ -23,20 +26,27 @@ class OperationMapper:
 
     def map_operations(self, spec: Dict[str, Any]) -> List[ApiOperation]:
         paths = spec.get("paths", {})
-        root_server_url = _extract_first_server_url(spec.get("servers"))
+        root_servers = _extract_servers(spec.get("servers"))
+        components = spec.get("components")
+        schemes = components.get("securitySchemes") if isinstance(components, dict) else None
+        security_schemes = schemes if isinstance(schemes, dict) else {}
+        root_security = spec.get("security")
         mapped: List[ApiOperation] = []
 
         for path, path_item in paths.items():
             if not isinstance(path_item, dict):
                 continue
 
-            path_server_url = _extract_first_server_url(path_item.get("servers"))
+            path_servers = _extract_servers(path_item.get("servers"))
             path_level_parameters = _extract_parameters(path_item.get("parameters", []))
 
             for method, operation in path_item.items():
                 if method not in _ALLOWED_HTTP_METHODS or not isinstance(operation, dict):
                     continue
 
+                servers = _extract_servers(operation.get("servers")) or path_servers or root_servers
+                server_urls = list(dict.fromkeys(_expand_defaults(*server) for server in servers))
+                server_template, server_variables = _selectable_server(servers)
                 op_parameters = _extract_parameters(operation.get("parameters", []))
                 merged_parameters = _merge_parameters(path_level_parameters, op_parameters)
 
@@ -51,30 +61,140 @@ class OperationMapper:
                         request_body_required=bool(
                             operation.get("requestBody", {}).get("required", False)
                         ),
-                        server_url=_resolve_server_url(operation, path_server_url, root_server_url),
+                        server_url=server_urls[0] if server_urls else None,
+                        extensions=_extract_extensions(operation),
+                        server_urls=server_urls,
+                        server_template=server_template,
+                        server_variables=server_variables,
+                        tags=_extract_tags(operation),
+                        security=_resolve_security(
+                            operation.get("security", root_security),
+                            security_schemes,
+                            server_urls[0] if server_urls else "",
+                        ),
                     )
                 )
 
         return mapped
 
 
-def _extract_first_server_url(servers: Any) -> str | None:
-    if not isinstance(servers, list) or not servers:
-        return None
-    first = servers[0]
-    if not isinstance(first, dict):
+def _extract_servers(servers: Any) -> List[Tuple[str, Dict[str, Dict[str, Any]]]]:
+    """Return `(url template, variables)` pairs for servers that declare a URL."""
+    if not isinstance(servers, list):
+        return []
+    extracted: List[Tuple[str, Dict[str, Dict[str, Any]]]] = []
+    for server in servers:
+        if not isinstance(server, dict):
+            continue
+        value = server.get("url")
+        if not isinstance(value, str) or not value.strip():
+            continue
+        variables = server.get("variables")
+        if not isinstance(variables, dict):
+            variables = {}
+        extracted.append(
+            (
+                value.strip(),
+                {
+                    name: variable
+                    for name, variable in variables.items()
+                    if isinstance(variable, dict)
+                },
+            )
+        )
+    return extracted
+
+
+def _selectable_server(
+    servers: List[Tuple[str, Dict[str, Dict[str, Any]]]],
+) -> Tuple[str | None, Dict[str, Dict[str, Any]]]:
+    """Return the primary server template keeping only enum-bound variables open."""
+    if not servers:
+        return None, {}
+    template, variables = servers[0]
+    selectable = {
+        name: variable
+        for name, variable in variables.items()
+        if "default" in variable
+        and isinstance(variable.get("enum"), list)
+        and len(variable["enum"]) > 1
+        and f"{{{name}}}" in template
+    }
+    if not selectable:
+        return None, {}
+    fixed = {name: variable for name, variable in variables.items() if name not in selectable}
+    return _expand_defaults(template, fixed), selectable
+
+
+def _expand_defaults(template: str, variables: Dict[str, Dict[str, Any]]) -> str:
+    def substitute(match: re.Match[str]) -> str:
+        variable = variables.get(match.group(1))
+        if variable is None or "default" not in variable:
+            return match.group(0)
+        return str(variable["default"])
+
+    return _SERVER_VARIABLE.sub(substitute, template)
+
+
+def _extract_tags(operation: Dict[str, Any]) -> List[str]:
+    tags = operation.get("tags")
+    if not isinstance(tags, list):
+        return []
+    return [tag for tag in tags if isinstance(tag, str) and tag]
+
+
+def _resolve_security(
+    requirements: Any, schemes: Dict[str, Any], base_url: str
+) -> List[List[Dict[str, Any]]]:
+    """Resolve security alternatives, dropping any that use an unsupported scheme."""
+    if not isinstance(requirements, list):
+        return []
+    alternatives: List[List[Dict[str, Any]]] = []
+    for requirement in requirements:
+        if not isinstance(requirement, dict):
+            continue
+        resolved = [
+            _describe_scheme(name, schemes.get(name), scopes, base_url)
+            for name, scopes in requirement.items()
+        ]
+        if all(entry is not None for entry in resolved):
+            alternatives.append([entry for entry in resolved if entry is not None])
+    return alternatives
+
+
+def _describe_scheme(
+    name: str, scheme: Any, scopes: Any, base_url: str
+) -> Dict[str, Any] | None:
+    if not isinstance(scheme, dict):
         return None
-    value = first.get("url")
-    if isinstance(value, str) and value.strip():
-        return value.strip()
+    kind = scheme.get("type")
+    if kind == "apiKey":
+        location = scheme.get("in")
+        parameter = scheme.get("name")
+        if location not in {"header", "query", "cookie"} or not isinstance(parameter, str):
+            return None
+        return {"scheme": name, "type": "apiKey", "in": location, "name": parameter}
+    if kind == "oauth2":
+        flows = scheme.get("flows")
+        flow = flows.get("clientCredentials") if isinstance(flows, dict) else None
+        token_url = flow.get("tokenUrl") if isinstance(flow, dict) else None
+        if not isinstance(token_url, str) or not token_url:
+            return None
+        return {
+            "scheme": name,
+            "type": "oauth2",
+            "token_url": urljoin(base_url, token_url),
+            "scopes": [scope for scope in scopes or [] if isinstance(scope, str)],
+        }
     return None
 
 
-def _resolve_server_url(
-    operation: Dict[str, Any], path_server_url: str | None, root_server_url: str | None
-) -> str | None:
-    operation_server_url = _extract_first_server_url(operation.get("servers"))
-    return operation_server_url or path_server_url or root_server_url
+def _extract_extensions(operation: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        key: value
+        for key, value in operation.items()
+        if isinstance(key, str) and key.startswith("x-")
+    }
 
 
 def _extract_parameters(raw_parameters: Any) -> List[Dict[str, Any]]:
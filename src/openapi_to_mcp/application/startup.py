@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import List
 
 from openapi_to_mcp.application.mapper import OperationMapper
 from openapi_to_mcp.application.tool_generator import ToolGenerationService
-from openapi_to_mcp.domain.models import GenerationReport
+from openapi_to_mcp.domain.models import GeneratedTool, GenerationReport
 from openapi_to_mcp.ports import OpenApiSourcePort, OpenApiValidatorPort
 from openapi_to_mcp.transport.fastmcp_adapter import FastMcpAdapter
 
@@ -20,6 +21,7 @@ class StartupOrchestrator:
     mapper: OperationMapper
     generator: ToolGenerationService
     mcp_adapter: FastMcpAdapter
+    tools: List[GeneratedTool] = field(default_factory=list, init=False)
 
     def bootstrap(self) -> GenerationReport:
         raw_spec = self.source.load_raw()
@@ -28,4 +30,13 @@ class StartupOrchestrator:
         generated_tools, report = self.generator.generate(operations)
         report.warnings.extend(validation.warnings)
         self.mcp_adapter.register_tools(generated_tools)
+        self.tools = generated_tools
         return report
+
+    def upstream_urls(self) -> List[str]:
+        """Distinct URL prefixes the registered tools call."""
+        urls: dict[str, None] = {}
+        for tool in self.tools:
+            if tool.plan is not None:
+                urls.update(dict.fromkeys(tool.plan.upstream_urls))
+        return list(urls)
@@ -2,10 +2,30 @@
 
 from __future__ import annotations
 
+import math
 import re
+from dataclasses import asdict
 from typing import Any, Dict, List, Tuple
 
-from openapi_to_mcp.domain.models import ApiOperation, GeneratedTool, GenerationReport
+from openapi_to_mcp.domain.models import (
+    MAX_SERVER_VARIANTS,
+    ApiOperation,
+    GeneratedTool,
+    GenerationReport,
+    InvocationPlan,
+    OperationTimeouts,
+    Pagination,
+)
+
+_SAFE_METHODS = {"get", "head"}
+_IDEMPOTENT_METHODS = {"get", "head", "options", "put", "delete", "trace"}
+_CACHE_EXTENSION = "x-mcp-cache"
+_PASSTHROUGH_EXTENSION = "x-mcp-passthrough"
+_IDEMPOTENT_EXTENSION = "x-mcp-idempotent"
+_TIMEOUT_EXTENSION = "x-mcp-timeout"
+_PAGINATION_EXTENSION = "x-mcp-pagination"
+_SERVER_ARGUMENT_PREFIX = "server_"
+_PROJECTION_ARGUMENT = "fields"
 
 
 class ToolGenerationService:
@@ -29,12 +49,14 @@ class ToolGenerationService:
                 continue
 
             seen_names.add(tool_name)
+            binding = _build_binding(operation, tool_name)
             tools.append(
                 GeneratedTool(
                     name=tool_name,
                     description=_build_description(operation),
                     input_schema=_build_input_schema(operation),
-                    binding=_build_binding(operation),
+                    binding=binding,
+                    plan=InvocationPlan.from_binding(binding),
                 )
             )
             report.generated_count += 1
@@ -76,13 +98,34 @@ def _build_input_schema(operation: ApiOperation) -> Dict[str, Any]:
         if operation.request_body_required:
             required.append("body")
 
+    for name, argument in _server_arguments(operation).items():
+        variable = operation.server_variables[name]
+        properties[argument] = {
+            "type": "string",
+            "enum": [str(value) for value in variable["enum"]],
+            "default": str(variable["default"]),
+            "description": variable.get("description") or f"Server variable '{name}'.",
+        }
+
+    projection = _projection_argument(operation)
+    if projection is not None:
+        properties[projection] = {
+            "type": "array",
+            "items": {"type": "string"},
+            "description": (
+                "Response fields to return, as JSON pointers (`/items/0/name`) or dotted "
+                "paths (`items.name`); arrays apply the rest of a path to every element. "
+                "Omit to return the full response."
+            ),
+        }
+
     output: Dict[str, Any] = {"type": "object", "properties": properties}
     if required:
         output["required"] = sorted(set(required))
     return output
 
 
-def _build_binding(operation: ApiOperation) -> Dict[str, Any]:
+def _build_binding(operation: ApiOperation, tool_name: str) -> Dict[str, Any]:
     path_params = []
     query_params = []
     header_params = []
@@ -99,13 +142,109 @@ def _build_binding(operation: ApiOperation) -> Dict[str, Any]:
         elif where == "header":
             header_params.append(name)
 
-    return {
+    binding: Dict[str, Any] = {
+        "tool_name": tool_name,
         "method": operation.method,
         "path": operation.path,
         "server_url": operation.server_url,
         "path_params": path_params,
         "query_params": query_params,
         "header_params": header_params,
+        "cacheable": _is_cacheable(operation),
+        "idempotent": _is_idempotent(operation),
+    }
+    passthrough = operation.extensions.get(_PASSTHROUGH_EXTENSION)
+    if isinstance(passthrough, bool):
+        binding["passthrough"] = passthrough
+    if operation.tags:
+        binding["tags"] = list(operation.tags)
+    if operation.security:
+        binding["security"] = operation.security
+    timeouts = _declared_timeouts(operation)
+    if timeouts:
+        binding["timeouts"] = timeouts
+    pagination = Pagination.from_mapping(operation.extensions.get(_PAGINATION_EXTENSION))
+    if pagination is not None:
+        binding["pagination"] = asdict(pagination)
+    if len(operation.server_urls) > 1:
+        binding["server_urls"] = list(operation.server_urls)
+    projection = _projection_argument(operation)
+    if projection is not None:
+        binding["projection_argument"] = projection
+    arguments = _server_arguments(operation)
+    if arguments:
+        binding["server_template"] = operation.server_template
+        binding["server_variables"] = {
+            name: {
+                "argument": argument,
+                "default": str(operation.server_variables[name]["default"]),
+                "enum": [str(value) for value in operation.server_variables[name]["enum"]],
+            }
+            for name, argument in arguments.items()
+        }
+    return binding
+
+
+def _server_arguments(operation: ApiOperation) -> Dict[str, str]:
+    """Map selectable server variables to tool arguments.
+
+    Empty when any name clashes or when there are more value combinations
+    than the invocation plan precomputes, so no argument is ever ignored.
+    """
+    if operation.server_template is None:
+        return {}
+    combinations = math.prod(
+        len(variable["enum"]) for variable in operation.server_variables.values()
+    )
+    if combinations > MAX_SERVER_VARIANTS:
+        return {}
+    taken = {parameter.get("name") for parameter in operation.parameters} | {"body"}
+    arguments: Dict[str, str] = {}
+    for name in operation.server_variables:
+        argument = _SERVER_ARGUMENT_PREFIX + _sanitize_identifier(name)
+        if argument in taken:
+            return {}
+        arguments[name] = argument
+        taken.add(argument)
+    return arguments
+
+
+def _projection_argument(operation: ApiOperation) -> str | None:
+    """Name of the generated response projection argument; None when the name is taken."""
+    taken = {parameter.get("name") for parameter in operation.parameters} | {"body"}
+    return None if _PROJECTION_ARGUMENT in taken else _PROJECTION_ARGUMENT
+
+
+def _is_cacheable(operation: ApiOperation) -> bool:
+    opt_in = operation.extensions.get(_CACHE_EXTENSION)
+    if isinstance(opt_in, bool):
+        return opt_in
+    return operation.method.lower() in _SAFE_METHODS
+
+
+def _is_idempotent(operation: ApiOperation) -> bool:
+    declared = operation.extensions.get(_IDEMPOTENT_EXTENSION)
+    if isinstance(declared, bool):
+        return declared
+    return operation.method.lower() in _IDEMPOTENT_METHODS
+
+
+def _declared_timeouts(operation: ApiOperation) -> Dict[str, float]:
+    """Read `x-mcp-timeout`: seconds for the whole call, or connect/read/total seconds."""
+    declared = operation.extensions.get(_TIMEOUT_EXTENSION)
+    if not isinstance(declared, dict):
+        declared = {"total": declared}
+    timeouts = OperationTimeouts.from_mapping(declared)
+    if timeouts is None:
+        return {}
+    return {
+        name: value
+        for name, value in (
+            ("connect", timeouts.connect),
+            ("read", timeouts.read),
+            ("total", timeouts.total),
+        )
+        if value is not None
     }
 
 
@@ -3,16 +3,21 @@
 from __future__ import annotations
 
 import os
-from dataclasses import dataclass
-from typing import Mapping, Optional
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Mapping, Optional, Tuple, TypeVar
+from urllib.parse import urlsplit
 
+from .domain.models import OperationTimeouts
 from .errors import ConfigurationError
 
 _ALLOWED_LOG_LEVELS = {"critical", "error", "warning", "info", "debug"}
 _ALLOWED_TELEMETRY_PROTOCOLS = {"grpc", "http"}
+_ALLOWED_JSON_CODECS = {"auto", "orjson", "stdlib"}
 _TRUE_VALUES = {"1", "true", "yes", "on"}
 _FALSE_VALUES = {"0", "false", "no", "off"}
 
+_T = TypeVar("_T")
+
 
 @dataclass(frozen=True)
 class Settings:
@@ -26,6 +31,72 @@ class Settings:
     http_max_in_flight: int = 128
     http_max_connections: int = 100
     http_max_keepalive_connections: int = 20
+    http_pool_idle_timeout_seconds: float = 300.0
+    http_pool_origin_limits: Dict[str, Tuple[int, int]] = field(default_factory=dict)
+    http2_enabled: bool = False
+    http2_origins: Tuple[str, ...] = ()
+    http_origin_max_in_flight: int = 0
+    http_origin_max_in_flight_overrides: Dict[str, int] = field(default_factory=dict)
+    http_operation_max_in_flight: int = 0
+    http_operation_max_in_flight_overrides: Dict[str, int] = field(default_factory=dict)
+    http_adaptive_concurrency_enabled: bool = False
+    http_adaptive_concurrency_initial_limit: int = 16
+    http_adaptive_concurrency_min_limit: int = 1
+    http_adaptive_concurrency_max_limit: int = 128
+    http_response_cache_max_bytes: int = 0
+    http_request_coalescing_enabled: bool = False
+    json_codec: str = "auto"
+    http_response_passthrough: bool = False
+    http_response_header_allowlist: Tuple[str, ...] = ()
+    http_response_max_bytes: int = 0
+    http_response_max_bytes_overrides: Dict[str, int] = field(default_factory=dict)
+    http_retry_max_attempts: int = 1
+    http_retry_base_delay_seconds: float = 0.1
+    http_retry_max_delay_seconds: float = 5.0
+    http_retry_budget_ratio: float = 0.1
+    http_retry_budget_min_per_second: float = 1.0
+    http_hedging_enabled: bool = False
+    http_hedge_percentile: float = 0.95
+    http_hedge_budget_ratio: float = 0.05
+    http_hedge_operations: Tuple[str, ...] = ()
+    http_circuit_breaker_enabled: bool = False
+    http_circuit_breaker_failure_rate: float = 0.5
+    http_circuit_breaker_minimum_calls: int = 20
+    http_circuit_breaker_window_seconds: float = 30.0
+    http_circuit_breaker_open_seconds: float = 30.0
+    http_load_balancing_enabled: bool = False
+    http_load_balancer_eject_failures: int = 5
+    http_load_balancer_eject_seconds: float = 30.0
+    http_rate_limit_pacing_enabled: bool = False
+    http_rate_limits: Dict[str, float] = field(default_factory=dict)
+    http_rate_limit_max_wait_seconds: float = 5.0
+    http_max_queue_depth: int = 0
+    http_max_queue_wait_seconds: float = 0.0
+    http_fair_scheduling_enabled: bool = False
+    http_scheduler_tag_classes: Dict[str, str] = field(default_factory=dict)
+    http_scheduler_class_weights: Dict[str, int] = field(default_factory=dict)
+    http_timeout_seconds: float = 10.0
+    http_timeout_overrides: Dict[str, OperationTimeouts] = field(default_factory=dict)
+    http_deadline_header: str = "X-Request-Timeout"
+    http_adaptive_timeouts_enabled: bool = False
+    http_adaptive_timeout_percentile: float = 0.99
+    http_adaptive_timeout_min_seconds: float = 0.1
+    http_adaptive_timeout_max_seconds: float = 10.0
+    http_warmup_connections: int = 0
+    http_warmup_timeout_seconds: float = 5.0
+    http_dns_cache_ttl_seconds: float = 0.0
+    http_uds_origins: Dict[str, str] = field(default_factory=dict)
+    http_asgi_origins: Dict[str, str] = field(default_factory=dict)
+    # Secrets stay out of the repr so settings can be logged.
+    http_auth_api_keys: Dict[str, str] = field(default_factory=dict, repr=False)
+    http_auth_oauth2_clients: Dict[str, Tuple[str, str]] = field(
+        default_factory=dict, repr=False
+    )
+    http_auth_refresh_ahead_seconds: float = 60.0
+    http_pagination_max_pages: int = 10
+    http_pagination_max_items: int = 1000
+    http_pagination_max_bytes: int = 0
+    http_pagination_concurrency: int = 4
     telemetry_otlp_protocol: str = "grpc"
     telemetry_otlp_endpoint: str = "http://127.0.0.1:4317"
     telemetry_export_interval_ms: int = 60000
@@ -58,6 +129,226 @@ class Settings:
                 values.get("HTTP_MAX_KEEPALIVE_CONNECTIONS", "20"),
                 "HTTP_MAX_KEEPALIVE_CONNECTIONS",
             ),
+            http_pool_idle_timeout_seconds=_parse_positive_float(
+                values.get("HTTP_POOL_IDLE_TIMEOUT_SECONDS", "300"),
+                "HTTP_POOL_IDLE_TIMEOUT_SECONDS",
+            ),
+            http_pool_origin_limits=_parse_origin_map(
+                values.get("HTTP_POOL_ORIGIN_LIMITS", ""),
+                "HTTP_POOL_ORIGIN_LIMITS",
+                _parse_connection_limits,
+            ),
+            http2_enabled=_parse_bool(values.get("HTTP2_ENABLED", "false"), "HTTP2_ENABLED"),
+            http2_origins=_parse_origin_list(values.get("HTTP2_ORIGINS", ""), "HTTP2_ORIGINS"),
+            http_origin_max_in_flight=_parse_non_negative_int(
+                values.get("HTTP_ORIGIN_MAX_IN_FLIGHT", "0"), "HTTP_ORIGIN_MAX_IN_FLIGHT"
+            ),
+            http_origin_max_in_flight_overrides=_parse_origin_map(
+                values.get("HTTP_ORIGIN_MAX_IN_FLIGHT_OVERRIDES", ""),
+                "HTTP_ORIGIN_MAX_IN_FLIGHT_OVERRIDES",
+                _parse_positive_int,
+            ),
+            http_operation_max_in_flight=_parse_non_negative_int(
+                values.get("HTTP_OPERATION_MAX_IN_FLIGHT", "0"), "HTTP_OPERATION_MAX_IN_FLIGHT"
+            ),
+            http_operation_max_in_flight_overrides=_parse_name_map(
+                values.get("HTTP_OPERATION_MAX_IN_FLIGHT_OVERRIDES", ""),
+                "HTTP_OPERATION_MAX_IN_FLIGHT_OVERRIDES",
+                _parse_positive_int,
+            ),
+            http_adaptive_concurrency_enabled=_parse_bool(
+                values.get("HTTP_ADAPTIVE_CONCURRENCY_ENABLED", "false"),
+                "HTTP_ADAPTIVE_CONCURRENCY_ENABLED",
+            ),
+            http_adaptive_concurrency_initial_limit=_parse_positive_int(
+                values.get("HTTP_ADAPTIVE_CONCURRENCY_INITIAL_LIMIT", "16"),
+                "HTTP_ADAPTIVE_CONCURRENCY_INITIAL_LIMIT",
+            ),
+            http_adaptive_concurrency_min_limit=_parse_positive_int(
+                values.get("HTTP_ADAPTIVE_CONCURRENCY_MIN_LIMIT", "1"),
+                "HTTP_ADAPTIVE_CONCURRENCY_MIN_LIMIT",
+            ),
+            http_adaptive_concurrency_max_limit=_parse_positive_int(
+                values.get("HTTP_ADAPTIVE_CONCURRENCY_MAX_LIMIT", "128"),
+                "HTTP_ADAPTIVE_CONCURRENCY_MAX_LIMIT",
+            ),
+            http_response_cache_max_bytes=_parse_non_negative_int(
+                values.get("HTTP_RESPONSE_CACHE_MAX_BYTES", "0"),
+                "HTTP_RESPONSE_CACHE_MAX_BYTES",
+            ),
+            http_request_coalescing_enabled=_parse_bool(
+                values.get("HTTP_REQUEST_COALESCING_ENABLED", "false"),
+                "HTTP_REQUEST_COALESCING_ENABLED",
+            ),
+            json_codec=values.get("JSON_CODEC", "auto").strip().lower(),
+            http_response_passthrough=_parse_bool(
+                values.get("HTTP_RESPONSE_PASSTHROUGH", "false"), "HTTP_RESPONSE_PASSTHROUGH"
+            ),
+            http_response_header_allowlist=_parse_header_list(
+                values.get("HTTP_RESPONSE_HEADER_ALLOWLIST", "")
+            ),
+            http_response_max_bytes=_parse_non_negative_int(
+                values.get("HTTP_RESPONSE_MAX_BYTES", "0"), "HTTP_RESPONSE_MAX_BYTES"
+            ),
+            http_response_max_bytes_overrides=_parse_name_map(
+                values.get("HTTP_RESPONSE_MAX_BYTES_OVERRIDES", ""),
+                "HTTP_RESPONSE_MAX_BYTES_OVERRIDES",
+                _parse_positive_int,
+            ),
+            http_retry_max_attempts=_parse_positive_int(
+                values.get("HTTP_RETRY_MAX_ATTEMPTS", "1"), "HTTP_RETRY_MAX_ATTEMPTS"
+            ),
+            http_retry_base_delay_seconds=_parse_positive_float(
+                values.get("HTTP_RETRY_BASE_DELAY_SECONDS", "0.1"),
+                "HTTP_RETRY_BASE_DELAY_SECONDS",
+            ),
+            http_retry_max_delay_seconds=_parse_positive_float(
+                values.get("HTTP_RETRY_MAX_DELAY_SECONDS", "5"), "HTTP_RETRY_MAX_DELAY_SECONDS"
+            ),
+            http_retry_budget_ratio=_parse_positive_float(
+                values.get("HTTP_RETRY_BUDGET_RATIO", "0.1"), "HTTP_RETRY_BUDGET_RATIO"
+            ),
+            http_retry_budget_min_per_second=_parse_positive_float(
+                values.get("HTTP_RETRY_BUDGET_MIN_PER_SECOND", "1"),
+                "HTTP_RETRY_BUDGET_MIN_PER_SECOND",
+            ),
+            http_hedging_enabled=_parse_bool(
+                values.get("HTTP_HEDGING_ENABLED", "false"), "HTTP_HEDGING_ENABLED"
+            ),
+            http_hedge_percentile=_parse_positive_float(
+                values.get("HTTP_HEDGE_PERCENTILE", "0.95"), "HTTP_HEDGE_PERCENTILE"
+            ),
+            http_hedge_budget_ratio=_parse_positive_float(
+                values.get("HTTP_HEDGE_BUDGET_RATIO", "0.05"), "HTTP_HEDGE_BUDGET_RATIO"
+            ),
+            http_hedge_operations=_parse_name_list(values.get("HTTP_HEDGE_OPERATIONS", "")),
+            http_circuit_breaker_enabled=_parse_bool(
+                values.get("HTTP_CIRCUIT_BREAKER_ENABLED", "false"), "HTTP_CIRCUIT_BREAKER_ENABLED"
+            ),
+            http_circuit_breaker_failure_rate=_parse_positive_float(
+                values.get("HTTP_CIRCUIT_BREAKER_FAILURE_RATE", "0.5"),
+                "HTTP_CIRCUIT_BREAKER_FAILURE_RATE",
+            ),
+            http_circuit_breaker_minimum_calls=_parse_positive_int(
+                values.get("HTTP_CIRCUIT_BREAKER_MINIMUM_CALLS", "20"),
+                "HTTP_CIRCUIT_BREAKER_MINIMUM_CALLS",
+            ),
+            http_circuit_breaker_window_seconds=_parse_positive_float(
+                values.get("HTTP_CIRCUIT_BREAKER_WINDOW_SECONDS", "30"),
+                "HTTP_CIRCUIT_BREAKER_WINDOW_SECONDS",
+            ),
+            http_circuit_breaker_open_seconds=_parse_positive_float(
+                values.get("HTTP_CIRCUIT_BREAKER_OPEN_SECONDS", "30"),
+                "HTTP_CIRCUIT_BREAKER_OPEN_SECONDS",
+            ),
+            http_load_balancing_enabled=_parse_bool(
+                values.get("HTTP_LOAD_BALANCING_ENABLED", "false"), "HTTP_LOAD_BALANCING_ENABLED"
+            ),
+            http_load_balancer_eject_failures=_parse_positive_int(
+                values.get("HTTP_LOAD_BALANCER_EJECT_FAILURES", "5"),
+                "HTTP_LOAD_BALANCER_EJECT_FAILURES",
+            ),
+            http_load_balancer_eject_seconds=_parse_positive_float(
+                values.get("HTTP_LOAD_BALANCER_EJECT_SECONDS", "30"),
+                "HTTP_LOAD_BALANCER_EJECT_SECONDS",
+            ),
+            http_rate_limit_pacing_enabled=_parse_bool(
+                values.get("HTTP_RATE_LIMIT_PACING_ENABLED", "false"),
+                "HTTP_RATE_LIMIT_PACING_ENABLED",
+            ),
+            http_rate_limits=_parse_origin_map(
+                values.get("HTTP_RATE_LIMITS", ""),
+                "HTTP_RATE_LIMITS",
+                _parse_positive_float,
+            ),
+            http_rate_limit_max_wait_seconds=_parse_positive_float(
+                values.get("HTTP_RATE_LIMIT_MAX_WAIT_SECONDS", "5"),
+                "HTTP_RATE_LIMIT_MAX_WAIT_SECONDS",
+            ),
+            http_max_queue_depth=_parse_non_negative_int(
+                values.get("HTTP_MAX_QUEUE_DEPTH", "0"), "HTTP_MAX_QUEUE_DEPTH"
+            ),
+            http_max_queue_wait_seconds=_parse_non_negative_float(
+                values.get("HTTP_MAX_QUEUE_WAIT_SECONDS", "0"), "HTTP_MAX_QUEUE_WAIT_SECONDS"
+            ),
+            http_fair_scheduling_enabled=_parse_bool(
+                values.get("HTTP_FAIR_SCHEDULING_ENABLED", "false"),
+                "HTTP_FAIR_SCHEDULING_ENABLED",
+            ),
+            http_scheduler_tag_classes=_parse_name_map(
+                values.get("HTTP_SCHEDULER_TAG_CLASSES", ""),
+                "HTTP_SCHEDULER_TAG_CLASSES",
+                _parse_class_name,
+            ),
+            http_scheduler_class_weights=_parse_name_map(
+                values.get("HTTP_SCHEDULER_CLASS_WEIGHTS", ""),
+                "HTTP_SCHEDULER_CLASS_WEIGHTS",
+                _parse_positive_int,
+            ),
+            http_timeout_seconds=_parse_positive_float(
+                values.get("HTTP_TIMEOUT_SECONDS", "10"), "HTTP_TIMEOUT_SECONDS"
+            ),
+            http_timeout_overrides=_parse_name_map(
+                values.get("HTTP_TIMEOUT_OVERRIDES", ""),
+                "HTTP_TIMEOUT_OVERRIDES",
+                _parse_operation_timeouts,
+            ),
+            http_deadline_header=values.get("HTTP_DEADLINE_HEADER", "X-Request-Timeout").strip(),
+            http_adaptive_timeouts_enabled=_parse_bool(
+                values.get("HTTP_ADAPTIVE_TIMEOUTS_ENABLED", "false"),
+                "HTTP_ADAPTIVE_TIMEOUTS_ENABLED",
+            ),
+            http_adaptive_timeout_percentile=_parse_positive_float(
+                values.get("HTTP_ADAPTIVE_TIMEOUT_PERCENTILE", "0.99"),
+                "HTTP_ADAPTIVE_TIMEOUT_PERCENTILE",
+            ),
+            http_adaptive_timeout_min_seconds=_parse_positive_float(
+                values.get("HTTP_ADAPTIVE_TIMEOUT_MIN_SECONDS", "0.1"),
+                "HTTP_ADAPTIVE_TIMEOUT_MIN_SECONDS",
+            ),
+            http_adaptive_timeout_max_seconds=_parse_positive_float(
+                values.get("HTTP_ADAPTIVE_TIMEOUT_MAX_SECONDS", "10"),
+                "HTTP_ADAPTIVE_TIMEOUT_MAX_SECONDS",
+            ),
+            http_warmup_connections=_parse_non_negative_int(
+                values.get("HTTP_WARMUP_CONNECTIONS", "0"), "HTTP_WARMUP_CONNECTIONS"
+            ),
+            http_warmup_timeout_seconds=_parse_positive_float(
+                values.get("HTTP_WARMUP_TIMEOUT_SECONDS", "5"), "HTTP_WARMUP_TIMEOUT_SECONDS"
+            ),
+            http_dns_cache_ttl_seconds=_parse_non_negative_float(
+                values.get("HTTP_DNS_CACHE_TTL_SECONDS", "0"), "HTTP_DNS_CACHE_TTL_SECONDS"
+            ),
+            http_uds_origins=_parse_origin_map(
+                values.get("HTTP_UDS_ORIGINS", ""), "HTTP_UDS_ORIGINS", _parse_socket_path
+            ),
+            http_asgi_origins=_parse_origin_map(
+                values.get("HTTP_ASGI_ORIGINS", ""), "HTTP_ASGI_ORIGINS", _parse_import_path
+            ),
+            http_auth_api_keys=_parse_name_map(
+                values.get("HTTP_AUTH_API_KEYS", ""), "HTTP_AUTH_API_KEYS", _parse_secret
+            ),
+            http_auth_oauth2_clients=_parse_name_map(
+                values.get("HTTP_AUTH_OAUTH2_CLIENTS", ""),
+                "HTTP_AUTH_OAUTH2_CLIENTS",
+                _parse_client_credentials,
+            ),
+            http_auth_refresh_ahead_seconds=_parse_non_negative_float(
+                values.get("HTTP_AUTH_REFRESH_AHEAD_SECONDS", "60"),
+                "HTTP_AUTH_REFRESH_AHEAD_SECONDS",
+            ),
+            http_pagination_max_pages=_parse_positive_int(
+                values.get("HTTP_PAGINATION_MAX_PAGES", "10"), "HTTP_PAGINATION_MAX_PAGES"
+            ),
+            http_pagination_max_items=_parse_positive_int(
+                values.get("HTTP_PAGINATION_MAX_ITEMS", "1000"), "HTTP_PAGINATION_MAX_ITEMS"
+            ),
+            http_pagination_max_bytes=_parse_non_negative_int(
+                values.get("HTTP_PAGINATION_MAX_BYTES", "0"), "HTTP_PAGINATION_MAX_BYTES"
+            ),
+            http_pagination_concurrency=_parse_positive_int(
+                values.get("HTTP_PAGINATION_CONCURRENCY", "4"), "HTTP_PAGINATION_CONCURRENCY"
+            ),
             telemetry_otlp_protocol=telemetry_protocol,
             telemetry_otlp_endpoint=telemetry_endpoint,
             telemetry_export_interval_ms=_parse_positive_int(
@@ -97,6 +388,41 @@ class Settings:
             raise ConfigurationError(
                 "HTTP_MAX_KEEPALIVE_CONNECTIONS must be <= HTTP_MAX_CONNECTIONS."
             )
+        for origin, (max_connections, max_keepalive) in self.http_pool_origin_limits.items():
+            if max_keepalive > max_connections:
+                raise ConfigurationError(
+                    f"HTTP_POOL_ORIGIN_LIMITS keepalive must be <= connections for {origin}."
+                )
+        if not (
+            self.http_adaptive_concurrency_min_limit
+            <= self.http_adaptive_concurrency_initial_limit
+            <= self.http_adaptive_concurrency_max_limit
+        ):
+            raise ConfigurationError(
+                "HTTP_ADAPTIVE_CONCURRENCY limits must satisfy MIN <= INITIAL <= MAX."
+            )
+        if self.http_retry_base_delay_seconds > self.http_retry_max_delay_seconds:
+            raise ConfigurationError(
+                "HTTP_RETRY_BASE_DELAY_SECONDS must be <= HTTP_RETRY_MAX_DELAY_SECONDS."
+            )
+        if self.http_hedge_percentile >= 1.0:
+            raise ConfigurationError("HTTP_HEDGE_PERCENTILE must be in range (0, 1).")
+        if self.http_circuit_breaker_failure_rate > 1.0:
+            raise ConfigurationError("HTTP_CIRCUIT_BREAKER_FAILURE_RATE must be in range (0, 1].")
+        if self.http_adaptive_timeout_percentile >= 1.0:
+            raise ConfigurationError("HTTP_ADAPTIVE_TIMEOUT_PERCENTILE must be in range (0, 1).")
+        if self.http_adaptive_timeout_min_seconds > self.http_adaptive_timeout_max_seconds:
+            raise ConfigurationError(
+                "HTTP_ADAPTIVE_TIMEOUT_MIN_SECONDS must be <= HTTP_ADAPTIVE_TIMEOUT_MAX_SECONDS."
+            )
+        for origin in self.http_uds_origins:
+            if origin in self.http_asgi_origins:
+                raise ConfigurationError(
+                    f"{origin} cannot be in both HTTP_UDS_ORIGINS and HTTP_ASGI_ORIGINS."
+                )
+        if self.json_codec not in _ALLOWED_JSON_CODECS:
+            allowed = ", ".join(sorted(_ALLOWED_JSON_CODECS))
+            raise ConfigurationError(f"JSON_CODEC must be one of: {allowed}.")
         if self.telemetry_otlp_protocol not in _ALLOWED_TELEMETRY_PROTOCOLS:
             allowed = ", ".join(sorted(_ALLOWED_TELEMETRY_PROTOCOLS))
             raise ConfigurationError(
@@ -148,6 +474,153 @@ def _parse_non_negative_int(value: str, field_name: str) -> int:
     return parsed
 
 
+def _parse_positive_float(value: str, field_name: str) -> float:
+    try:
+        parsed = float(value)
+    except ValueError as exc:
+        raise ConfigurationError(f"{field_name} must be a number.") from exc
+    if parsed <= 0:
+        raise ConfigurationError(f"{field_name} must be > 0.")
+    return parsed
+
+
+def _parse_non_negative_float(value: str, field_name: str) -> float:
+    try:
+        parsed = float(value)
+    except ValueError as exc:
+        raise ConfigurationError(f"{field_name} must be a number.") from exc
+    if parsed < 0:
+        raise ConfigurationError(f"{field_name} must be >= 0.")
+    return parsed
+
+
+def _parse_origin_list(value: str, field_name: str) -> Tuple[str, ...]:
+    origins = []
+    for entry in value.split(","):
+        origin = entry.strip()
+        if not origin:
+            continue
+        _require_origin(origin, field_name)
+        origins.append(origin)
+    return tuple(origins)
+
+
+def _parse_name_list(value: str) -> Tuple[str, ...]:
+    return tuple(dict.fromkeys(name.strip() for name in value.split(",") if name.strip()))
+
+
+def _parse_header_list(value: str) -> Tuple[str, ...]:
+    return tuple(
+        dict.fromkeys(name.strip().lower() for name in value.split(",") if name.strip())
+    )
+
+
+def _parse_origin_map(
+    value: str,
+    field_name: str,
+    parse_value: Callable[[str, str], _T],
+) -> Dict[str, _T]:
+    """Parse `origin=value` pairs separated by commas."""
+    parsed: Dict[str, _T] = {}
+    for entry in value.split(","):
+        entry = entry.strip()
+        if not entry:
+            continue
+        origin, separator, raw_value = entry.rpartition("=")
+        origin = origin.strip()
+        if not separator:
+            raise ConfigurationError(
+                f"{field_name} entries must use the form <scheme://host[:port]>=<value>."
+            )
+        _require_origin(origin, field_name)
+        parsed[origin] = parse_value(raw_value.strip(), field_name)
+    return parsed
+
+
+def _parse_name_map(
+    value: str,
+    field_name: str,
+    parse_value: Callable[[str, str], _T],
+) -> Dict[str, _T]:
+    """Parse `name=value` pairs separated by commas, keyed by tool name."""
+    parsed: Dict[str, _T] = {}
+    for entry in value.split(","):
+        entry = entry.strip()
+        if not entry:
+            continue
+        name, separator, raw_value = entry.partition("=")
+        name = name.strip()
+        if not separator or not name:
+            raise ConfigurationError(f"{field_name} entries must use the form <name>=<value>.")
+        parsed[name] = parse_value(raw_value.strip(), field_name)
+    return parsed
+
+
+def _parse_class_name(value: str, field_name: str) -> str:
+    if not value:
+        raise ConfigurationError(f"{field_name} entries must name a scheduling class.")
+    return value
+
+
+def _parse_socket_path(value: str, field_name: str) -> str:
+    if not value:
+        raise ConfigurationError(f"{field_name} entries must name a socket path.")
+    return value
+
+
+def _parse_import_path(value: str, field_name: str) -> str:
+    module, separator, attribute = value.partition(":")
+    if not separator or not module.strip() or not attribute.strip():
+        raise ConfigurationError(f"{field_name} values must use the form <module>:<attribute>.")
+    return value
+
+
+def _parse_secret(value: str, field_name: str) -> str:
+    if not value:
+        raise ConfigurationError(f"{field_name} entries must have a non-empty value.")
+    return value
+
+
+def _parse_client_credentials(value: str, field_name: str) -> Tuple[str, str]:
+    client_id, separator, client_secret = value.partition(":")
+    if not separator or not client_id or not client_secret:
+        raise ConfigurationError(
+            f"{field_name} values must use the form <client_id>:<client_secret>."
+        )
+    return client_id, client_secret
+
+
+def _require_origin(origin: str, field_name: str) -> None:
+    parts = urlsplit(origin)
+    if not parts.scheme or not parts.netloc:
+        raise ConfigurationError(
+            f"{field_name} origins must be absolute URLs (scheme://host[:port])."
+        )
+
+
+def _parse_connection_limits(value: str, field_name: str) -> Tuple[int, int]:
+    max_connections_text, _, max_keepalive_text = value.partition(":")
+    max_connections = _parse_positive_int(max_connections_text, field_name)
+    if not max_keepalive_text:
+        return (max_connections, max_connections)
+    return (max_connections, _parse_non_negative_int(max_keepalive_text, field_name))
+
+
+def _parse_operation_timeouts(value: str, field_name: str) -> OperationTimeouts:
+    """Parse `<total>` or `<connect>:<read>:<total>`; empty parts keep the default."""
+    parts = value.split(":")
+    if len(parts) == 1:
+        return OperationTimeouts(total=_parse_positive_float(value, field_name))
+    if len(parts) != 3:
+        raise ConfigurationError(
+            f"{field_name} values must use the form <total> or <connect>:<read>:<total>."
+        )
+    connect, read, total = (
+        _parse_positive_float(part, field_name) if part.strip() else None for part in parts
+    )
+    return OperationTimeouts(connect=connect, read=read, total=total)
+
+
 def _parse_non_empty_string(value: str, field_name: str) -> str:
     text = value.strip()
     if not text:
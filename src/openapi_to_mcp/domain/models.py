@@ -2,8 +2,16 @@
 
 from __future__ import annotations
 
+import itertools
+import math
+import re
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+_PATH_PLACEHOLDER = re.compile(r"\{([^{}]+)\}")
+# Upper bound on precomputed server URL variants per tool; larger products are not selectable.
+MAX_SERVER_VARIANTS = 256
+_PAGINATION_STYLES = frozenset({"cursor", "link", "offset"})
 
 
 @dataclass(frozen=True)
@@ -18,6 +26,277 @@ class ApiOperation:
     request_body_schema: Optional[Dict[str, Any]]
     request_body_required: bool
     server_url: Optional[str]
+    extensions: Dict[str, Any] = field(default_factory=dict)
+    server_urls: List[str] = field(default_factory=list)
+    server_template: Optional[str] = None
+    server_variables: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    tags: List[str] = field(default_factory=list)
+    security: List[List[Dict[str, Any]]] = field(default_factory=list)
+
+
+@dataclass(frozen=True, slots=True)
+class SecurityRequirement:
+    """One resolved security scheme an upstream call must satisfy.
+
+    `kind` is `apiKey` (sent as `name` in `location`: header, query, or
+    cookie) or `oauth2` (a client-credentials token from `token_url`).
+    """
+
+    scheme: str
+    kind: str
+    location: str = "header"
+    name: str = ""
+    token_url: str = ""
+    scopes: Tuple[str, ...] = ()
+
+    @classmethod
+    def from_mapping(cls, value: Mapping[str, Any]) -> "SecurityRequirement":
+        return cls(
+            scheme=str(value.get("scheme", "")),
+            kind=str(value.get("type", "")),
+            location=str(value.get("in", "header")),
+            name=str(value.get("name", "")),
+            token_url=str(value.get("token_url", "")),
+            scopes=tuple(str(scope) for scope in value.get("scopes", ())),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class OperationTimeouts:
+    """Upstream timeouts in seconds for one operation; None keeps the default.
+
+    `connect` and `read` bound each attempt, while `total` bounds the whole
+    call including queueing, retries, and hedges.
+    """
+
+    connect: Optional[float] = None
+    read: Optional[float] = None
+    total: Optional[float] = None
+
+    @classmethod
+    def from_mapping(cls, value: Any) -> Optional["OperationTimeouts"]:
+        if not isinstance(value, Mapping):
+            return None
+        timeouts = cls(
+            connect=_positive_seconds(value.get("connect")),
+            read=_positive_seconds(value.get("read")),
+            total=_positive_seconds(value.get("total")),
+        )
+        return None if timeouts == cls() else timeouts
+
+    def merged(self, override: "OperationTimeouts") -> "OperationTimeouts":
+        """Return these timeouts with every value set in `override` replacing ours."""
+        return OperationTimeouts(
+            connect=self.connect if override.connect is None else override.connect,
+            read=self.read if override.read is None else override.read,
+            total=self.total if override.total is None else override.total,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class Pagination:
+    """How to follow the pages of a list operation, declared with `x-mcp-pagination`.
+
+    `style` is `cursor` (send the body value at `next_cursor` back as the
+    `cursor_param` query parameter), `link` (follow `Link: rel="next"`), or
+    `offset` (advance `offset_param` by the page size). `items` is the dotted
+    path to the item array; empty means the body is the array. Limits of `0`
+    keep the invoker defaults.
+    """
+
+    style: str
+    items: str = ""
+    cursor_param: str = ""
+    next_cursor: str = ""
+    offset_param: str = "offset"
+    limit_param: str = "limit"
+    page_size: int = 0
+    max_pages: int = 0
+    max_items: int = 0
+    max_bytes: int = 0
+
+    @classmethod
+    def from_mapping(cls, value: Any) -> Optional["Pagination"]:
+        if not isinstance(value, Mapping) or value.get("style") not in _PAGINATION_STYLES:
+            return None
+        pagination = cls(
+            style=str(value["style"]),
+            items=str(value.get("items") or ""),
+            cursor_param=str(value.get("cursor_param") or ""),
+            next_cursor=str(value.get("next_cursor") or ""),
+            offset_param=str(value.get("offset_param") or "offset"),
+            limit_param=str(value.get("limit_param") or "limit"),
+            page_size=_non_negative_count(value.get("page_size")),
+            max_pages=_non_negative_count(value.get("max_pages")),
+            max_items=_non_negative_count(value.get("max_items")),
+            max_bytes=_non_negative_count(value.get("max_bytes")),
+        )
+        if pagination.style == "cursor" and not (
+            pagination.cursor_param and pagination.next_cursor
+        ):
+            return None
+        return pagination
+
+
+@dataclass(frozen=True, slots=True)
+class InvocationPlan:
+    """Precompiled, immutable invocation instructions for one tool.
+
+    `path_literals` and `path_placeholders` interleave the path template:
+    literal 0, placeholder 0, literal 1, and so on. `base_url` is the URL
+    prefix joined with the rendered path; it is empty for absolute paths and
+    None when no server URL is available. `base_urls` lists every declared
+    server prefix, starting with `base_url`, when there is more than one.
+    `server_arguments` pairs each selectable server variable argument with
+    its default, and `server_variants` maps selected values to base URLs.
+    `timeouts` holds timeouts declared for the operation, if any.
+    `security` lists alternative sets of requirements in spec order; an
+    empty set means the call may also be sent without credentials.
+    `pagination` is set when the invoker should follow and merge pages.
+    `projection_argument` names the tool argument listing the response
+    fields to keep, when the tool has one.
+    """
+
+    tool_name: str
+    method: str
+    path: str
+    base_url: Optional[str]
+    absolute_path: bool
+    path_literals: Tuple[str, ...]
+    path_placeholders: Tuple[str, ...]
+    path_params: Tuple[str, ...]
+    query_params: Tuple[str, ...]
+    header_params: Tuple[str, ...]
+    cacheable: bool = False
+    idempotent: bool = False
+    passthrough: Optional[bool] = None
+    base_urls: Tuple[str, ...] = ()
+    server_arguments: Tuple[Tuple[str, str], ...] = ()
+    server_variants: Mapping[Tuple[str, ...], str] = field(
+        default_factory=dict, hash=False, compare=False
+    )
+    tags: Tuple[str, ...] = ()
+    timeouts: Optional[OperationTimeouts] = None
+    security: Tuple[Tuple[SecurityRequirement, ...], ...] = ()
+    pagination: Optional[Pagination] = None
+    projection_argument: Optional[str] = None
+
+    @property
+    def upstream_urls(self) -> Tuple[str, ...]:
+        """Every URL prefix this plan may call, used to warm upstream connections."""
+        if self.absolute_path:
+            return (self.path,)
+        if self.base_url is None:
+            return ()
+        return tuple(
+            dict.fromkeys([self.base_url, *self.base_urls, *self.server_variants.values()])
+        )
+
+    @classmethod
+    def from_binding(cls, binding: Mapping[str, Any]) -> "InvocationPlan":
+        method = str(binding.get("method", "")).upper()
+        path = str(binding.get("path", ""))
+        server_url = str(binding.get("server_url") or "").strip()
+        path_params = tuple(binding.get("path_params", []))
+
+        literals: List[str] = []
+        placeholders: List[str] = []
+        cursor = 0
+        for match in _PATH_PLACEHOLDER.finditer(path):
+            if match.group(1) not in path_params:
+                continue
+            literals.append(path[cursor : match.start()])
+            placeholders.append(match.group(1))
+            cursor = match.end()
+        literals.append(path[cursor:])
+
+        absolute_path = path.startswith("http://") or path.startswith("https://")
+        base_url: Optional[str]
+        base_urls: Tuple[str, ...] = ()
+        server_arguments: Tuple[Tuple[str, str], ...] = ()
+        server_variants: Dict[Tuple[str, ...], str] = {}
+        if absolute_path:
+            base_url = ""
+        elif server_url:
+            base_url = server_url.rstrip("/")
+            alternates = [
+                str(url).strip().rstrip("/") for url in binding.get("server_urls") or ()
+            ]
+            if len(alternates) > 1:
+                base_urls = tuple(dict.fromkeys([base_url, *alternates]))
+            server_arguments, server_variants = _server_variants(binding)
+        else:
+            base_url = None
+
+        return cls(
+            tool_name=str(binding.get("tool_name") or f"{method} {path}"),
+            method=method,
+            path=path,
+            base_url=base_url,
+            absolute_path=absolute_path,
+            path_literals=tuple(literals),
+            path_placeholders=tuple(placeholders),
+            path_params=path_params,
+            query_params=tuple(binding.get("query_params", [])),
+            header_params=tuple(binding.get("header_params", [])),
+            cacheable=bool(binding.get("cacheable", False)),
+            idempotent=bool(binding.get("idempotent", False)),
+            passthrough=binding.get("passthrough"),
+            base_urls=base_urls,
+            server_arguments=server_arguments,
+            server_variants=server_variants,
+            tags=tuple(binding.get("tags", [])),
+            timeouts=OperationTimeouts.from_mapping(binding.get("timeouts")),
+            security=tuple(
+                tuple(SecurityRequirement.from_mapping(entry) for entry in alternative)
+                for alternative in binding.get("security") or ()
+            ),
+            pagination=Pagination.from_mapping(binding.get("pagination")),
+            projection_argument=binding.get("projection_argument"),
+        )
+
+
+def _server_variants(
+    binding: Mapping[str, Any],
+) -> Tuple[Tuple[Tuple[str, str], ...], Dict[Tuple[str, ...], str]]:
+    """Precompute the base URL for every combination of selectable server variables."""
+    template = binding.get("server_template")
+    variables = binding.get("server_variables") or {}
+    if not isinstance(template, str) or not variables:
+        return (), {}
+    names = list(variables)
+    choices = [[str(value) for value in variables[name]["enum"]] for name in names]
+    if any(not values for values in choices) or (
+        math.prod(len(values) for values in choices) > MAX_SERVER_VARIANTS
+    ):
+        return (), {}
+
+    # `split` alternates literal text and variable names: even indexes are literals.
+    parts = _PATH_PLACEHOLDER.split(template)
+    variants: Dict[Tuple[str, ...], str] = {}
+    for selection in itertools.product(*choices):
+        values = dict(zip(names, selection, strict=True))
+        url = "".join(
+            part if index % 2 == 0 else values.get(part, f"{{{part}}}")
+            for index, part in enumerate(parts)
+        )
+        variants[selection] = url.strip().rstrip("/")
+    arguments = tuple(
+        (str(variables[name]["argument"]), str(variables[name]["default"])) for name in names
+    )
+    return arguments, variants
+
+
+def _positive_seconds(value: Any) -> Optional[float]:
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or value <= 0:
+        return None
+    return float(value)
+
+
+def _non_negative_count(value: Any) -> int:
+    if isinstance(value, bool) or not isinstance(value, int) or value < 0:
+        return 0
+    return value
 
 
 @dataclass(frozen=True)
@@ -28,6 +307,7 @@ class GeneratedTool:
     description: str
     input_schema: Dict[str, Any]
     binding: Dict[str, Any]
+    plan: Optional[InvocationPlan] = None
 
 
 @dataclass
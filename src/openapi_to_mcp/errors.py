@@ -23,3 +23,23 @@ class InvocationError(OpenApiToMcpError):
 
 class ToolRegistrationError(OpenApiToMcpError):
     """Raised when MCP tool registration fails."""
+
+
+class CircuitOpenError(InvocationError):
+    """Raised when a circuit breaker rejects a call to a failing upstream."""
+
+
+class OverloadedError(InvocationError):
+    """Raised when the invoker sheds a call instead of queueing it; safe to retry."""
+
+    def __init__(self, message: str, retry_after_seconds: float = 1.0) -> None:
+        super().__init__(message)
+        self.retry_after_seconds = retry_after_seconds
+
+
+class RateLimitedError(OverloadedError):
+    """Raised when local pacing for an upstream would wait longer than allowed."""
+
+
+class DeadlineExceededError(InvocationError):
+    """Raised when a call outlives the caller deadline or its total timeout."""
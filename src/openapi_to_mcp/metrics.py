@@ -9,6 +9,9 @@ from opentelemetry.metrics import Observation
 
 from openapi_to_mcp.telemetry import build_telemetry_runtime
 
+# Gauge values for circuit breaker states.
+_CIRCUIT_STATE_VALUES = {"closed": 0, "half_open": 1, "open": 2}
+
 _HTTP_SERVER_DURATION_BUCKETS = (
     0.005,
     0.01,
@@ -45,6 +48,10 @@ class RuntimeMetrics:
         self._in_flight_value = 0
         self._max_in_flight_value = max_in_flight
         self._max_connections_value = max_connections
+        self._open_connections_by_origin: dict[str, int] = {}
+        self._concurrency_limits: dict[tuple[str, str], int] = {}
+        self._circuit_states: dict[tuple[str, str], str] = {}
+        self._operation_timeouts: dict[str, float] = {}
         self._prometheus_metrics_enabled = prometheus_metrics_enabled
 
         telemetry = build_telemetry_runtime(
@@ -81,6 +88,119 @@ class RuntimeMetrics:
             unit="seconds",
             description="Seconds spent waiting for an outbound HTTP slot.",
         )
+        self._otlp_partition_queue_wait = meter.create_histogram(
+            "openapi_to_mcp.http_invoker.partition.queue_wait",
+            unit="seconds",
+            description="Seconds spent waiting for a per-origin or per-operation slot.",
+        )
+        self._otlp_partition_in_flight = meter.create_up_down_counter(
+            "openapi_to_mcp.http_invoker.partition.in_flight",
+            unit="requests",
+            description="Current in-flight outbound HTTP invocations per partition.",
+        )
+        self._otlp_partition_concurrency_limit = meter.create_observable_gauge(
+            "openapi_to_mcp.http_invoker.partition.concurrency_limit",
+            callbacks=[self._observe_concurrency_limits],
+            unit="requests",
+            description="Current adaptive in-flight limit per partition.",
+        )
+        self._otlp_response_cache_lookups = meter.create_counter(
+            "openapi_to_mcp.http_invoker.response_cache.lookups",
+            unit="lookups",
+            description="Response cache lookups by result (hit, miss, revalidated).",
+        )
+        self._otlp_response_cache_evictions = meter.create_counter(
+            "openapi_to_mcp.http_invoker.response_cache.evictions",
+            unit="entries",
+            description="Response cache entries evicted to stay within the byte budget.",
+        )
+        self._otlp_invoker_response_size = meter.create_histogram(
+            "openapi_to_mcp.http_invoker.response_size",
+            unit="bytes",
+            description="Decoded upstream response body size read by the invoker.",
+        )
+        self._otlp_invoker_retries = meter.create_counter(
+            "openapi_to_mcp.http_invoker.retries",
+            unit="requests",
+            description="Outbound HTTP retries by upstream origin and reason.",
+        )
+        self._otlp_invoker_retry_budget_exhausted = meter.create_counter(
+            "openapi_to_mcp.http_invoker.retry_budget_exhausted",
+            unit="requests",
+            description="Retries skipped because the upstream retry budget was empty.",
+        )
+        self._otlp_connection_pool_warmed = meter.create_counter(
+            "openapi_to_mcp.http_invoker.connection_pool.warmed",
+            unit="connections",
+            description="Upstream keep-alive connections opened during startup warm-up.",
+        )
+        self._otlp_dns_cache_lookups = meter.create_counter(
+            "openapi_to_mcp.http_invoker.dns_cache.lookups",
+            unit="lookups",
+            description="Upstream DNS cache lookups by result (hit, miss).",
+        )
+        self._otlp_pagination_pages = meter.create_histogram(
+            "openapi_to_mcp.http_invoker.pagination.pages",
+            unit="pages",
+            description="Pages merged per paginated tool call, by style and completeness.",
+        )
+        self._otlp_token_refreshes = meter.create_counter(
+            "openapi_to_mcp.http_invoker.auth.token_refreshes",
+            unit="requests",
+            description="OAuth2 token requests by scheme, mode (blocking, ahead), and result.",
+        )
+        self._otlp_operation_timeout = meter.create_observable_gauge(
+            "openapi_to_mcp.http_invoker.operation.timeout",
+            callbacks=[self._observe_operation_timeouts],
+            unit="seconds",
+            description="Current learned upstream timeout per operation.",
+        )
+        self._otlp_deadline_exceeded = meter.create_counter(
+            "openapi_to_mcp.http_invoker.deadline_exceeded",
+            unit="requests",
+            description="Calls abandoned because the caller deadline or total timeout passed.",
+        )
+        self._otlp_scheduler_wait = meter.create_histogram(
+            "openapi_to_mcp.http_invoker.scheduler.wait",
+            unit="seconds",
+            description="Time calls waited in the fair scheduler for an outbound slot.",
+        )
+        self._otlp_load_shed = meter.create_counter(
+            "openapi_to_mcp.http_invoker.load_shed",
+            unit="requests",
+            description="Calls rejected by admission control before queueing, by reason.",
+        )
+        self._otlp_rate_limit_wait = meter.create_histogram(
+            "openapi_to_mcp.http_invoker.rate_limit.wait",
+            unit="seconds",
+            description="Time outbound calls were held locally to respect upstream rate limits.",
+        )
+        self._otlp_load_balancer_ejections = meter.create_counter(
+            "openapi_to_mcp.http_invoker.load_balancer.ejections",
+            unit="endpoints",
+            description="Upstream servers ejected from load balancing after repeated failures.",
+        )
+        self._otlp_invoker_hedges = meter.create_counter(
+            "openapi_to_mcp.http_invoker.hedges",
+            unit="requests",
+            description="Hedged outbound HTTP calls by winning attempt (primary, hedge, failed).",
+        )
+        self._otlp_circuit_state = meter.create_observable_gauge(
+            "openapi_to_mcp.http_invoker.circuit_breaker.state",
+            callbacks=[self._observe_circuit_states],
+            unit="state",
+            description="Circuit breaker state per partition (0 closed, 1 half-open, 2 open).",
+        )
+        self._otlp_circuit_rejections = meter.create_counter(
+            "openapi_to_mcp.http_invoker.circuit_breaker.rejections",
+            unit="requests",
+            description="Calls rejected without reaching the upstream by an open breaker.",
+        )
+        self._otlp_invoker_coalesced = meter.create_counter(
+            "openapi_to_mcp.http_invoker.coalesced",
+            unit="requests",
+            description="Invocations served by joining an identical in-flight request.",
+        )
         self._otlp_invoker_max_in_flight = meter.create_observable_gauge(
             "openapi_to_mcp.http_invoker.max_in_flight",
             callbacks=[self._observe_max_in_flight],
@@ -93,6 +213,17 @@ class RuntimeMetrics:
             unit="connections",
             description="Configured max outbound HTTP connection pool size.",
         )
+        self._otlp_pool_streams_per_connection = meter.create_histogram(
+            "openapi_to_mcp.http_connection_pool.streams_per_connection",
+            unit="streams",
+            description="Concurrent outbound requests per open upstream connection.",
+        )
+        self._otlp_pool_open_connections = meter.create_observable_gauge(
+            "openapi_to_mcp.http_connection_pool.open_connections",
+            callbacks=[self._observe_open_connections],
+            unit="connections",
+            description="Open upstream connections per origin.",
+        )
         self._otlp_invoker_utilization = meter.create_observable_gauge(
             "openapi_to_mcp.http_invoker.utilization",
             callbacks=[self._observe_invoker_utilization],
@@ -134,6 +265,120 @@ class RuntimeMetrics:
         if decremented:
             self._otlp_invoker_in_flight.add(-1)
 
+    def on_partition_acquired(self, *, kind: str, key: str, wait_seconds: float) -> None:
+        attributes = {"partition.kind": kind, "partition.key": key}
+        self._otlp_partition_queue_wait.record(max(wait_seconds, 0.0), attributes=attributes)
+        self._otlp_partition_in_flight.add(1, attributes=attributes)
+
+    def on_partition_released(self, *, kind: str, key: str) -> None:
+        self._otlp_partition_in_flight.add(
+            -1, attributes={"partition.kind": kind, "partition.key": key}
+        )
+
+    def on_response_cache_lookup(self, result: str) -> None:
+        self._otlp_response_cache_lookups.add(1, attributes={"cache.result": result})
+
+    def on_response_cache_eviction(self) -> None:
+        self._otlp_response_cache_evictions.add(1)
+
+    def on_response_received(self, *, size_bytes: int, truncated: bool) -> None:
+        self._otlp_invoker_response_size.record(
+            size_bytes, attributes={"response.truncated": truncated}
+        )
+
+    def on_retry(self, *, origin: str, reason: str) -> None:
+        self._otlp_invoker_retries.add(
+            1, attributes={"upstream.origin": origin, "retry.reason": reason}
+        )
+
+    def on_retry_budget_exhausted(self, *, origin: str) -> None:
+        self._otlp_invoker_retry_budget_exhausted.add(1, attributes={"upstream.origin": origin})
+
+    def on_deadline_exceeded(self) -> None:
+        self._otlp_deadline_exceeded.add(1)
+
+    def on_scheduler_wait(self, *, scheduling_class: str, wait_seconds: float) -> None:
+        self._otlp_scheduler_wait.record(
+            wait_seconds, attributes={"scheduler.class": scheduling_class}
+        )
+
+    def on_load_shed(self, *, reason: str) -> None:
+        self._otlp_load_shed.add(1, attributes={"shed.reason": reason})
+
+    def on_rate_limit_wait(self, *, origin: str, wait_seconds: float) -> None:
+        self._otlp_rate_limit_wait.record(wait_seconds, attributes={"upstream.origin": origin})
+
+    def on_endpoint_ejected(self, *, origin: str) -> None:
+        self._otlp_load_balancer_ejections.add(1, attributes={"upstream.origin": origin})
+
+    def on_hedge(self, *, winner: str) -> None:
+        self._otlp_invoker_hedges.add(1, attributes={"hedge.winner": winner})
+
+    def set_circuit_state(self, *, kind: str, key: str, state: str) -> None:
+        with self._lock:
+            self._circuit_states[(kind, key)] = state
+
+    def on_circuit_rejected(self, *, kind: str, key: str) -> None:
+        self._otlp_circuit_rejections.add(
+            1, attributes={"partition.kind": kind, "partition.key": key}
+        )
+
+    def on_invocation_coalesced(self) -> None:
+        self._otlp_invoker_coalesced.add(1)
+
+    def set_operation_timeout(self, *, operation: str, timeout_seconds: float) -> None:
+        with self._lock:
+            self._operation_timeouts[operation] = timeout_seconds
+
+    def set_concurrency_limit(self, *, kind: str, key: str, limit: int) -> None:
+        with self._lock:
+            self._concurrency_limits[(kind, key)] = limit
+
+    def on_connection_pool_leased(
+        self,
+        *,
+        origin: str,
+        protocol_version: str,
+        active_streams: int,
+        open_connections: int,
+    ) -> None:
+        with self._lock:
+            self._open_connections_by_origin[origin] = open_connections
+        if open_connections <= 0:
+            return
+        self._otlp_pool_streams_per_connection.record(
+            float(active_streams) / float(open_connections),
+            attributes={
+                "upstream.origin": origin,
+                "network.protocol.version": protocol_version,
+            },
+        )
+
+    def on_connection_pool_warmed(self, *, origin: str, connections: int) -> None:
+        self._otlp_connection_pool_warmed.add(connections, attributes={"upstream.origin": origin})
+
+    def on_dns_cache_lookup(self, result: str) -> None:
+        self._otlp_dns_cache_lookups.add(1, attributes={"cache.result": result})
+
+    def on_pagination_completed(self, *, style: str, pages: int, complete: bool) -> None:
+        self._otlp_pagination_pages.record(
+            pages, attributes={"pagination.style": style, "pagination.complete": complete}
+        )
+
+    def on_token_refresh(self, *, scheme: str, mode: str, failed: bool) -> None:
+        self._otlp_token_refreshes.add(
+            1,
+            attributes={
+                "auth.scheme": scheme,
+                "refresh.mode": mode,
+                "refresh.result": "error" if failed else "ok",
+            },
+        )
+
+    def on_connection_pool_closed(self, origin: str) -> None:
+        with self._lock:
+            self._open_connections_by_origin.pop(origin, None)
+
     def on_http_request_completed(
         self,
         *,
@@ -185,6 +430,47 @@ class RuntimeMetrics:
         del options
         return [Observation(float(self._max_connections_value))]
 
+    def _observe_concurrency_limits(self, options: Any) -> list[Observation]:
+        del options
+        with self._lock:
+            snapshot = dict(self._concurrency_limits)
+        return [
+            Observation(float(limit), attributes={"partition.kind": kind, "partition.key": key})
+            for (kind, key), limit in snapshot.items()
+        ]
+
+    def _observe_circuit_states(self, options: Any) -> list[Observation]:
+        del options
+        with self._lock:
+            snapshot = dict(self._circuit_states)
+        return [
+            Observation(
+                float(_CIRCUIT_STATE_VALUES.get(state, 0)),
+                attributes={"partition.kind": kind, "partition.key": key},
+            )
+            for (kind, key), state in snapshot.items()
+        ]
+
+    def _observe_operation_timeouts(self, options: Any) -> list[Observation]:
+        del options
+        with self._lock:
+            snapshot = dict(self._operation_timeouts)
+        return [
+            Observation(
+                timeout, attributes={"partition.kind": "operation", "partition.key": operation}
+            )
+            for operation, timeout in snapshot.items()
+        ]
+
+    def _observe_open_connections(self, options: Any) -> list[Observation]:
+        del options
+        with self._lock:
+            snapshot = dict(self._open_connections_by_origin)
+        return [
+            Observation(float(count), attributes={"upstream.origin": origin})
+            for origin, count in snapshot.items()
+        ]
+
     def _observe_invoker_utilization(self, options: Any) -> list[Observation]:
         del options
         with self._lock:
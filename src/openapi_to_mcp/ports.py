@@ -5,6 +5,8 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Protocol
 
+from openapi_to_mcp.domain.models import InvocationPlan
+
 
 @dataclass(frozen=True)
 class OpenApiValidationResult:
@@ -31,5 +33,7 @@ class OpenApiValidatorPort(Protocol):
 class HttpInvokerPort(Protocol):
     """Port for invoking downstream REST endpoints."""
 
-    async def invoke(self, binding: Dict[str, Any], payload: Dict[str, Any]) -> Dict[str, Any]:
+    async def invoke(
+        self, binding: Dict[str, Any] | InvocationPlan, payload: Dict[str, Any]
+    ) -> Dict[str, Any]:
         """Invoke a downstream operation and return normalized response payload."""
@@ -0,0 +1,65 @@
+"""Per-request values carried from the transport to outbound adapters."""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import monotonic
+from typing import Iterator, Mapping
+
+SESSION_HEADER = "mcp-session-id"
+ANONYMOUS_SESSION = "anonymous"
+# Seconds the caller is willing to wait; also forwarded upstream by the invoker.
+DEADLINE_HEADER = "x-request-timeout"
+
+_session_id: ContextVar[str] = ContextVar("openapi_to_mcp_session_id", default=ANONYMOUS_SESSION)
+_deadline: ContextVar[float | None] = ContextVar("openapi_to_mcp_deadline", default=None)
+
+
+def current_session_id() -> str:
+    return _session_id.get()
+
+
+def bind_session_id(session_id: str | None) -> object:
+    """Set the session for the current context; pass the token to `reset_session_id`."""
+    return _session_id.set(session_id or ANONYMOUS_SESSION)
+
+
+def reset_session_id(token: object) -> None:
+    _session_id.reset(token)  # type: ignore[arg-type]
+
+
+def current_deadline() -> float | None:
+    """Monotonic time by which the caller needs an answer, if it set one."""
+    return _deadline.get()
+
+
+def bind_deadline(timeout: str | float | None) -> object:
+    """Start the caller deadline from a timeout in seconds; invalid values mean none."""
+    try:
+        seconds = None if timeout is None else float(timeout)
+    except ValueError:
+        seconds = None
+    if seconds is not None and not seconds > 0:
+        seconds = None
+    return _deadline.set(None if seconds is None else monotonic() + seconds)
+
+
+def reset_deadline(token: object) -> None:
+    _deadline.reset(token)  # type: ignore[arg-type]
+
+
+@contextmanager
+def bind_call(headers: Mapping[str, str]) -> Iterator[None]:
+    """Bind the session and deadline of one tool call from the headers that carried it.
+
+    Bound per call rather than per HTTP request: native MCP sessions run tool
+    handlers in a task that inherits the context of the `initialize` request.
+    """
+    session_token = bind_session_id(headers.get(SESSION_HEADER))
+    deadline_token = bind_deadline(headers.get(DEADLINE_HEADER))
+    try:
+        yield
+    finally:
+        reset_deadline(deadline_token)
+        reset_session_id(session_token)
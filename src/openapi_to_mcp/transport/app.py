@@ -2,23 +2,48 @@
 
 from __future__ import annotations
 
+import importlib
 import logging
+import math
 from contextlib import asynccontextmanager
 from time import perf_counter
 from typing import Any, Optional
 
-from fastapi import FastAPI, HTTPException, Response
+from fastapi import FastAPI, HTTPException, Request, Response
 from pydantic import BaseModel, Field
 
 from openapi_to_mcp import __version__
+from openapi_to_mcp.adapters.adaptive_limit import AimdLimits
+from openapi_to_mcp.adapters.adaptive_timeout import AdaptiveTimeoutPolicy, AdaptiveTimeouts
+from openapi_to_mcp.adapters.admission import AdmissionController
+from openapi_to_mcp.adapters.auth import OutboundAuth, TokenCache
+from openapi_to_mcp.adapters.bulkhead import BulkheadRegistry
+from openapi_to_mcp.adapters.circuit_breaker import CircuitBreakerPolicy, CircuitBreakerRegistry
+from openapi_to_mcp.adapters.dns_cache import DnsCache
+from openapi_to_mcp.adapters.hedging import HedgePolicy, Hedger
 from openapi_to_mcp.adapters.http_invoker import HttpxInvokerAdapter
+from openapi_to_mcp.adapters.json_codec import build_json_codec
+from openapi_to_mcp.adapters.latency_tracker import LatencyTracker
+from openapi_to_mcp.adapters.load_balancer import LoadBalancer, LoadBalancerPolicy
 from openapi_to_mcp.adapters.openapi_source import FileOpenApiSourceAdapter, UrlOpenApiSourceAdapter
 from openapi_to_mcp.adapters.openapi_validator import OpenApiValidatorAdapter
+from openapi_to_mcp.adapters.pagination import Paginator
+from openapi_to_mcp.adapters.rate_limiter import RateLimitPacer
+from openapi_to_mcp.adapters.response_cache import ResponseCache
+from openapi_to_mcp.adapters.retry import RetryPolicy
+from openapi_to_mcp.adapters.scheduler import FairScheduler
+from openapi_to_mcp.adapters.singleflight import SingleFlight
+from openapi_to_mcp.adapters.upstream_pool import OriginLimits, UpstreamPoolManager
 from openapi_to_mcp.application.mapper import OperationMapper
 from openapi_to_mcp.application.startup import StartupOrchestrator
 from openapi_to_mcp.application.tool_generator import ToolGenerationService
 from openapi_to_mcp.config import Settings
-from openapi_to_mcp.errors import InvocationError
+from openapi_to_mcp.errors import (
+    ConfigurationError,
+    DeadlineExceededError,
+    InvocationError,
+    OverloadedError,
+)
 from openapi_to_mcp.metrics import RuntimeMetrics
 from openapi_to_mcp.ports import HttpInvokerPort, OpenApiSourcePort
 from openapi_to_mcp.transport.fastmcp_adapter import FastMcpAdapter
@@ -53,10 +78,171 @@ def create_app(
         service_version=__version__,
         deployment_environment=settings.deployment_environment,
     )
-    invoker = invoker_override or HttpxInvokerAdapter(
-        metrics=metrics,
+    upstream_pool = UpstreamPoolManager(
+        timeout_seconds=settings.http_timeout_seconds,
         max_connections=settings.http_max_connections,
         max_keepalive_connections=settings.http_max_keepalive_connections,
+        origin_limits={
+            origin: OriginLimits(max_connections=limits[0], max_keepalive_connections=limits[1])
+            for origin, limits in settings.http_pool_origin_limits.items()
+        },
+        idle_timeout_seconds=settings.http_pool_idle_timeout_seconds,
+        http2_enabled=settings.http2_enabled,
+        http2_origins=settings.http2_origins,
+        dns_cache=(
+            DnsCache(ttl_seconds=settings.http_dns_cache_ttl_seconds, metrics=metrics)
+            if settings.http_dns_cache_ttl_seconds > 0
+            else None
+        ),
+        uds_paths=settings.http_uds_origins,
+        asgi_apps={
+            origin: _load_asgi_app(import_path)
+            for origin, import_path in settings.http_asgi_origins.items()
+        },
+        metrics=metrics,
+    )
+    bulkheads = BulkheadRegistry(
+        origin_max_in_flight=settings.http_origin_max_in_flight,
+        origin_overrides=settings.http_origin_max_in_flight_overrides,
+        operation_max_in_flight=settings.http_operation_max_in_flight,
+        operation_overrides=settings.http_operation_max_in_flight_overrides,
+        adaptive_limits=(
+            AimdLimits(
+                initial_limit=settings.http_adaptive_concurrency_initial_limit,
+                min_limit=settings.http_adaptive_concurrency_min_limit,
+                max_limit=settings.http_adaptive_concurrency_max_limit,
+            )
+            if settings.http_adaptive_concurrency_enabled
+            else None
+        ),
+        metrics=metrics,
+    )
+    codec = build_json_codec(settings.json_codec)
+    latencies = LatencyTracker()
+    auth = OutboundAuth(
+        api_keys=settings.http_auth_api_keys,
+        tokens=TokenCache(
+            upstream_pool,
+            settings.http_auth_oauth2_clients,
+            refresh_ahead_seconds=settings.http_auth_refresh_ahead_seconds,
+            metrics=metrics,
+        ),
+    )
+    invoker = invoker_override or HttpxInvokerAdapter(
+        timeout_seconds=settings.http_timeout_seconds,
+        pool=upstream_pool,
+        bulkheads=bulkheads,
+        response_cache=(
+            ResponseCache(max_bytes=settings.http_response_cache_max_bytes, metrics=metrics)
+            if settings.http_response_cache_max_bytes > 0
+            else None
+        ),
+        singleflight=(
+            SingleFlight(metrics=metrics) if settings.http_request_coalescing_enabled else None
+        ),
+        codec=codec,
+        passthrough=settings.http_response_passthrough,
+        header_allowlist=settings.http_response_header_allowlist,
+        max_response_bytes=settings.http_response_max_bytes,
+        max_response_bytes_overrides=settings.http_response_max_bytes_overrides,
+        timeout_overrides=settings.http_timeout_overrides,
+        deadline_header=settings.http_deadline_header,
+        adaptive_timeouts=(
+            AdaptiveTimeouts(
+                AdaptiveTimeoutPolicy(
+                    percentile=settings.http_adaptive_timeout_percentile,
+                    min_seconds=settings.http_adaptive_timeout_min_seconds,
+                    max_seconds=settings.http_adaptive_timeout_max_seconds,
+                ),
+                metrics=metrics,
+            )
+            if settings.http_adaptive_timeouts_enabled
+            else None
+        ),
+        auth=auth,
+        paginator=Paginator(
+            max_pages=settings.http_pagination_max_pages,
+            max_items=settings.http_pagination_max_items,
+            max_bytes=settings.http_pagination_max_bytes,
+            concurrency=settings.http_pagination_concurrency,
+            codec=codec,
+            metrics=metrics,
+        ),
+        retry_policy=RetryPolicy(
+            max_attempts=settings.http_retry_max_attempts,
+            base_delay_seconds=settings.http_retry_base_delay_seconds,
+            max_delay_seconds=settings.http_retry_max_delay_seconds,
+            budget_ratio=settings.http_retry_budget_ratio,
+            budget_min_retries_per_second=settings.http_retry_budget_min_per_second,
+        ),
+        latencies=latencies,
+        hedger=(
+            Hedger(
+                HedgePolicy(
+                    percentile=settings.http_hedge_percentile,
+                    budget_ratio=settings.http_hedge_budget_ratio,
+                    operations=frozenset(settings.http_hedge_operations),
+                ),
+                latencies,
+                metrics=metrics,
+            )
+            if settings.http_hedging_enabled
+            else None
+        ),
+        breakers=(
+            CircuitBreakerRegistry(
+                CircuitBreakerPolicy(
+                    failure_rate_threshold=settings.http_circuit_breaker_failure_rate,
+                    minimum_calls=settings.http_circuit_breaker_minimum_calls,
+                    window_seconds=settings.http_circuit_breaker_window_seconds,
+                    open_seconds=settings.http_circuit_breaker_open_seconds,
+                ),
+                metrics=metrics,
+            )
+            if settings.http_circuit_breaker_enabled
+            else None
+        ),
+        balancer=(
+            LoadBalancer(
+                LoadBalancerPolicy(
+                    eject_consecutive_failures=settings.http_load_balancer_eject_failures,
+                    eject_seconds=settings.http_load_balancer_eject_seconds,
+                ),
+                metrics=metrics,
+            )
+            if settings.http_load_balancing_enabled
+            else None
+        ),
+        pacer=(
+            RateLimitPacer(
+                static_rates=settings.http_rate_limits,
+                max_wait_seconds=settings.http_rate_limit_max_wait_seconds,
+                metrics=metrics,
+            )
+            if settings.http_rate_limit_pacing_enabled
+            else None
+        ),
+        admission=(
+            AdmissionController(
+                max_in_flight=settings.http_max_in_flight,
+                max_queue_depth=settings.http_max_queue_depth,
+                max_queue_wait_seconds=settings.http_max_queue_wait_seconds,
+                metrics=metrics,
+            )
+            if settings.http_max_queue_depth > 0 or settings.http_max_queue_wait_seconds > 0
+            else None
+        ),
+        scheduler=(
+            FairScheduler(
+                capacity=settings.http_max_in_flight,
+                tag_classes=settings.http_scheduler_tag_classes,
+                class_weights=settings.http_scheduler_class_weights,
+                metrics=metrics,
+            )
+            if settings.http_fair_scheduling_enabled
+            else None
+        ),
+        metrics=metrics,
         max_in_flight=settings.http_max_in_flight,
     )
     mcp_adapter = FastMcpAdapter(invoker=invoker)
@@ -89,16 +275,31 @@ def create_app(
                 "mcp_native": app.state.mcp_native,
             },
         )
-        if mcp_adapter.supports_streamable_http:
-            async with mcp_adapter.native_lifespan():
-                try:
-                    yield
-                finally:
-                    metrics.shutdown()
-            return
+        await upstream_pool.start()
+        if settings.http_warmup_connections > 0 or settings.http_dns_cache_ttl_seconds > 0:
+            # Pay DNS, TCP, and TLS setup before the app reports ready, not on first calls.
+            warmed = await upstream_pool.warm_up(
+                orchestrator.upstream_urls(),
+                connections=settings.http_warmup_connections,
+                timeout_seconds=settings.http_warmup_timeout_seconds,
+            )
+            logger.info(
+                "upstream_warmup_completed",
+                extra={
+                    "event": "upstream_warmup_complete",
+                    "origin_count": len(warmed),
+                    "connection_count": sum(warmed.values()),
+                },
+            )
         try:
-            yield
+            if mcp_adapter.supports_streamable_http:
+                async with mcp_adapter.native_lifespan():
+                    yield
+            else:
+                yield
         finally:
+            await auth.aclose()
+            await upstream_pool.aclose()
             metrics.shutdown()
 
     app = FastAPI(title="openapi-to-mcp", version=__version__, lifespan=lifespan)
@@ -140,19 +341,32 @@ def create_app(
     else:
 
         @app.post("/mcp")
-        async def fallback_mcp_endpoint(request: FallbackToolCallRequest) -> Any:
+        async def fallback_mcp_endpoint(
+            request: FallbackToolCallRequest, http_request: Request
+        ) -> Response:
             logger.info(
                 "fallback_tool_invoke",
                 extra={"event": "fallback_tool_invoke", "tool": request.tool},
             )
             try:
-                return await mcp_adapter.invoke_fallback(request.tool, request.arguments)
+                result = await mcp_adapter.invoke_fallback(
+                    request.tool, request.arguments, http_request.headers
+                )
+            except OverloadedError as exc:
+                raise HTTPException(
+                    status_code=503,
+                    detail=str(exc),
+                    headers={"Retry-After": str(math.ceil(exc.retry_after_seconds))},
+                ) from exc
+            except DeadlineExceededError as exc:
+                raise HTTPException(status_code=504, detail=str(exc)) from exc
             except InvocationError as exc:
                 logger.warning(
                     "fallback_tool_not_found",
                     extra={"event": "fallback_tool_not_found", "tool": request.tool},
                 )
                 raise HTTPException(status_code=404, detail=str(exc)) from exc
+            return Response(content=codec.dumps(result), media_type="application/json")
 
     return app
 
@@ -162,3 +376,17 @@ def _build_openapi_source(settings: Settings) -> OpenApiSourcePort:
     if source_type == "path":
         return FileOpenApiSourceAdapter(source_value)
     return UrlOpenApiSourceAdapter(source_value)
+
+
+def _load_asgi_app(import_path: str) -> Any:
+    """Import an in-process upstream app given as `module:attribute`."""
+    module_name, _, attribute = import_path.partition(":")
+    try:
+        target: Any = importlib.import_module(module_name.strip())
+        for name in attribute.strip().split("."):
+            target = getattr(target, name)
+    except (ImportError, AttributeError) as exc:
+        raise ConfigurationError(f"HTTP_ASGI_ORIGINS could not import {import_path}.") from exc
+    if not callable(target):
+        raise ConfigurationError(f"HTTP_ASGI_ORIGINS target {import_path} is not an ASGI app.")
+    return target
@@ -4,11 +4,12 @@ from __future__ import annotations
 
 import inspect
 from contextlib import asynccontextmanager
-from typing import Any, AsyncIterator, Callable, Dict
+from typing import Any, AsyncIterator, Callable, Dict, Mapping
 
 from openapi_to_mcp.domain.models import GeneratedTool
 from openapi_to_mcp.errors import InvocationError, ToolRegistrationError
 from openapi_to_mcp.ports import HttpInvokerPort
+from openapi_to_mcp.request_context import bind_call
 
 try:
     from mcp.server.fastmcp import FastMCP  # type: ignore
@@ -86,14 +87,33 @@ class FastMcpAdapter:
         for tool in tools:
             self._register_single_tool(tool)
 
-    async def invoke_fallback(self, tool_name: str, arguments: Dict[str, Any]) -> Any:
+    async def invoke_fallback(
+        self, tool_name: str, arguments: Dict[str, Any], headers: Mapping[str, str] | None = None
+    ) -> Any:
         if self._native:
             raise InvocationError("Fallback invoke is only available in local MCP mode.")
-        return await self._runtime.invoke(tool_name, arguments)
+        with bind_call(headers or {}):
+            return await self._runtime.invoke(tool_name, arguments)
+
+    def _native_call_headers(self) -> Mapping[str, str]:
+        """Return the HTTP headers of the MCP request being handled, if any."""
+        try:
+            request = self._runtime.get_context().request_context.request
+        except ValueError:
+            # Outside a request, e.g. a call made during startup.
+            return {}
+        # stdio sessions carry no HTTP request.
+        return getattr(request, "headers", None) or {}
 
     def _register_single_tool(self, tool: GeneratedTool) -> None:
+        binding = tool.plan or tool.binding
+
         async def dynamic_tool(**kwargs: Any) -> Dict[str, Any]:
-            return await self._invoker.invoke(tool.binding, kwargs)
+            if not self._native:
+                # The fallback endpoint binds the call in `invoke_fallback`.
+                return await self._invoker.invoke(binding, kwargs)
+            with bind_call(self._native_call_headers()):
+                return await self._invoker.invoke(binding, kwargs)
 
         try:
             decorator = self._runtime.tool(name=tool.name, description=tool.description)
@@ -6,12 +6,23 @@ from fastapi.testclient import TestClient
 
 from openapi_to_mcp import __version__
 from openapi_to_mcp.config import Settings
+from openapi_to_mcp.errors import DeadlineExceededError, OverloadedError
+from openapi_to_mcp.request_context import current_deadline, current_session_id
 from openapi_to_mcp.transport.app import create_app
 
 
 class StubInvoker:
     async def invoke(self, binding, payload):
-        return {"ok": True, "binding": binding, "payload": payload}
+        if payload.get("petId") == "shed":
+            raise OverloadedError("Invoker overloaded.", retry_after_seconds=1.5)
+        if payload.get("petId") == "late" and current_deadline() is not None:
+            raise DeadlineExceededError("Deadline exceeded.")
+        return {
+            "ok": True,
+            "binding": binding,
+            "payload": payload,
+            "session": current_session_id(),
+        }
 
 
 def test_app_healthz_and_fallback_mcp(tmp_path: Path) -> None:
@@ -54,11 +65,27 @@ paths:
         assert metrics.status_code == 404
 
         if not app.state.mcp_native:
-            response = client.post("/mcp", json={"tool": "getPet", "arguments": {"petId": "123"}})
+            response = client.post(
+                "/mcp",
+                json={"tool": "getPet", "arguments": {"petId": "123"}},
+                headers={"Mcp-Session-Id": "chat-1"},
+            )
             assert response.status_code == 200
             body = response.json()
             assert body["ok"] is True
             assert body["payload"]["petId"] == "123"
+            assert body["session"] == "chat-1"
+
+            shed = client.post("/mcp", json={"tool": "getPet", "arguments": {"petId": "shed"}})
+            assert shed.status_code == 503
+            assert shed.headers["retry-after"] == "2"
+
+            late = client.post(
+                "/mcp",
+                json={"tool": "getPet", "arguments": {"petId": "late"}},
+                headers={"X-Request-Timeout": "5"},
+            )
+            assert late.status_code == 504
 
 
 def test_app_exposes_metrics_only_when_prometheus_toggle_enabled(tmp_path: Path) -> None:
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
+import json
 from pathlib import Path
+from time import monotonic
 
 import pytest
 from fastapi.testclient import TestClient
 
 from openapi_to_mcp import __version__
 from openapi_to_mcp.config import Settings
+from openapi_to_mcp.request_context import current_deadline, current_session_id
 from openapi_to_mcp.transport.app import create_app
 
 pytest.importorskip("mcp.server.fastmcp")
@@ -80,3 +83,80 @@ def test_native_streamable_request_uses_canonical_mcp_path_without_trailing_slas
         assert canonical.status_code != 500
         assert trailing.status_code == 307
         assert trailing.headers.get("location", "").endswith("/mcp")
+
+
+class ContextRecordingInvoker:
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, float | None]] = []
+
+    async def invoke(self, binding, payload):
+        deadline = current_deadline()
+        remaining = None if deadline is None else deadline - monotonic()
+        self.calls.append((current_session_id(), remaining))
+        return {"ok": True}
+
+
+def _sse_message(response) -> dict:
+    if response.headers.get("content-type", "").startswith("application/json"):
+        return response.json()
+    data = [line[len("data:") :] for line in response.text.splitlines() if line.startswith("data:")]
+    return json.loads(data[-1])
+
+
+def test_native_tool_calls_bind_the_session_and_deadline_of_each_call(tmp_path: Path) -> None:
+    spec_file = _write_spec(tmp_path)
+    settings = Settings.from_env({"OPENAPI_SPEC_PATH": str(spec_file)})
+    invoker = ContextRecordingInvoker()
+    app = create_app(settings, invoker_override=invoker)
+
+    with TestClient(app) as client:
+        if not app.state.mcp_native:
+            pytest.skip("FastMCP native mode not available in this environment")
+
+        headers = {
+            "Accept": "application/json, text/event-stream",
+            "Content-Type": "application/json",
+            "Host": "127.0.0.1:8000",
+        }
+        # The session task inherits this request's context; calls must not reuse its deadline.
+        initialized = client.post(
+            "/mcp",
+            json={
+                "jsonrpc": "2.0",
+                "id": 1,
+                "method": "initialize",
+                "params": {
+                    "protocolVersion": "2025-03-26",
+                    "capabilities": {},
+                    "clientInfo": {"name": "pytest", "version": __version__},
+                },
+            },
+            headers={**headers, "x-request-timeout": "0.01"},
+        )
+        session_headers = {**headers, "mcp-session-id": initialized.headers["mcp-session-id"]}
+        client.post(
+            "/mcp",
+            json={"jsonrpc": "2.0", "method": "notifications/initialized"},
+            headers=session_headers,
+        )
+        for request_id, timeout in ((2, "30"), (3, None)):
+            call_headers = dict(session_headers)
+            if timeout is not None:
+                call_headers["x-request-timeout"] = timeout
+            response = client.post(
+                "/mcp",
+                json={
+                    "jsonrpc": "2.0",
+                    "id": request_id,
+                    "method": "tools/call",
+                    # FastMCP derives the argument model from the handler's `**kwargs`.
+                    "params": {"name": "getPet", "arguments": {"kwargs": {"petId": "1"}}},
+                },
+                headers=call_headers,
+            )
+            assert _sse_message(response)["result"]["isError"] is False
+
+    (first_session, first_remaining), (second_session, second_remaining) = invoker.calls
+    assert first_session == second_session == session_headers["mcp-session-id"]
+    assert first_remaining is not None and 25 < first_remaining <= 30
+    assert second_remaining is None
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import asyncio
+
+from openapi_to_mcp.adapters.adaptive_limit import AimdConcurrencyLimiter, AimdLimits
+from openapi_to_mcp.adapters.bulkhead import BulkheadRegistry, SlotOutcome
+
+
+def _limiter(**overrides) -> tuple[AimdConcurrencyLimiter, list[int]]:
+    changes: list[int] = []
+    limits = AimdLimits(**{"initial_limit": 4, "min_limit": 1, "max_limit": 8, **overrides})
+    limiter = AimdConcurrencyLimiter(
+        kind="origin",
+        key="https://api.example.com:443",
+        limits=limits,
+        on_limit_changed=lambda kind, key, limit: changes.append(limit),
+    )
+    return limiter, changes
+
+
+def test_limiter_backs_off_on_failures_down_to_minimum() -> None:
+    async def scenario() -> None:
+        limiter, changes = _limiter()
+        for _ in range(40):
+            await limiter.acquire()
+            limiter.release(SlotOutcome(latency_seconds=0.01, failed=True))
+
+        assert limiter.limit == 1
+        assert changes[0] == 4
+        assert changes[-1] == 1
+
+    asyncio.run(scenario())
+
+
+def test_limiter_backs_off_on_latency_above_baseline() -> None:
+    async def scenario() -> None:
+        limiter, _ = _limiter()
+        await limiter.acquire()
+        limiter.release(SlotOutcome(latency_seconds=0.01))
+        for _ in range(10):
+            await limiter.acquire()
+            limiter.release(SlotOutcome(latency_seconds=0.5))
+
+        assert limiter.limit < 4
+
+    asyncio.run(scenario())
+
+
+def test_limiter_ignores_a_single_fast_outlier() -> None:
+    async def scenario() -> None:
+        limiter, _ = _limiter(initial_limit=64, max_limit=64)
+        for latency in [0.1] * 20 + [0.005] + [0.1] * 300:
+            await limiter.acquire()
+            limiter.release(SlotOutcome(latency_seconds=latency))
+
+        assert limiter.limit > 16
+
+    asyncio.run(scenario())
+
+
+def test_limiter_keeps_a_baseline_per_operation() -> None:
+    async def scenario() -> None:
+        limiter, _ = _limiter(initial_limit=16, max_limit=64)
+        # Three in ten calls go to an operation five times slower, both healthy.
+        for index in range(300):
+            slow = index % 10 < 3
+            for _ in range(limiter.limit):
+                await limiter.acquire()
+            for _ in range(limiter.limit):
+                limiter.release(
+                    SlotOutcome(
+                        latency_seconds=0.05 if slow else 0.01,
+                        operation="searchPets" if slow else "getPet",
+                    )
+                )
+
+        assert limiter.limit > 16
+
+    asyncio.run(scenario())
+
+
+def test_limiter_grows_only_while_saturated() -> None:
+    async def scenario() -> None:
+        limiter, _ = _limiter(initial_limit=2)
+        for _ in range(20):
+            await limiter.acquire()
+            limiter.release(SlotOutcome(latency_seconds=0.01))
+        assert limiter.limit == 2
+
+        for _ in range(20):
+            await limiter.acquire()
+            await limiter.acquire()
+            limiter.release(SlotOutcome(latency_seconds=0.01))
+            limiter.release(SlotOutcome(latency_seconds=0.01))
+        assert limiter.limit > 2
+
+    asyncio.run(scenario())
+
+
+def test_limiter_queues_callers_beyond_limit_and_survives_cancellation() -> None:
+    async def scenario() -> None:
+        limiter, _ = _limiter(initial_limit=1)
+        await limiter.acquire()
+        cancelled = asyncio.create_task(limiter.acquire())
+        waiting = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        assert not waiting.done()
+
+        cancelled.cancel()
+        await asyncio.sleep(0)
+        limiter.release()
+        await asyncio.wait_for(waiting, timeout=1)
+
+        assert limiter.in_flight == 1
+        limiter.release()
+        assert limiter.in_flight == 0
+
+    asyncio.run(scenario())
+
+
+def test_registry_uses_adaptive_origin_partitions_and_reports_failures() -> None:
+    async def scenario() -> None:
+        registry = BulkheadRegistry(
+            adaptive_limits=AimdLimits(initial_limit=4, min_limit=1, max_limit=8)
+        )
+        partition = registry.partition("origin", "https://api.example.com:443")
+        assert isinstance(partition, AimdConcurrencyLimiter)
+        assert registry.partition("operation", "getPet") is None
+
+        try:
+            async with registry.slot("https://api.example.com:443", "getPet"):
+                raise RuntimeError("boom")
+        except RuntimeError:
+            pass
+
+        assert partition.limit == 3
+        assert partition.in_flight == 0
+
+        async def cancelled_call() -> None:
+            async with registry.slot("https://api.example.com:443", "getPet") as outcome:
+                outcome.latency_seconds = 5.0
+                await asyncio.sleep(1.0)
+
+        task = asyncio.create_task(cancelled_call())
+        await asyncio.sleep(0)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+        # A cancelled call (for example a losing hedge) does not shrink the limit.
+        assert partition.limit == 3
+        assert partition.in_flight == 0
+
+    asyncio.run(scenario())
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from openapi_to_mcp.adapters.adaptive_timeout import AdaptiveTimeoutPolicy, AdaptiveTimeouts
+from openapi_to_mcp.adapters.latency_tracker import LatencyTracker
+
+
+def test_adaptive_timeouts_follow_the_latency_percentile_within_bounds() -> None:
+    timeouts = AdaptiveTimeouts(
+        AdaptiveTimeoutPolicy(percentile=0.9, headroom=2.0, min_seconds=0.05, max_seconds=1.0),
+        latencies=LatencyTracker(window_size=10, min_samples=10),
+    )
+
+    for _ in range(9):
+        timeouts.record("getPet", 0.1)
+    assert timeouts.timeout_for("getPet") is None
+
+    timeouts.record("getPet", 0.1)
+    assert timeouts.timeout_for("getPet") == 0.2
+
+    for _ in range(10):
+        timeouts.record("getPet", 0.001)
+    assert timeouts.timeout_for("getPet") == 0.05
+
+    for _ in range(10):
+        timeouts.record("getPet", 5.0)
+    assert timeouts.timeout_for("getPet") == 1.0
+    assert timeouts.timeout_for("listPets") is None
+
+
+def test_adaptive_timeouts_refresh_in_batches_after_warming_up() -> None:
+    timeouts = AdaptiveTimeouts(
+        AdaptiveTimeoutPolicy(percentile=0.5, headroom=1.0, min_seconds=0.01, max_seconds=10.0),
+        latencies=LatencyTracker(window_size=10, min_samples=1),
+    )
+
+    timeouts.record("getReport", 2.0)
+    assert timeouts.timeout_for("getReport") == 2.0
+    for _ in range(9):
+        timeouts.record("getReport", 4.0)
+    assert timeouts.timeout_for("getReport") == 2.0
+    timeouts.record("getReport", 4.0)
+    assert timeouts.timeout_for("getReport") == 4.0
+
+
+def test_adaptive_timeouts_grow_back_after_latency_steps_past_the_learned_value() -> None:
+    timeouts = AdaptiveTimeouts(
+        AdaptiveTimeoutPolicy(percentile=0.99, headroom=2.0, min_seconds=0.01, max_seconds=10.0),
+        latencies=LatencyTracker(window_size=200, min_samples=20),
+    )
+    for _ in range(200):
+        timeouts.record("getPet", 0.05)
+    assert timeouts.timeout_for("getPet") == 0.1
+
+    # Latency steps up to 0.5 s: every call now times out at the learned value.
+    attempts = 0
+    while (timeout := timeouts.timeout_for("getPet")) is not None and timeout < 0.5:
+        attempts += 1
+        timeouts.record_timeout("getPet", timeout)
+        assert attempts < 20
+
+    assert timeouts.timeout_for("getPet") == 0.8
@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+import pytest
+
+from openapi_to_mcp.adapters.admission import AdmissionController
+from openapi_to_mcp.errors import OverloadedError
+
+
+def test_admission_estimates_wait_from_queue_and_service_time() -> None:
+    controller = AdmissionController(max_in_flight=2, max_queue_wait_seconds=1.0)
+    controller.on_completed(0.5)
+    for _ in range(4):
+        controller.enter()
+
+    assert controller.estimated_wait_seconds() == pytest.approx(1.0)
+    controller.enter()
+    with pytest.raises(OverloadedError, match="queue_wait") as excinfo:
+        controller.enter()
+    assert excinfo.value.retry_after_seconds == pytest.approx(1.25)
+
+    controller.leave()
+    controller.on_completed(0.0)
+    assert controller.estimated_wait_seconds() == pytest.approx(0.8)
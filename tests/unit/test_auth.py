@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+
+from openapi_to_mcp.adapters.auth import OutboundAuth, TokenCache
+from openapi_to_mcp.adapters.upstream_pool import UpstreamPoolManager
+from openapi_to_mcp.domain.models import SecurityRequirement
+from openapi_to_mcp.errors import InvocationError
+from openapi_to_mcp.metrics import RuntimeMetrics
+
+_OAUTH = SecurityRequirement(
+    scheme="oauth",
+    kind="oauth2",
+    token_url="https://auth.example.com/token",
+    scopes=("pets:write", "pets:read"),
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _token_endpoint(requests: list[httpx.Request]) -> UpstreamPoolManager:
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(
+            200, json={"access_token": f"token-{len(requests)}", "expires_in": 100}
+        )
+
+    return UpstreamPoolManager(
+        client_factory=lambda origin: httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    )
+
+
+def test_token_cache_coalesces_misses_and_refreshes_ahead_of_expiry() -> None:
+    requests: list[httpx.Request] = []
+    clock = FakeClock()
+    cache = TokenCache(
+        _token_endpoint(requests),
+        {"oauth": ("client", "secret")},
+        refresh_ahead_seconds=30,
+        clock=clock,
+    )
+
+    async def scenario() -> list[str]:
+        first = await asyncio.gather(*(cache.token(_OAUTH) for _ in range(5)))
+        clock.now = 80.0
+        # Inside the refresh-ahead window: served from cache while a refresh runs.
+        ahead = await cache.token(_OAUTH)
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        refreshed = await cache.token(_OAUTH)
+        await cache.aclose()
+        return [*set(first), ahead, refreshed]
+
+    assert asyncio.run(scenario()) == ["token-1", "token-1", "token-2"]
+    assert len(requests) == 2
+    form = dict(httpx.QueryParams(requests[0].content.decode()))
+    assert form == {"grant_type": "client_credentials", "scope": "pets:read pets:write"}
+    assert requests[0].headers["Authorization"] == "Basic Y2xpZW50OnNlY3JldA=="
+
+
+class RecordingMetrics(RuntimeMetrics):
+    def __init__(self) -> None:
+        super().__init__(max_in_flight=1, max_connections=1)
+        self.refreshes: list[tuple[str, bool]] = []
+
+    def on_token_refresh(self, scheme: str, mode: str, failed: bool) -> None:
+        self.refreshes.append((mode, failed))
+
+
+def test_token_cache_runs_one_refresh_ahead_while_one_is_pending() -> None:
+    requests: list[httpx.Request] = []
+    clock = FakeClock()
+    metrics = RecordingMetrics()
+    cache = TokenCache(
+        _token_endpoint(requests),
+        {"oauth": ("client", "secret")},
+        refresh_ahead_seconds=30,
+        metrics=metrics,
+        clock=clock,
+    )
+
+    async def scenario() -> int:
+        await cache.token(_OAUTH)
+        clock.now = 80.0
+        for _ in range(5):
+            await cache.token(_OAUTH)
+        background = list(cache._background.values())  # noqa: SLF001
+        await asyncio.wait(background)
+        await cache.aclose()
+        return len(background)
+
+    assert asyncio.run(scenario()) == 1
+    assert len(requests) == 2
+    assert metrics.refreshes == [("blocking", False), ("ahead", False)]
+    metrics.shutdown()
+
+
+def test_token_cache_blocks_once_the_token_expired_and_reports_failures() -> None:
+    requests: list[httpx.Request] = []
+    clock = FakeClock()
+    cache = TokenCache(
+        _token_endpoint(requests),
+        {"oauth": ("client", "secret")},
+        refresh_ahead_seconds=0,
+        clock=clock,
+    )
+
+    async def scenario() -> list[str]:
+        first = await cache.token(_OAUTH)
+        clock.now = 100.0
+        return [first, await cache.token(_OAUTH)]
+
+    assert asyncio.run(scenario()) == ["token-1", "token-2"]
+
+    failing = TokenCache(
+        UpstreamPoolManager(
+            client_factory=lambda origin: httpx.AsyncClient(
+                transport=httpx.MockTransport(lambda request: httpx.Response(401))
+            )
+        ),
+        {"oauth": ("client", "wrong")},
+    )
+    with pytest.raises(InvocationError, match="Token request for scheme 'oauth' failed"):
+        asyncio.run(failing.token(_OAUTH))
+
+
+def test_outbound_auth_applies_first_satisfiable_alternative() -> None:
+    header_key = SecurityRequirement(scheme="key", kind="apiKey", name="X-API-Key")
+    query_key = SecurityRequirement(scheme="key", kind="apiKey", location="query", name="k")
+    cookie_key = SecurityRequirement(scheme="session", kind="apiKey", location="cookie", name="s")
+    auth = OutboundAuth(api_keys={"key": "secret", "session": "abc"})
+
+    async def apply(security) -> tuple[dict, dict]:
+        return await auth.apply(security, {"Cookie": "a=1"}, {"q": "x"})
+
+    headers, params = asyncio.run(apply(((_OAUTH,), (header_key, cookie_key))))
+    assert headers == {"Cookie": "a=1; s=abc", "X-API-Key": "secret"}
+    assert params == {"q": "x"}
+
+    headers, params = asyncio.run(apply(((query_key,),)))
+    assert params == {"q": "x", "k": "secret"}
+
+    # Nothing satisfiable: the call goes out without credentials.
+    headers, params = asyncio.run(apply(((_OAUTH,),)))
+    assert headers == {"Cookie": "a=1"} and params == {"q": "x"}
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import asyncio
+
+from openapi_to_mcp.adapters.bulkhead import BulkheadRegistry
+
+
+def test_bulkhead_returns_no_partition_when_disabled() -> None:
+    registry = BulkheadRegistry()
+
+    assert registry.partition("origin", "https://a.example.com:443") is None
+    assert registry.partition("operation", "getPet") is None
+
+
+def test_bulkhead_applies_origin_and_operation_overrides() -> None:
+    registry = BulkheadRegistry(
+        origin_max_in_flight=4,
+        origin_overrides={"https://slow.example.com": 1},
+        operation_overrides={"exportReport": 2},
+    )
+
+    assert registry.partition("origin", "https://slow.example.com:443").limit == 1
+    assert registry.partition("origin", "https://fast.example.com:443").limit == 4
+    assert registry.partition("operation", "exportReport").limit == 2
+    assert registry.partition("operation", "getPet") is None
+
+
+def test_saturated_origin_does_not_block_other_origins() -> None:
+    async def scenario() -> None:
+        registry = BulkheadRegistry(origin_max_in_flight=1)
+        release_slow = asyncio.Event()
+
+        async def hold_slow_slot() -> None:
+            async with registry.slot("https://slow.example.com:443", "slowOp"):
+                await release_slow.wait()
+
+        holder = asyncio.create_task(hold_slow_slot())
+        await asyncio.sleep(0)
+        queued = asyncio.create_task(hold_slow_slot())
+        await asyncio.sleep(0)
+
+        async with registry.slot("https://fast.example.com:443", "fastOp"):
+            fast_partition = registry.partition("origin", "https://fast.example.com:443")
+            assert fast_partition.in_flight == 1
+
+        slow_partition = registry.partition("origin", "https://slow.example.com:443")
+        assert slow_partition.in_flight == 1
+        assert not queued.done()
+
+        release_slow.set()
+        await asyncio.gather(holder, queued)
+        assert slow_partition.in_flight == 0
+
+    asyncio.run(scenario())
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import pytest
+
+from openapi_to_mcp.adapters.circuit_breaker import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreakerPolicy,
+    CircuitBreakerRegistry,
+)
+from openapi_to_mcp.errors import CircuitOpenError
+
+_POLICY = CircuitBreakerPolicy(
+    failure_rate_threshold=0.5,
+    minimum_calls=4,
+    window_seconds=10.0,
+    open_seconds=5.0,
+)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_breaker_opens_on_failure_rate_and_recovers_after_probe() -> None:
+    clock = _Clock()
+    breaker = CircuitBreakerRegistry(_POLICY, clock=clock).breaker("origin", "https://a:443")
+
+    for failed in (True, False, True):
+        breaker.record(failed)
+    assert breaker.state == CLOSED
+
+    breaker.record(True)
+    assert breaker.state == OPEN
+    assert breaker.allow() is False
+
+    clock.now += 5.0
+    assert breaker.state == HALF_OPEN
+    assert breaker.allow() is True
+    assert breaker.allow() is False
+
+    breaker.record(False)
+    assert breaker.state == CLOSED
+
+
+def test_breaker_reopens_on_failed_probe_and_ignores_old_buckets() -> None:
+    clock = _Clock()
+    breaker = CircuitBreakerRegistry(_POLICY, clock=clock).breaker("operation", "getPet")
+
+    for _ in range(3):
+        breaker.record(True)
+    clock.now += 11.0
+    breaker.record(True)
+    assert breaker.state == CLOSED
+
+    for _ in range(3):
+        breaker.record(True)
+    assert breaker.state == OPEN
+    clock.now += 5.0
+    assert breaker.allow() is True
+    breaker.record(True)
+    assert breaker.state == OPEN
+    assert breaker.allow() is False
+
+
+def test_registry_rejects_and_rolls_back_probes_of_other_partitions() -> None:
+    clock = _Clock()
+    registry = CircuitBreakerRegistry(_POLICY, clock=clock)
+    origin = registry.breaker("origin", "https://a:443")
+    operation = registry.breaker("operation", "https://a:443 getPet")
+    for breaker in (origin, operation):
+        for _ in range(4):
+            breaker.record(True)
+    clock.now += 5.0
+    origin.allow()
+
+    with pytest.raises(CircuitOpenError, match="origin https://a:443"):
+        registry.acquire("https://a:443", "getPet")
+    assert operation.allow() is True
+
+    operation.release_probe()
+    origin.release_probe()
+    registry.acquire("https://a:443", "getPet")
+    registry.record("https://a:443", "getPet", failed=False)
+    assert (origin.state, operation.state) == (CLOSED, CLOSED)
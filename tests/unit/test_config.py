@@ -3,6 +3,7 @@ from __future__ import annotations
 import pytest
 
 from openapi_to_mcp.config import Settings
+from openapi_to_mcp.domain.models import OperationTimeouts
 from openapi_to_mcp.errors import ConfigurationError
 
 
@@ -25,6 +26,8 @@ def test_settings_defaults_and_path_precedence() -> None:
     assert settings.http_max_in_flight == 128
     assert settings.http_max_connections == 100
     assert settings.http_max_keepalive_connections == 20
+    assert settings.http_pool_idle_timeout_seconds == 300.0
+    assert settings.http_pool_origin_limits == {}
     assert settings.telemetry_otlp_protocol == "grpc"
     assert settings.telemetry_otlp_endpoint == "http://127.0.0.1:4317"
     assert settings.telemetry_export_interval_ms == 60000
@@ -107,3 +110,405 @@ def test_settings_invalid_prometheus_toggle_value() -> None:
                 "PROMETHEUS_METRICS_ENABLED": "maybe",
             }
         )
+
+
+def test_settings_parses_pool_origin_limits() -> None:
+    settings = Settings.from_env(
+        {
+            "OPENAPI_SPEC_PATH": "./spec.yaml",
+            "HTTP_POOL_IDLE_TIMEOUT_SECONDS": "45",
+            "HTTP_POOL_ORIGIN_LIMITS": "https://a.example.com=50:10, http://b.example.com:8080=5",
+        }
+    )
+
+    assert settings.http_pool_idle_timeout_seconds == 45.0
+    assert settings.http_pool_origin_limits == {
+        "https://a.example.com": (50, 10),
+        "http://b.example.com:8080": (5, 5),
+    }
+
+
+def test_settings_invalid_pool_origin_limits() -> None:
+    with pytest.raises(ConfigurationError):
+        Settings.from_env(
+            {
+                "OPENAPI_SPEC_PATH": "./spec.yaml",
+                "HTTP_POOL_ORIGIN_LIMITS": "a.example.com=5",
+            }
+        )
+    with pytest.raises(ConfigurationError):
+        Settings.from_env(
+            {
+                "OPENAPI_SPEC_PATH": "./spec.yaml",
+                "HTTP_POOL_ORIGIN_LIMITS": "https://a.example.com=5:6",
+            }
+        )
+
+
+def test_settings_parses_http2_origins() -> None:
+    settings = Settings.from_env(
+        {
+            "OPENAPI_SPEC_PATH": "./spec.yaml",
+            "HTTP2_ORIGINS": "https://a.example.com, https://b.example.com:8443",
+        }
+    )
+
+    assert settings.http2_enabled is False
+    assert settings.http2_origins == ("https://a.example.com", "https://b.example.com:8443")
+    with pytest.raises(ConfigurationError):
+        Settings.from_env({"OPENAPI_SPEC_PATH": "./spec.yaml", "HTTP2_ORIGINS": "b.example.com"})
+
+
+def test_settings_parses_bulkhead_limits() -> None:
+    settings = Settings.from_env(
+        {
+            "OPENAPI_SPEC_PATH": "./spec.yaml",
+            "HTTP_ORIGIN_MAX_IN_FLIGHT": "16",
+            "HTTP_ORIGIN_MAX_IN_FLIGHT_OVERRIDES": "https://slow.example.com=4",
+            "HTTP_OPERATION_MAX_IN_FLIGHT_OVERRIDES": "exportReport=2,getPet=8",
+        }
+    )
+
+    assert settings.http_origin_max_in_flight == 16
+    assert settings.http_origin_max_in_flight_overrides == {"https://slow.example.com": 4}
+    assert settings.http_operation_max_in_flight == 0
+    assert settings.http_operation_max_in_flight_overrides == {"exportReport": 2, "getPet": 8}
+    with pytest.raises(ConfigurationError):
+        Settings.from_env(
+            {
+                "OPENAPI_SPEC_PATH": "./spec.yaml",
+                "HTTP_OPERATION_MAX_IN_FLIGHT_OVERRIDES": "exportReport",
+            }
+        )
+
+
+def test_settings_validates_adaptive_concurrency_bounds() -> None:
+    settings = Settings.from_env(
+        {
+            "OPENAPI_SPEC_PATH": "./spec.yaml",
+            "HTTP_ADAPTIVE_CONCURRENCY_ENABLED": "true",
+            "HTTP_ADAPTIVE_CONCURRENCY_INITIAL_LIMIT": "8",
+        }
+    )
+
+    assert settings.http_adaptive_concurrency_enabled is True
+    assert settings.http_adaptive_concurrency_initial_limit == 8
+    with pytest.raises(ConfigurationError):
+        Settings.from_env(
+            {
+                "OPENAPI_SPEC_PATH": "./spec.yaml",
+                "HTTP_ADAPTIVE_CONCURRENCY_MIN_LIMIT": "32",
+            }
+        )
+
+
+def test_settings_parses_response_cache_and_coalescing() -> None:
+    settings = Settings.from_env(
+        {"OPENAPI_SPEC_PATH": "./spec.yaml", "HTTP_RESPONSE_CACHE_MAX_BYTES": "1048576"}
+    )
+
+    assert settings.http_response_cache_max_bytes == 1048576
+    assert settings.http_request_coalescing_enabled is False
+    assert Settings.from_env(
+        {"OPENAPI_SPEC_PATH": "./spec.yaml", "HTTP_REQUEST_COALESCING_ENABLED": "true"}
+    ).http_request_coalescing_enabled
+    with pytest.raises(ConfigurationError):
+        Settings.from_env(
+            {"OPENAPI_SPEC_PATH": "./spec.yaml", "HTTP_RESPONSE_CACHE_MAX_BYTES": "-1"}
+        )
+
+
+def test_settings_validates_json_codec() -> None:
+    settings = Settings.from_env({"OPENAPI_SPEC_PATH": "./spec.yaml", "JSON_CODEC": "STDLIB"})
+
+    assert settings.json_codec == "stdlib"
+    assert Settings.from_env({"OPENAPI_SPEC_PATH": "./spec.yaml"}).json_codec == "auto"
+    with pytest.raises(ConfigurationError):
+        Settings.from_env({"OPENAPI_SPEC_PATH": "./spec.yaml", "JSON_CODEC": "ujson"})
+
+
+def test_settings_parses_passthrough_and_header_allowlist() -> None:
+    settings = Settings.from_env(
+        {
+            "OPENAPI_SPEC_PATH": "./spec.yaml",
+            "HTTP_RESPONSE_PASSTHROUGH": "true",
+            "HTTP_RESPONSE_HEADER_ALLOWLIST": "Content-Type, ETag,,content-type",
+        }
+    )
+
+    assert settings.http_response_passthrough is True
+    assert settings.http_response_header_allowlist == ("content-type", "etag")
+
+
+def test_settings_parses_response_size_caps() -> None:
+    settings = Settings.from_env(
+        {
+            "OPENAPI_SPEC_PATH": "./spec.yaml",
+            "HTTP_RESPONSE_MAX_BYTES": "1048576",
+            "HTTP_RESPONSE_MAX_BYTES_OVERRIDES": "exportReport=10485760",
+        }
+    )
+
+    assert settings.http_response_max_bytes == 1048576
+    assert settings.http_response_max_bytes_overrides == {"exportReport": 10485760}
+    with pytest.raises(ConfigurationError):
+        Settings.from_env(
+            {"OPENAPI_SPEC_PATH": "./spec.yaml", "HTTP_RESPONSE_MAX_BYTES_OVERRIDES": "x=0"}
+        )
+
+
+def test_settings_parses_retry_policy() -> None:
+    settings = Settings.from_env(
+        {
+            "OPENAPI_SPEC_PATH": "./spec.yaml",
+            "HTTP_RETRY_MAX_ATTEMPTS": "3",
+            "HTTP_RETRY_BUDGET_RATIO": "0.2",
+        }
+    )
+
+    assert settings.http_retry_max_attempts == 3
+    assert settings.http_retry_budget_ratio == 0.2
+    assert settings.http_retry_max_delay_seconds == 5.0
+    with pytest.raises(ConfigurationError):
+        Settings.from_env(
+            {"OPENAPI_SPEC_PATH": "./spec.yaml", "HTTP_RETRY_BASE_DELAY_SECONDS": "10"}
+        )
+
+
+def test_settings_parses_hedging() -> None:
+    settings = Settings.from_env(
+        {
+            "OPENAPI_SPEC_PATH": "./spec.yaml",
+            "HTTP_HEDGING_ENABLED": "true",
+            "HTTP_HEDGE_OPERATIONS": "searchPets, searchOwners",
+        }
+    )
+
+    assert settings.http_hedging_enabled is True
+    assert settings.http_hedge_percentile == 0.95
+    assert settings.http_hedge_operations == ("searchPets", "searchOwners")
+    with pytest.raises(ConfigurationError):
+        Settings.from_env({"OPENAPI_SPEC_PATH": "./spec.yaml", "HTTP_HEDGE_PERCENTILE": "1.5"})
+
+
+def test_settings_parses_circuit_breaker() -> None:
+    settings = Settings.from_env(
+        {
+            "OPENAPI_SPEC_PATH": "./spec.yaml",
+            "HTTP_CIRCUIT_BREAKER_ENABLED": "true",
+            "HTTP_CIRCUIT_BREAKER_MINIMUM_CALLS": "50",
+            "HTTP_CIRCUIT_BREAKER_OPEN_SECONDS": "2.5",
+        }
+    )
+
+    assert settings.http_circuit_breaker_enabled is True
+    assert settings.http_circuit_breaker_failure_rate == 0.5
+    assert settings.http_circuit_breaker_minimum_calls == 50
+    assert settings.http_circuit_breaker_window_seconds == 30.0
+    assert settings.http_circuit_breaker_open_seconds == 2.5
+    with pytest.raises(ConfigurationError):
+        Settings.from_env(
+            {"OPENAPI_SPEC_PATH": "./spec.yaml", "HTTP_CIRCUIT_BREAKER_FAILURE_RATE": "1.2"}
+        )
+
+
+def test_settings_parses_load_balancing() -> None:
+    settings = Settings.from_env(
+        {
+            "OPENAPI_SPEC_PATH": "./spec.yaml",
+            "HTTP_LOAD_BALANCING_ENABLED": "true",
+            "HTTP_LOAD_BALANCER_EJECT_FAILURES": "3",
+        }
+    )
+
+    assert settings.http_load_balancing_enabled is True
+    assert settings.http_load_balancer_eject_failures == 3
+    assert settings.http_load_balancer_eject_seconds == 30.0
+    with pytest.raises(ConfigurationError):
+        Settings.from_env(
+            {"OPENAPI_SPEC_PATH": "./spec.yaml", "HTTP_LOAD_BALANCER_EJECT_SECONDS": "0"}
+        )
+
+
+def test_settings_parses_rate_limit_pacing() -> None:
+    settings = Settings.from_env(
+        {
+            "OPENAPI_SPEC_PATH": "./spec.yaml",
+            "HTTP_RATE_LIMIT_PACING_ENABLED": "true",
+            "HTTP_RATE_LIMITS": "https://api.example.com=50, http://localhost:8080=2.5",
+        }
+    )
+
+    assert settings.http_rate_limit_pacing_enabled is True
+    assert settings.http_rate_limits == {
+        "https://api.example.com": 50.0,
+        "http://localhost:8080": 2.5,
+    }
+    assert settings.http_rate_limit_max_wait_seconds == 5.0
+    with pytest.raises(ConfigurationError):
+        Settings.from_env({"OPENAPI_SPEC_PATH": "./spec.yaml", "HTTP_RATE_LIMITS": "api=5"})
+
+
+def test_settings_parses_load_shedding_bounds() -> None:
+    settings = Settings.from_env(
+        {
+            "OPENAPI_SPEC_PATH": "./spec.yaml",
+            "HTTP_MAX_QUEUE_DEPTH": "64",
+            "HTTP_MAX_QUEUE_WAIT_SECONDS": "0.25",
+        }
+    )
+
+    assert settings.http_max_queue_depth == 64
+    assert settings.http_max_queue_wait_seconds == 0.25
+    with pytest.raises(ConfigurationError):
+        Settings.from_env({"OPENAPI_SPEC_PATH": "./spec.yaml", "HTTP_MAX_QUEUE_WAIT_SECONDS": "-1"})
+
+
+def test_settings_parses_fair_scheduling() -> None:
+    settings = Settings.from_env(
+        {
+            "OPENAPI_SPEC_PATH": "./spec.yaml",
+            "HTTP_FAIR_SCHEDULING_ENABLED": "true",
+            "HTTP_SCHEDULER_TAG_CLASSES": "reports=batch, search=interactive",
+            "HTTP_SCHEDULER_CLASS_WEIGHTS": "interactive=10,batch=1",
+        }
+    )
+
+    assert settings.http_fair_scheduling_enabled is True
+    assert settings.http_scheduler_tag_classes == {"reports": "batch", "search": "interactive"}
+    assert settings.http_scheduler_class_weights == {"interactive": 10, "batch": 1}
+    with pytest.raises(ConfigurationError):
+        Settings.from_env(
+            {"OPENAPI_SPEC_PATH": "./spec.yaml", "HTTP_SCHEDULER_CLASS_WEIGHTS": "batch=0"}
+        )
+
+
+def test_settings_parses_operation_timeouts() -> None:
+    settings = Settings.from_env(
+        {
+            "OPENAPI_SPEC_PATH": "./spec.yaml",
+            "HTTP_TIMEOUT_SECONDS": "5",
+            "HTTP_TIMEOUT_OVERRIDES": "getReport=60, getPet=0.2::0.5",
+            "HTTP_DEADLINE_HEADER": "",
+        }
+    )
+
+    assert settings.http_timeout_seconds == 5.0
+    assert settings.http_timeout_overrides == {
+        "getReport": OperationTimeouts(total=60.0),
+        "getPet": OperationTimeouts(connect=0.2, total=0.5),
+    }
+    assert settings.http_deadline_header == ""
+    assert Settings.from_env({"OPENAPI_SPEC_PATH": "./spec.yaml"}).http_deadline_header == (
+        "X-Request-Timeout"
+    )
+    with pytest.raises(ConfigurationError):
+        Settings.from_env(
+            {"OPENAPI_SPEC_PATH": "./spec.yaml", "HTTP_TIMEOUT_OVERRIDES": "getPet=1:2"}
+        )
+
+
+def test_settings_parses_adaptive_timeouts() -> None:
+    settings = Settings.from_env(
+        {
+            "OPENAPI_SPEC_PATH": "./spec.yaml",
+            "HTTP_ADAPTIVE_TIMEOUTS_ENABLED": "true",
+            "HTTP_ADAPTIVE_TIMEOUT_PERCENTILE": "0.999",
+            "HTTP_ADAPTIVE_TIMEOUT_MIN_SECONDS": "0.2",
+            "HTTP_ADAPTIVE_TIMEOUT_MAX_SECONDS": "30",
+        }
+    )
+
+    assert settings.http_adaptive_timeouts_enabled is True
+    assert settings.http_adaptive_timeout_percentile == 0.999
+    assert settings.http_adaptive_timeout_min_seconds == 0.2
+    assert settings.http_adaptive_timeout_max_seconds == 30.0
+    with pytest.raises(ConfigurationError):
+        Settings.from_env(
+            {
+                "OPENAPI_SPEC_PATH": "./spec.yaml",
+                "HTTP_ADAPTIVE_TIMEOUT_MIN_SECONDS": "5",
+                "HTTP_ADAPTIVE_TIMEOUT_MAX_SECONDS": "1",
+            }
+        )
+
+
+def test_settings_parses_warmup_and_dns_cache() -> None:
+    settings = Settings.from_env(
+        {
+            "OPENAPI_SPEC_PATH": "./spec.yaml",
+            "HTTP_WARMUP_CONNECTIONS": "4",
+            "HTTP_WARMUP_TIMEOUT_SECONDS": "2.5",
+            "HTTP_DNS_CACHE_TTL_SECONDS": "60",
+        }
+    )
+
+    assert settings.http_warmup_connections == 4
+    assert settings.http_warmup_timeout_seconds == 2.5
+    assert settings.http_dns_cache_ttl_seconds == 60.0
+    with pytest.raises(ConfigurationError):
+        Settings.from_env({"OPENAPI_SPEC_PATH": "./spec.yaml", "HTTP_WARMUP_CONNECTIONS": "-1"})
+
+
+def test_settings_parses_local_upstream_transports() -> None:
+    settings = Settings.from_env(
+        {
+            "OPENAPI_SPEC_PATH": "./spec.yaml",
+            "HTTP_UDS_ORIGINS": "http://sidecar.local=/run/sidecar.sock",
+            "HTTP_ASGI_ORIGINS": "http://pets.internal=pets.app:create_app",
+        }
+    )
+
+    assert settings.http_uds_origins == {"http://sidecar.local": "/run/sidecar.sock"}
+    assert settings.http_asgi_origins == {"http://pets.internal": "pets.app:create_app"}
+    with pytest.raises(ConfigurationError):
+        Settings.from_env(
+            {"OPENAPI_SPEC_PATH": "./spec.yaml", "HTTP_ASGI_ORIGINS": "http://pets.internal=pets"}
+        )
+    with pytest.raises(ConfigurationError):
+        Settings.from_env(
+            {
+                "OPENAPI_SPEC_PATH": "./spec.yaml",
+                "HTTP_UDS_ORIGINS": "http://pets.internal=/run/pets.sock",
+                "HTTP_ASGI_ORIGINS": "http://pets.internal=pets.app:app",
+            }
+        )
+
+
+def test_settings_parses_outbound_credentials_without_exposing_them() -> None:
+    settings = Settings.from_env(
+        {
+            "OPENAPI_SPEC_PATH": "./spec.yaml",
+            "HTTP_AUTH_API_KEYS": "apiKey=s3cr3t==",
+            "HTTP_AUTH_OAUTH2_CLIENTS": "oauth=client:pa:ss",
+            "HTTP_AUTH_REFRESH_AHEAD_SECONDS": "30",
+        }
+    )
+
+    assert settings.http_auth_api_keys == {"apiKey": "s3cr3t=="}
+    assert settings.http_auth_oauth2_clients == {"oauth": ("client", "pa:ss")}
+    assert settings.http_auth_refresh_ahead_seconds == 30.0
+    assert "s3cr3t" not in repr(settings) and "pa:ss" not in repr(settings)
+    with pytest.raises(ConfigurationError):
+        Settings.from_env(
+            {"OPENAPI_SPEC_PATH": "./spec.yaml", "HTTP_AUTH_OAUTH2_CLIENTS": "oauth=client"}
+        )
+
+
+def test_settings_parses_pagination_limits() -> None:
+    settings = Settings.from_env(
+        {
+            "OPENAPI_SPEC_PATH": "./spec.yaml",
+            "HTTP_PAGINATION_MAX_PAGES": "5",
+            "HTTP_PAGINATION_MAX_ITEMS": "200",
+            "HTTP_PAGINATION_MAX_BYTES": "1048576",
+            "HTTP_PAGINATION_CONCURRENCY": "2",
+        }
+    )
+
+    assert settings.http_pagination_max_pages == 5
+    assert settings.http_pagination_max_items == 200
+    assert settings.http_pagination_max_bytes == 1048576
+    assert settings.http_pagination_concurrency == 2
+    with pytest.raises(ConfigurationError):
+        Settings.from_env({"OPENAPI_SPEC_PATH": "./spec.yaml", "HTTP_PAGINATION_MAX_PAGES": "0"})
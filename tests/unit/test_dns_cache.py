@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import asyncio
+
+import httpcore
+import pytest
+
+from openapi_to_mcp.adapters.dns_cache import CachingNetworkBackend, DnsCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class RecordingBackend(httpcore.AsyncNetworkBackend):
+    def __init__(self, reachable: set[str]) -> None:
+        self.reachable = reachable
+        self.attempts: list[str] = []
+
+    async def connect_tcp(self, host, port, timeout=None, local_address=None, socket_options=None):
+        self.attempts.append(host)
+        if host not in self.reachable:
+            raise httpcore.ConnectError(f"{host} unreachable")
+        return httpcore.AsyncMockStream([])
+
+
+def test_dns_cache_reuses_answers_until_the_ttl_expires() -> None:
+    clock = FakeClock()
+    lookups: list[str] = []
+
+    async def resolver(host: str, port: int) -> list[str]:
+        lookups.append(host)
+        return ["10.0.0.1"]
+
+    cache = DnsCache(ttl_seconds=30.0, clock=clock, resolver=resolver)
+
+    async def scenario() -> None:
+        assert await cache.resolve("api.example.com", 443) == ["10.0.0.1"]
+        assert await cache.resolve("api.example.com", 443) == ["10.0.0.1"]
+        assert await cache.resolve("127.0.0.1", 443) == ["127.0.0.1"]
+        clock.now = 31.0
+        await cache.resolve("api.example.com", 443)
+
+    asyncio.run(scenario())
+
+    assert lookups == ["api.example.com", "api.example.com"]
+
+
+def test_caching_backend_tries_each_address_and_forgets_dead_ones() -> None:
+    lookups: list[str] = []
+
+    async def resolver(host: str, port: int) -> list[str]:
+        lookups.append(host)
+        return ["10.0.0.1", "10.0.0.2"]
+
+    inner = RecordingBackend(reachable={"10.0.0.2"})
+    backend = CachingNetworkBackend(DnsCache(resolver=resolver), backend=inner)
+
+    async def scenario() -> None:
+        await backend.connect_tcp("api.example.com", 443)
+        inner.reachable.clear()
+        with pytest.raises(httpcore.ConnectError):
+            await backend.connect_tcp("api.example.com", 443)
+        inner.reachable.add("10.0.0.1")
+        await backend.connect_tcp("api.example.com", 443)
+
+    asyncio.run(scenario())
+
+    assert inner.attempts == ["10.0.0.1", "10.0.0.2", "10.0.0.1", "10.0.0.2", "10.0.0.1"]
+    assert lookups == ["api.example.com", "api.example.com"]
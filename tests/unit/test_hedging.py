@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from openapi_to_mcp.adapters.hedging import HedgePolicy, Hedger
+from openapi_to_mcp.adapters.latency_tracker import LatencyTracker
+
+
+def _tracker(latency: float, samples: int = 20) -> LatencyTracker:
+    tracker = LatencyTracker(min_samples=samples)
+    for _ in range(samples):
+        tracker.record("search", latency)
+    return tracker
+
+
+def test_latency_tracker_needs_min_samples_and_returns_nearest_rank() -> None:
+    tracker = LatencyTracker(window_size=10, min_samples=5)
+    for value in (0.5, 0.1, 0.4):
+        tracker.record("op", value)
+    assert tracker.percentile("op", 0.9) is None
+
+    for value in (0.2, 0.3):
+        tracker.record("op", value)
+    assert tracker.percentile("op", 0.5) == 0.3
+    assert tracker.percentile("op", 0.99) == 0.5
+
+
+def test_hedger_sends_hedge_after_percentile_delay_and_cancels_loser() -> None:
+    hedger = Hedger(HedgePolicy(budget_ratio=1.0), _tracker(0.01))
+    started: list[int] = []
+    cancelled: list[int] = []
+
+    async def attempt() -> str:
+        index = len(started)
+        started.append(index)
+        try:
+            await asyncio.sleep(1.0 if index == 0 else 0.0)
+        except asyncio.CancelledError:
+            cancelled.append(index)
+            raise
+        return f"attempt-{index}"
+
+    result = asyncio.run(hedger.run("search", attempt))
+
+    assert result == "attempt-1"
+    assert started == [0, 1]
+    assert cancelled == [0]
+
+
+def test_hedger_skips_hedge_without_samples_budget_or_matching_operation() -> None:
+    calls: list[int] = []
+
+    async def attempt() -> int:
+        calls.append(1)
+        await asyncio.sleep(0.02)
+        return len(calls)
+
+    async def scenario() -> None:
+        cold = Hedger(HedgePolicy(budget_ratio=1.0), LatencyTracker())
+        assert await cold.run("search", attempt) == 1
+
+        other = Hedger(HedgePolicy(operations=frozenset({"report"})), _tracker(0.001))
+        assert await other.run("search", attempt) == 2
+
+        thrifty = Hedger(HedgePolicy(budget_ratio=0.01), _tracker(0.001))
+        await thrifty.run("search", attempt)  # initial token funds one hedge
+        calls.clear()
+        await thrifty.run("search", attempt)
+        assert calls == [1]
+
+    asyncio.run(scenario())
+
+
+def test_hedger_falls_back_to_the_other_attempt_when_one_fails() -> None:
+    hedger = Hedger(HedgePolicy(budget_ratio=1.0), _tracker(0.001))
+    started: list[int] = []
+
+    async def attempt() -> str:
+        index = len(started)
+        started.append(index)
+        if index == 1:
+            raise RuntimeError("hedge failed")
+        await asyncio.sleep(0.02)
+        return "primary"
+
+    assert asyncio.run(hedger.run("search", attempt)) == "primary"
+
+    async def always_fails() -> str:
+        await asyncio.sleep(0.01)
+        raise RuntimeError("down")
+
+    with pytest.raises(RuntimeError, match="down"):
+        asyncio.run(hedger.run("search", always_fails))
+
+
+def test_hedger_starts_the_delay_once_the_primary_is_dispatched() -> None:
+    started: list[int] = []
+
+    async def scenario(track_dispatch: bool) -> None:
+        dispatched = asyncio.Event()
+
+        async def attempt() -> int:
+            started.append(1)
+            # Queued for capacity well past the hedge delay, then answered quickly.
+            await asyncio.sleep(0.05)
+            dispatched.set()
+            await asyncio.sleep(0.002)
+            return 1
+
+        hedger = Hedger(HedgePolicy(budget_ratio=1.0), _tracker(0.01))
+        await hedger.run("search", attempt, dispatched if track_dispatch else None)
+
+    asyncio.run(scenario(track_dispatch=True))
+    assert started == [1]
+
+    asyncio.run(scenario(track_dispatch=False))
+    assert started == [1, 1, 1]
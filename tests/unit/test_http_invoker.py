@@ -0,0 +1,1012 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any, AsyncIterator
+
+import httpx
+import pytest
+
+from openapi_to_mcp.adapters.adaptive_timeout import AdaptiveTimeoutPolicy, AdaptiveTimeouts
+from openapi_to_mcp.adapters.admission import AdmissionController
+from openapi_to_mcp.adapters.auth import OutboundAuth, TokenCache
+from openapi_to_mcp.adapters.bulkhead import BulkheadRegistry
+from openapi_to_mcp.adapters.circuit_breaker import CircuitBreakerPolicy, CircuitBreakerRegistry
+from openapi_to_mcp.adapters.hedging import HedgePolicy, Hedger
+from openapi_to_mcp.adapters.http_invoker import HttpxInvokerAdapter
+from openapi_to_mcp.adapters.json_codec import StdlibJsonCodec
+from openapi_to_mcp.adapters.latency_tracker import LatencyTracker
+from openapi_to_mcp.adapters.load_balancer import LoadBalancer, LoadBalancerPolicy
+from openapi_to_mcp.adapters.rate_limiter import RateLimitPacer
+from openapi_to_mcp.adapters.response_cache import ResponseCache
+from openapi_to_mcp.adapters.retry import RetryPolicy
+from openapi_to_mcp.adapters.scheduler import FairScheduler
+from openapi_to_mcp.adapters.singleflight import SingleFlight
+from openapi_to_mcp.adapters.upstream_pool import UpstreamPoolManager
+from openapi_to_mcp.domain.models import InvocationPlan, OperationTimeouts
+from openapi_to_mcp.errors import (
+    CircuitOpenError,
+    DeadlineExceededError,
+    InvocationError,
+    OverloadedError,
+)
+from openapi_to_mcp.request_context import (
+    bind_deadline,
+    bind_session_id,
+    reset_deadline,
+    reset_session_id,
+)
+
+_BINDING = {
+    "method": "get",
+    "path": "/pets/{petId}",
+    "server_url": "https://api.example.com/v1",
+    "path_params": ["petId"],
+    "query_params": ["verbose"],
+    "header_params": ["X-Trace"],
+}
+
+
+def _mock_pool(handler, created_clients: list[str] | None = None) -> UpstreamPoolManager:
+    def client_factory(origin: str) -> httpx.AsyncClient:
+        if created_clients is not None:
+            created_clients.append(origin)
+        return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    return UpstreamPoolManager(client_factory=client_factory)
+
+
+def _build_invoker(
+    handler, created_clients: list[str] | None = None, **adapter_kwargs: Any
+) -> HttpxInvokerAdapter:
+    return HttpxInvokerAdapter(pool=_mock_pool(handler, created_clients), **adapter_kwargs)
+
+
+def test_invoker_renders_request_and_normalizes_response() -> None:
+    seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, json={"id": "a b"})
+
+    invoker = _build_invoker(handler)
+    result = asyncio.run(
+        invoker.invoke(_BINDING, {"petId": "a b", "verbose": True, "X-Trace": 7})
+    )
+
+    assert result["status_code"] == 200
+    assert result["body"] == {"id": "a b"}
+    assert str(seen[0].url) == "https://api.example.com/v1/pets/a%20b?verbose=true"
+    assert seen[0].headers["X-Trace"] == "7"
+
+
+def test_invoker_executes_compiled_plans_like_bindings() -> None:
+    seen: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(str(request.url))
+        return httpx.Response(200, json={})
+
+    binding = {
+        **_BINDING,
+        "path": "/owners/{ownerId}/pets/{petId}/{unknown}",
+        "path_params": ["ownerId", "petId"],
+    }
+    plan = InvocationPlan.from_binding(binding)
+    invoker = _build_invoker(handler)
+    payload = {"ownerId": "o/1", "petId": 2, "verbose": False}
+
+    async def scenario() -> None:
+        await invoker.invoke(binding, payload)
+        await invoker.invoke(plan, payload)
+
+    asyncio.run(scenario())
+
+    expected = "https://api.example.com/v1/owners/o%2F1/pets/2/%7Bunknown%7D?verbose=false"
+    assert seen == [expected, expected]
+    assert plan.path_placeholders == ("ownerId", "petId")
+
+
+def test_invoker_encodes_request_body_with_codec() -> None:
+    seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, content=b'{"created":true}')
+
+    invoker = _build_invoker(handler, codec=StdlibJsonCodec())
+    result = asyncio.run(
+        invoker.invoke({**_BINDING, "method": "post"}, {"petId": "1", "body": {"name": "Rex"}})
+    )
+
+    assert seen[0].content == b'{"name":"Rex"}'
+    assert seen[0].headers["Content-Type"] == "application/json"
+    assert result["body"] == {"created": True}
+
+
+def test_invoker_reuses_pooled_client_across_calls() -> None:
+    created: list[str] = []
+    invoker = _build_invoker(lambda request: httpx.Response(200, text="ok"), created)
+
+    async def scenario() -> None:
+        for pet_id in ("1", "2", "3"):
+            result = await invoker.invoke(_BINDING, {"petId": pet_id})
+            assert result["body"] == "ok"
+
+    asyncio.run(scenario())
+
+    assert created == ["https://api.example.com:443"]
+
+
+def test_invoker_wraps_transport_errors() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("boom", request=request)
+
+    invoker = _build_invoker(handler)
+
+    with pytest.raises(InvocationError):
+        asyncio.run(invoker.invoke(_BINDING, {"petId": "1"}))
+
+
+def test_invoker_requires_path_parameters() -> None:
+    invoker = _build_invoker(lambda request: httpx.Response(200))
+
+    with pytest.raises(InvocationError):
+        asyncio.run(invoker.invoke(_BINDING, {}))
+
+
+def test_invoker_holds_operation_partition_slot_during_call() -> None:
+    bulkheads = BulkheadRegistry(operation_max_in_flight=1)
+    observed: list[int] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        observed.append(bulkheads.partition("operation", "getPet").in_flight)
+        return httpx.Response(200)
+
+    invoker = _build_invoker(handler, bulkheads=bulkheads)
+    asyncio.run(invoker.invoke({**_BINDING, "tool_name": "getPet"}, {"petId": "1"}))
+
+    assert observed == [1]
+    assert bulkheads.partition("operation", "getPet").in_flight == 0
+
+
+def test_invoker_serves_fresh_cache_hits_and_revalidates_stale_entries() -> None:
+    seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304, headers={"Cache-Control": "max-age=60"})
+        return httpx.Response(
+            200, json={"id": 1}, headers={"ETag": '"v1"', "Cache-Control": "no-cache"}
+        )
+
+    invoker = _build_invoker(handler, response_cache=ResponseCache(max_bytes=10_000))
+    binding = {**_BINDING, "cacheable": True}
+
+    async def scenario() -> list[dict]:
+        return [await invoker.invoke(binding, {"petId": "1"}) for _ in range(3)]
+
+    first, revalidated, hit = asyncio.run(scenario())
+
+    assert len(seen) == 2
+    assert seen[1].headers["If-None-Match"] == '"v1"'
+    assert first["body"] == revalidated["body"] == hit["body"] == {"id": 1}
+    assert revalidated["status_code"] == 200
+
+
+def test_invoker_only_revalidates_safe_methods() -> None:
+    seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(
+            200, json={"id": 1}, headers={"ETag": '"v1"', "Cache-Control": "no-cache"}
+        )
+
+    invoker = _build_invoker(handler, response_cache=ResponseCache(max_bytes=10_000))
+    binding = {**_BINDING, "method": "put", "cacheable": True}
+
+    async def scenario() -> None:
+        for _ in range(2):
+            await invoker.invoke(binding, {"petId": "1", "body": {"name": "Rex"}})
+
+    asyncio.run(scenario())
+
+    # A stale entry for a write must not turn into an If-None-Match precondition.
+    assert len(seen) == 2
+    assert "If-None-Match" not in seen[1].headers
+
+
+def test_invoker_bypasses_cache_for_non_cacheable_bindings() -> None:
+    calls: list[int] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(1)
+        return httpx.Response(200, json={}, headers={"Cache-Control": "max-age=60"})
+
+    invoker = _build_invoker(handler, response_cache=ResponseCache(max_bytes=10_000))
+
+    async def scenario() -> None:
+        for _ in range(2):
+            await invoker.invoke({**_BINDING, "cacheable": False}, {"petId": "1"})
+
+    asyncio.run(scenario())
+
+    assert len(calls) == 2
+
+
+def test_invoker_coalesces_identical_concurrent_safe_calls() -> None:
+    calls: list[str] = []
+
+    async def scenario() -> list[dict]:
+        release = asyncio.Event()
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request.method)
+            await release.wait()
+            return httpx.Response(200, json={"id": 1})
+
+        invoker = _build_invoker(handler, singleflight=SingleFlight())
+        post_binding = {**_BINDING, "method": "POST"}
+        tasks = [
+            asyncio.create_task(invoker.invoke(_BINDING, {"petId": "1"})),
+            asyncio.create_task(invoker.invoke(_BINDING, {"petId": "1"})),
+            asyncio.create_task(invoker.invoke(_BINDING, {"petId": "2"})),
+            asyncio.create_task(invoker.invoke(post_binding, {"petId": "1"})),
+            asyncio.create_task(invoker.invoke(post_binding, {"petId": "1"})),
+        ]
+        await asyncio.sleep(0.01)
+        release.set()
+        return await asyncio.gather(*tasks)
+
+    results = asyncio.run(scenario())
+
+    assert calls.count("GET") == 2
+    assert calls.count("POST") == 2
+    assert all(result["body"] == {"id": 1} for result in results)
+
+
+def test_invoker_passthrough_forwards_raw_text_and_filters_headers() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200,
+            content=b'[{"id":1},{"id":2}]',
+            headers={"Content-Type": "application/json", "ETag": '"v1"', "X-Internal": "1"},
+        )
+
+    invoker = _build_invoker(
+        handler,
+        passthrough=True,
+        header_allowlist=("Content-Type", "ETag", "Retry-After"),
+    )
+
+    async def scenario() -> tuple[dict, dict]:
+        raw = await invoker.invoke(_BINDING, {"petId": "1"})
+        parsed = await invoker.invoke({**_BINDING, "passthrough": False}, {"petId": "1"})
+        return raw, parsed
+
+    raw, parsed = asyncio.run(scenario())
+
+    assert raw["body"] == '[{"id":1},{"id":2}]'
+    assert raw["passthrough"] is True
+    assert raw["headers"] == {"content-type": "application/json", "etag": '"v1"'}
+    assert parsed["body"] == [{"id": 1}, {"id": 2}]
+    assert "passthrough" not in parsed
+
+
+def test_invoker_truncates_bodies_above_the_operation_cap() -> None:
+    chunks_sent: list[int] = []
+
+    async def body() -> AsyncIterator[bytes]:
+        for _ in range(100):
+            chunks_sent.append(1)
+            yield b"x" * 1024
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/small"):
+            return httpx.Response(200, json={"ok": True})
+        return httpx.Response(200, content=body(), headers={"Content-Type": "text/plain"})
+
+    invoker = _build_invoker(
+        handler,
+        max_response_bytes=4096,
+        max_response_bytes_overrides={"export": 2500},
+    )
+
+    async def scenario() -> tuple[dict, dict]:
+        exported = await invoker.invoke({**_BINDING, "tool_name": "export"}, {"petId": "big"})
+        small = await invoker.invoke(_BINDING, {"petId": "small"})
+        return exported, small
+
+    exported, small = asyncio.run(scenario())
+
+    assert exported["truncated"] is True
+    assert exported["max_response_bytes"] == 2500
+    assert exported["body"] == "x" * 2500
+    assert len(chunks_sent) < 100
+    assert small["body"] == {"ok": True}
+    assert "truncated" not in small
+
+
+def _retrying_invoker(handler, policy: RetryPolicy) -> HttpxInvokerAdapter:
+    return _build_invoker(handler, retry_policy=policy)
+
+
+def test_invoker_retries_idempotent_calls_on_transient_failures() -> None:
+    attempts: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        attempts.append(request.method)
+        if len(attempts) == 1:
+            raise httpx.ConnectError("reset", request=request)
+        if len(attempts) == 2:
+            return httpx.Response(503, headers={"Retry-After": "0"})
+        return httpx.Response(200, json={"ok": True})
+
+    invoker = _retrying_invoker(handler, RetryPolicy(max_attempts=3, base_delay_seconds=0.001))
+    result = asyncio.run(invoker.invoke({**_BINDING, "idempotent": True}, {"petId": "1"}))
+
+    assert result["body"] == {"ok": True}
+    assert len(attempts) == 3
+
+
+def test_invoker_does_not_retry_non_idempotent_or_long_retry_after() -> None:
+    attempts: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        attempts.append(request.method)
+        return httpx.Response(503, headers={"Retry-After": "120"})
+
+    invoker = _retrying_invoker(handler, RetryPolicy(max_attempts=3, base_delay_seconds=0.001))
+
+    async def scenario() -> None:
+        await invoker.invoke({**_BINDING, "method": "post"}, {"petId": "1"})
+        await invoker.invoke({**_BINDING, "idempotent": True}, {"petId": "1"})
+
+    asyncio.run(scenario())
+
+    assert attempts == ["POST", "GET"]
+
+
+def test_invoker_stops_retrying_when_budget_is_exhausted() -> None:
+    attempts: list[int] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        attempts.append(1)
+        raise httpx.ConnectError("down", request=request)
+
+    policy = RetryPolicy(
+        max_attempts=5,
+        base_delay_seconds=0.001,
+        budget_ratio=0.01,
+        budget_min_retries_per_second=0.001,
+    )
+    invoker = _retrying_invoker(handler, policy)
+
+    async def scenario() -> None:
+        for _ in range(4):
+            with pytest.raises(InvocationError):
+                await invoker.invoke({**_BINDING, "idempotent": True}, {"petId": "1"})
+
+    asyncio.run(scenario())
+
+    # The initial budget allows 10 retries in total, far fewer than 4 calls x 4 retries.
+    assert len(attempts) == 4 + 10
+
+
+def test_invoker_hedges_slow_safe_calls_through_its_slots() -> None:
+    requests: list[int] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(1)
+        if len(requests) == 1:
+            await asyncio.sleep(1.0)
+        return httpx.Response(200, json={"attempt": len(requests)})
+
+    latencies = LatencyTracker(min_samples=1)
+    latencies.record("getPet", 0.005)
+    invoker = _build_invoker(
+        handler,
+        latencies=latencies,
+        hedger=Hedger(HedgePolicy(budget_ratio=1.0), latencies),
+    )
+
+    result = asyncio.run(invoker.invoke({**_BINDING, "tool_name": "getPet"}, {"petId": "1"}))
+
+    assert result["body"] == {"attempt": 2}
+    assert len(requests) == 2
+    assert latencies.percentile("getPet", 0.5) is not None
+
+
+def test_invoker_fails_fast_while_the_circuit_is_open() -> None:
+    attempts: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        attempts.append(request.url.path)
+        if len(attempts) == 1:
+            raise httpx.ConnectError("refused", request=request)
+        return httpx.Response(503)
+
+    breakers = CircuitBreakerRegistry(
+        CircuitBreakerPolicy(minimum_calls=2, failure_rate_threshold=0.5)
+    )
+    invoker = _build_invoker(
+        handler,
+        retry_policy=RetryPolicy(max_attempts=3, base_delay_seconds=0.001),
+        breakers=breakers,
+    )
+
+    async def scenario() -> None:
+        with pytest.raises(CircuitOpenError):
+            await invoker.invoke({**_BINDING, "idempotent": True}, {"petId": "1"})
+        with pytest.raises(CircuitOpenError):
+            await invoker.invoke({**_BINDING, "idempotent": True}, {"petId": "2"})
+
+    asyncio.run(scenario())
+
+    assert attempts == ["/v1/pets/1", "/v1/pets/1"]
+    assert breakers.breaker("origin", "https://api.example.com:443").state == "open"
+
+
+def test_invoker_balances_across_servers_and_retries_on_another_one() -> None:
+    hosts: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        hosts.append(request.url.host)
+        if request.url.host == "eu.example.com":
+            raise httpx.ConnectError("refused", request=request)
+        return httpx.Response(200, json={"path": request.url.path})
+
+    invoker = _build_invoker(
+        handler,
+        retry_policy=RetryPolicy(max_attempts=2, base_delay_seconds=0.001),
+        balancer=LoadBalancer(LoadBalancerPolicy(eject_consecutive_failures=1)),
+    )
+    binding = {
+        **_BINDING,
+        "idempotent": True,
+        "server_url": "https://eu.example.com/v1",
+        "server_urls": ["https://eu.example.com/v1", "https://us.example.com/v1"],
+    }
+
+    async def scenario() -> list[dict]:
+        return [await invoker.invoke(binding, {"petId": str(index)}) for index in range(4)]
+
+    results = asyncio.run(scenario())
+
+    assert [result["body"]["path"] for result in results] == [
+        f"/v1/pets/{index}" for index in range(4)
+    ]
+    # The first failure ejects the EU server; its call is retried on the US one.
+    assert hosts.count("eu.example.com") <= 1
+    assert hosts.count("us.example.com") == 4
+
+
+def test_invoker_routes_around_a_server_whose_breaker_is_open() -> None:
+    hosts: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        hosts.append(request.url.host)
+        return httpx.Response(200, json={})
+
+    now = [0.0]
+    breakers = CircuitBreakerRegistry(
+        CircuitBreakerPolicy(minimum_calls=2, open_seconds=30.0), clock=lambda: now[0]
+    )
+    operation = "GET /pets/{petId}"
+    for _ in range(2):
+        breakers.record("https://eu.example.com:443", operation, failed=True)
+    invoker = _build_invoker(
+        handler,
+        breakers=breakers,
+        balancer=LoadBalancer(LoadBalancerPolicy()),
+    )
+    binding = {
+        **_BINDING,
+        "server_url": "https://eu.example.com/v1",
+        "server_urls": ["https://eu.example.com/v1", "https://us.example.com/v1"],
+    }
+
+    async def scenario() -> list[int]:
+        results = [await invoker.invoke(binding, {"petId": str(index)}) for index in range(20)]
+        # Half-open with its probe taken: the balancer may pick it, and the call is re-routed.
+        now[0] = 31.0
+        breakers.acquire("https://eu.example.com:443", operation)
+        results += [await invoker.invoke(binding, {"petId": str(index)}) for index in range(20)]
+        return [result["status_code"] for result in results]
+
+    assert asyncio.run(scenario()) == [200] * 40
+    assert set(hosts) == {"us.example.com"}
+    # The healthy server's operation breaker never saw the other server's failures.
+    assert breakers.breaker("operation", f"https://us.example.com:443 {operation}").state == (
+        "closed"
+    )
+
+
+def test_invoker_routes_to_the_selected_server_variant() -> None:
+    seen: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(str(request.url))
+        return httpx.Response(200, json={})
+
+    binding = {
+        **_BINDING,
+        "server_url": "https://eu.api.example.com/v1",
+        "server_template": "https://{region}.api.example.com/v1",
+        "server_variables": {
+            "region": {"argument": "server_region", "default": "eu", "enum": ["eu", "us"]}
+        },
+    }
+    invoker = _build_invoker(handler)
+
+    async def scenario() -> None:
+        await invoker.invoke(binding, {"petId": "1"})
+        await invoker.invoke(binding, {"petId": "1", "server_region": "us"})
+        with pytest.raises(InvocationError, match="server_region"):
+            await invoker.invoke(binding, {"petId": "1", "server_region": "ap"})
+
+    asyncio.run(scenario())
+
+    assert seen == [
+        "https://eu.api.example.com/v1/pets/1",
+        "https://us.api.example.com/v1/pets/1",
+    ]
+
+
+def test_invoker_paces_calls_after_upstream_reports_exhausted_quota() -> None:
+    slept: list[float] = []
+
+    async def fake_sleep(seconds: float) -> None:
+        slept.append(seconds)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200, json={}, headers={"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "3"}
+        )
+
+    invoker = _build_invoker(handler, pacer=RateLimitPacer(clock=lambda: 50.0, sleep=fake_sleep))
+
+    async def scenario() -> None:
+        await invoker.invoke(_BINDING, {"petId": "1"})
+        await invoker.invoke(_BINDING, {"petId": "2"})
+
+    asyncio.run(scenario())
+
+    assert slept == [3.0]
+
+
+def test_invoker_checks_the_breaker_before_pacing() -> None:
+    slept: list[float] = []
+
+    async def fake_sleep(seconds: float) -> None:
+        slept.append(seconds)
+
+    invoker = _build_invoker(
+        lambda request: httpx.Response(500, json={}),
+        pacer=RateLimitPacer(
+            static_rates={"https://api.example.com": 1.0}, clock=lambda: 50.0, sleep=fake_sleep
+        ),
+        breakers=CircuitBreakerRegistry(
+            CircuitBreakerPolicy(minimum_calls=2, failure_rate_threshold=0.5)
+        ),
+    )
+
+    async def scenario() -> None:
+        for pet_id in ("1", "2"):
+            await invoker.invoke(_BINDING, {"petId": pet_id})
+        with pytest.raises(CircuitOpenError):
+            await invoker.invoke(_BINDING, {"petId": "3"})
+
+    asyncio.run(scenario())
+
+    # The rejected call neither waited for nor reserved a pacing token.
+    assert slept == [1.0]
+
+
+def test_invoker_sheds_calls_beyond_the_queue_depth_bound() -> None:
+    release = asyncio.Event()
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await release.wait()
+        return httpx.Response(200, json={})
+
+    admission = AdmissionController(max_in_flight=1, max_queue_depth=1)
+    invoker = _build_invoker(handler, admission=admission, max_in_flight=1)
+
+    async def scenario() -> None:
+        running = asyncio.create_task(invoker.invoke(_BINDING, {"petId": "1"}))
+        queued = asyncio.create_task(invoker.invoke(_BINDING, {"petId": "2"}))
+        await asyncio.sleep(0.01)
+        assert admission.queued == 1
+        with pytest.raises(OverloadedError, match="queue_depth"):
+            await invoker.invoke(_BINDING, {"petId": "3"})
+        release.set()
+        await asyncio.gather(running, queued)
+
+    asyncio.run(scenario())
+
+    assert admission.queued == 0
+    assert admission.estimated_wait_seconds() == 0.0
+
+
+def test_invoker_does_not_shed_other_origins_behind_a_saturated_bulkhead() -> None:
+    release = asyncio.Event()
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.host == "slow.example.com":
+            await release.wait()
+        return httpx.Response(200, json={})
+
+    admission = AdmissionController(max_in_flight=4, max_queue_depth=1)
+    invoker = _build_invoker(
+        handler,
+        admission=admission,
+        max_in_flight=4,
+        bulkheads=BulkheadRegistry(origin_overrides={"https://slow.example.com": 1}),
+    )
+    slow = {**_BINDING, "server_url": "https://slow.example.com/v1"}
+
+    async def scenario() -> dict:
+        backlog = [
+            asyncio.create_task(invoker.invoke(slow, {"petId": str(index)})) for index in range(5)
+        ]
+        await asyncio.sleep(0.01)
+        assert admission.queued == 0
+        result = await invoker.invoke(_BINDING, {"petId": "fast"})
+        release.set()
+        await asyncio.gather(*backlog)
+        return result
+
+    assert asyncio.run(scenario())["status_code"] == 200
+
+
+def test_invoker_does_not_count_shed_calls_as_upstream_failures() -> None:
+    release = asyncio.Event()
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await release.wait()
+        return httpx.Response(200, json={})
+
+    invoker = _build_invoker(
+        handler,
+        admission=AdmissionController(max_in_flight=1, max_queue_depth=1),
+        max_in_flight=1,
+        breakers=CircuitBreakerRegistry(
+            CircuitBreakerPolicy(minimum_calls=2, failure_rate_threshold=0.5)
+        ),
+        balancer=LoadBalancer(LoadBalancerPolicy(eject_consecutive_failures=1)),
+    )
+    binding = {
+        **_BINDING,
+        "server_url": "https://a.example.com/v1",
+        "server_urls": ["https://a.example.com/v1", "https://b.example.com/v1"],
+    }
+
+    async def scenario() -> None:
+        running = asyncio.create_task(invoker.invoke(binding, {"petId": "1"}))
+        queued = asyncio.create_task(invoker.invoke(binding, {"petId": "2"}))
+        await asyncio.sleep(0.01)
+        for _ in range(3):
+            with pytest.raises(OverloadedError):
+                await invoker.invoke(binding, {"petId": "3"})
+        release.set()
+        await asyncio.gather(running, queued)
+        # A healthy upstream stays admitted after local shedding.
+        assert (await invoker.invoke(binding, {"petId": "4"}))["status_code"] == 200
+
+    asyncio.run(scenario())
+
+
+def test_invoker_takes_global_slots_from_the_fair_scheduler_per_session() -> None:
+    scheduler = FairScheduler(capacity=2)
+    in_flight: list[int] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        in_flight.append(scheduler.in_flight)
+        return httpx.Response(200, json={})
+
+    invoker = _build_invoker(handler, scheduler=scheduler)
+
+    async def scenario() -> None:
+        token = bind_session_id("chat-1")
+        try:
+            await invoker.invoke({**_BINDING, "tool_name": "getPet"}, {"petId": "1"})
+        finally:
+            reset_session_id(token)
+
+    asyncio.run(scenario())
+
+    assert in_flight == [1]
+    assert scheduler.in_flight == 0
+    assert ("chat-1", "getPet") in scheduler._flows  # noqa: SLF001
+
+
+def test_invoker_does_not_coalesce_calls_with_different_deadlines() -> None:
+    seen: list[httpx.Request] = []
+
+    async def scenario() -> None:
+        release = asyncio.Event()
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            await release.wait()
+            return httpx.Response(200, json={})
+
+        invoker = _build_invoker(handler, singleflight=SingleFlight())
+
+        async def call(deadline: str | None) -> dict:
+            token = bind_deadline(deadline)
+            try:
+                return await invoker.invoke(_BINDING, {"petId": "1"})
+            finally:
+                reset_deadline(token)
+
+        bounded = asyncio.create_task(call("5"))
+        unbounded = asyncio.create_task(call(None))
+        await asyncio.sleep(0.01)
+        release.set()
+        await asyncio.gather(bounded, unbounded)
+
+    asyncio.run(scenario())
+
+    # The caller without a deadline got its own call, not the bounded leader's.
+    assert len(seen) == 2
+    assert ["x-request-timeout" in request.headers for request in seen] == [True, False]
+
+
+def test_invoker_applies_operation_timeouts_and_forwards_the_caller_deadline() -> None:
+    seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, json={})
+
+    invoker = _build_invoker(
+        handler,
+        timeout_seconds=10.0,
+        timeout_overrides={"getPet": OperationTimeouts(read=0.5)},
+    )
+    binding = {**_BINDING, "tool_name": "getPet", "timeouts": {"connect": 0.2, "read": 3}}
+
+    async def scenario() -> None:
+        await invoker.invoke(binding, {"petId": "1"})
+        token = bind_deadline("2")
+        try:
+            await invoker.invoke(binding, {"petId": "2"})
+        finally:
+            reset_deadline(token)
+
+    asyncio.run(scenario())
+
+    assert seen[0].extensions["timeout"] == {
+        "connect": 0.2,
+        "read": 0.5,
+        "write": 10.0,
+        "pool": 10.0,
+    }
+    assert "X-Request-Timeout" not in seen[0].headers
+    assert 1.0 < float(seen[1].headers["X-Request-Timeout"]) <= 2.0
+    assert seen[1].extensions["timeout"]["write"] <= 2.0
+
+
+def test_invoker_abandons_calls_that_outlive_the_total_timeout() -> None:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(1.0)
+        return httpx.Response(200, json={})
+
+    invoker = _build_invoker(handler)
+    binding = {**_BINDING, "timeouts": {"total": 0.05}}
+
+    with pytest.raises(DeadlineExceededError, match="Deadline exceeded"):
+        asyncio.run(invoker.invoke(binding, {"petId": "1"}))
+
+
+def test_invoker_learns_timeouts_from_successful_calls_only() -> None:
+    seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(503 if request.url.params.get("fail") else 200, json={})
+
+    timeouts = AdaptiveTimeouts(
+        AdaptiveTimeoutPolicy(min_seconds=0.25, max_seconds=2.0),
+        latencies=LatencyTracker(min_samples=2),
+    )
+    invoker = _build_invoker(handler, adaptive_timeouts=timeouts)
+    binding = {**_BINDING, "tool_name": "getPet", "query_params": ["fail"]}
+
+    async def scenario() -> None:
+        for _ in range(3):
+            await invoker.invoke(binding, {"petId": "1", "fail": True})
+        assert timeouts.timeout_for("getPet") is None
+        for _ in range(3):
+            await invoker.invoke(binding, {"petId": "1"})
+
+    asyncio.run(scenario())
+
+    assert timeouts.timeout_for("getPet") == 0.25
+    assert seen[-1].extensions["timeout"]["read"] == 0.25
+    assert seen[0].extensions["timeout"]["read"] == 5.0
+
+
+def test_invoker_grows_a_learned_timeout_back_after_a_latency_step() -> None:
+    latency = 0.0
+    outcomes: list[str] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        read_timeout = request.extensions["timeout"]["read"]
+        if latency > read_timeout:
+            await asyncio.sleep(read_timeout)
+            raise httpx.ReadTimeout("timed out", request=request)
+        return httpx.Response(200, json={})
+
+    timeouts = AdaptiveTimeouts(
+        AdaptiveTimeoutPolicy(min_seconds=0.02, max_seconds=2.0),
+        latencies=LatencyTracker(min_samples=2),
+    )
+    invoker = _build_invoker(handler, adaptive_timeouts=timeouts)
+    binding = {**_BINDING, "tool_name": "getPet"}
+
+    async def scenario() -> None:
+        nonlocal latency
+        for _ in range(2):
+            await invoker.invoke(binding, {"petId": "1"})
+        latency = 0.1
+        for _ in range(6):
+            try:
+                await invoker.invoke(binding, {"petId": "1"})
+            except InvocationError:
+                outcomes.append("timeout")
+            else:
+                outcomes.append("ok")
+
+    asyncio.run(scenario())
+
+    # Each timeout is a censored sample, so the learned 0.02 s timeout doubles until it fits.
+    assert outcomes[0] == "timeout" and outcomes[-2:] == ["ok", "ok"]
+    assert outcomes.count("timeout") <= 4
+
+
+def test_invoker_sends_oauth_tokens_and_refetches_after_unauthorized() -> None:
+    seen: list[httpx.Request] = []
+    issued: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/token":
+            issued.append(f"token-{len(issued) + 1}")
+            return httpx.Response(200, json={"access_token": issued[-1], "expires_in": 3600})
+        seen.append(request)
+        status = 401 if request.headers["Authorization"] == "Bearer token-1" else 200
+        return httpx.Response(status, json={})
+
+    invoker = _build_invoker(
+        handler,
+        auth=OutboundAuth(tokens=TokenCache(_mock_pool(handler), {"oauth": ("client", "secret")})),
+    )
+    binding = {
+        **_BINDING,
+        "security": [
+            [{"scheme": "oauth", "type": "oauth2", "token_url": "https://auth.example.com/token"}]
+        ],
+    }
+
+    async def scenario() -> list[int]:
+        return [
+            (await invoker.invoke(binding, {"petId": "1"}))["status_code"] for _ in range(3)
+        ]
+
+    assert asyncio.run(scenario()) == [401, 200, 200]
+    assert issued == ["token-1", "token-2"]
+    assert [request.headers["Authorization"] for request in seen] == [
+        "Bearer token-1",
+        "Bearer token-2",
+        "Bearer token-2",
+    ]
+
+
+def test_invoker_keeps_token_endpoint_failures_out_of_upstream_breakers() -> None:
+    idp_up = False
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/token":
+            if not idp_up:
+                return httpx.Response(503)
+            return httpx.Response(200, json={"access_token": "token", "expires_in": 3600})
+        return httpx.Response(200, json={})
+
+    invoker = _build_invoker(
+        handler,
+        auth=OutboundAuth(tokens=TokenCache(_mock_pool(handler), {"oauth": ("client", "secret")})),
+        breakers=CircuitBreakerRegistry(
+            CircuitBreakerPolicy(minimum_calls=2, failure_rate_threshold=0.5)
+        ),
+    )
+    binding = {
+        **_BINDING,
+        "security": [
+            [{"scheme": "oauth", "type": "oauth2", "token_url": "https://auth.example.com/token"}]
+        ],
+    }
+
+    async def scenario() -> int:
+        nonlocal idp_up
+        for _ in range(3):
+            with pytest.raises(InvocationError, match="Token request"):
+                await invoker.invoke(binding, {"petId": "1"})
+        idp_up = True
+        return (await invoker.invoke(binding, {"petId": "1"}))["status_code"]
+
+    # The API's breaker never saw the identity provider outage.
+    assert asyncio.run(scenario()) == 200
+
+
+def test_invoker_merges_declared_pages_into_one_result() -> None:
+    seen: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(str(request.url))
+        cursor = request.url.params.get("cursor")
+        if cursor is None:
+            return httpx.Response(200, json={"pets": [{"id": 1}], "next": "b"})
+        return httpx.Response(200, json={"pets": [{"id": 2}], "next": None})
+
+    invoker = _build_invoker(handler)
+    binding = {
+        **_BINDING,
+        "pagination": {
+            "style": "cursor",
+            "items": "pets",
+            "cursor_param": "cursor",
+            "next_cursor": "next",
+        },
+    }
+    result = asyncio.run(invoker.invoke(binding, {"petId": "1", "verbose": True}))
+
+    assert result["body"] == {"pets": [{"id": 1}, {"id": 2}], "next": "b"}
+    assert result["pagination"]["pages"] == 2 and result["pagination"]["complete"]
+    assert seen[1] == "https://api.example.com/v1/pets/1?verbose=true&cursor=b"
+
+
+def test_invoker_projects_requested_fields_even_in_passthrough_mode() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, text='{"id": 1, "name": "Rex", "owner": {"name": "Ann"}}')
+
+    invoker = _build_invoker(handler, passthrough=True)
+    binding = {**_BINDING, "projection_argument": "fields"}
+
+    async def scenario() -> list[Any]:
+        projected = await invoker.invoke(binding, {"petId": "1", "fields": ["owner.name"]})
+        full = await invoker.invoke(binding, {"petId": "1"})
+        return [projected["body"], full["body"]]
+
+    projected, full = asyncio.run(scenario())
+    assert projected == {"owner": {"name": "Ann"}}
+    assert full == '{"id": 1, "name": "Rex", "owner": {"name": "Ann"}}'
+    with pytest.raises(InvocationError, match="fields must be a list"):
+        asyncio.run(invoker.invoke(binding, {"petId": "1", "fields": {"owner": 1}}))
+
+
+def test_invoker_coalesces_projected_and_passthrough_calls_separately() -> None:
+    calls: list[str] = []
+
+    async def scenario() -> list[Any]:
+        release = asyncio.Event()
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request.method)
+            await release.wait()
+            return httpx.Response(200, text='{"id": 1, "name": "Rex"}')
+
+        invoker = _build_invoker(handler, passthrough=True, singleflight=SingleFlight())
+        binding = {**_BINDING, "projection_argument": "fields"}
+        raw = asyncio.create_task(invoker.invoke(binding, {"petId": "1"}))
+        projected = asyncio.create_task(
+            invoker.invoke(binding, {"petId": "1", "fields": ["name"]})
+        )
+        await asyncio.sleep(0.01)
+        release.set()
+        return [(await raw)["body"], (await projected)["body"]]
+
+    assert asyncio.run(scenario()) == ['{"id": 1, "name": "Rex"}', {"name": "Rex"}]
+    assert calls == ["GET", "GET"]
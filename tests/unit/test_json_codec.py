@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import pytest
+
+from openapi_to_mcp.adapters import json_codec
+from openapi_to_mcp.adapters.json_codec import StdlibJsonCodec, build_json_codec
+from openapi_to_mcp.errors import ConfigurationError
+
+
+@dataclass(frozen=True)
+class _Point:
+    x: int
+    y: int
+
+
+def test_stdlib_codec_round_trips_compact_utf8() -> None:
+    codec = StdlibJsonCodec()
+
+    encoded = codec.dumps({"name": "café", "items": [1, 2], "point": _Point(1, 2)})
+
+    assert encoded == '{"name":"café","items":[1,2],"point":{"x":1,"y":2}}'.encode()
+    assert codec.loads(encoded)["name"] == "café"
+    with pytest.raises(ValueError):
+        codec.loads(b"not json")
+
+
+def test_build_json_codec_selects_by_name() -> None:
+    assert build_json_codec("stdlib").name == "stdlib"
+    with pytest.raises(ConfigurationError):
+        build_json_codec("simdjson")
+
+
+def test_build_json_codec_auto_falls_back_without_orjson(monkeypatch) -> None:
+    monkeypatch.setattr(json_codec, "orjson", None)
+
+    assert build_json_codec("auto").name == "stdlib"
+    with pytest.raises(ConfigurationError):
+        build_json_codec("orjson")
+
+
+def test_orjson_codec_matches_stdlib_and_handles_big_integers() -> None:
+    pytest.importorskip("orjson")
+    codec = build_json_codec("orjson")
+    value = {"name": "café", "items": [1, 2.5, None, True], "point": _Point(1, 2)}
+
+    assert codec.name == "orjson"
+    stdlib = StdlibJsonCodec()
+    assert codec.loads(codec.dumps(value)) == stdlib.loads(stdlib.dumps(value))
+    assert codec.loads(codec.dumps({"big": 2**70})) == {"big": 2**70}
+    with pytest.raises(ValueError):
+        codec.loads(b"")
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import random
+
+from openapi_to_mcp.adapters.load_balancer import LoadBalancer, LoadBalancerPolicy
+
+_SERVERS = ("https://a.example.com", "https://b.example.com")
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_balancer_prefers_lower_latency_and_fewer_in_flight_calls() -> None:
+    balancer = LoadBalancer(LoadBalancerPolicy(), rng=random.Random(7))
+    for _ in range(3):
+        balancer.on_start(_SERVERS[0])
+        balancer.on_finish(_SERVERS[0], 0.5, failed=False)
+        balancer.on_start(_SERVERS[1])
+        balancer.on_finish(_SERVERS[1], 0.05, failed=False)
+
+    assert {balancer.choose(_SERVERS) for _ in range(10)} == {_SERVERS[1]}
+
+    for _ in range(20):
+        balancer.on_start(_SERVERS[1])
+    assert balancer.choose(_SERVERS) == _SERVERS[0]
+
+
+def test_balancer_ejects_failing_server_and_readmits_it_later() -> None:
+    clock = _Clock()
+    balancer = LoadBalancer(
+        LoadBalancerPolicy(eject_consecutive_failures=2, eject_seconds=10.0),
+        clock=clock,
+        rng=random.Random(7),
+    )
+    for _ in range(2):
+        balancer.on_start(_SERVERS[0])
+        balancer.on_finish(_SERVERS[0], 0.01, failed=True)
+
+    assert {balancer.choose(_SERVERS) for _ in range(10)} == {_SERVERS[1]}
+    # Fail open when every server is ejected.
+    assert balancer.choose(_SERVERS[:1]) == _SERVERS[0]
+
+    clock.now += 10.0
+    assert _SERVERS[0] in {balancer.choose(_SERVERS) for _ in range(20)}
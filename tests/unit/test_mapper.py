@@ -19,6 +19,7 @@ def test_operation_mapper_maps_operations_and_parameters() -> None:
                 ],
                 "get": {
                     "operationId": "getPet",
+                    "x-mcp-cache": True,
                     "parameters": [
                         {
                             "name": "includeHistory",
@@ -41,6 +42,7 @@ def test_operation_mapper_maps_operations_and_parameters() -> None:
     assert op.server_url == "https://api.example.com"
     names = {f"{p['in']}:{p['name']}" for p in op.parameters}
     assert names == {"path:petId", "query:includeHistory"}
+    assert op.extensions == {"x-mcp-cache": True}
 
 
 def test_operation_mapper_uses_server_override_precedence() -> None:
@@ -78,3 +80,115 @@ def test_operation_mapper_uses_server_override_precedence() -> None:
     assert by_id["rootOnly"].server_url == "https://root.example.com"
     assert by_id["pathLevel"].server_url == "https://path.example.com"
     assert by_id["operationLevel"].server_url == "https://operation.example.com"
+    assert by_id["operationLevel"].server_urls == ["https://operation.example.com"]
+
+
+def test_operation_mapper_keeps_every_declared_server() -> None:
+    spec = {
+        "openapi": "3.1.0",
+        "servers": [
+            {"description": "no url"},
+            {"url": "https://eu.example.com"},
+            {"url": "https://us.example.com"},
+            {"url": "https://eu.example.com"},
+        ],
+        "paths": {"/pets": {"get": {"operationId": "listPets", "responses": {}}}},
+    }
+
+    (operation,) = OperationMapper().map_operations(spec)
+
+    assert operation.server_url == "https://eu.example.com"
+    assert operation.server_urls == ["https://eu.example.com", "https://us.example.com"]
+
+
+def test_operation_mapper_expands_server_variable_defaults() -> None:
+    spec = {
+        "openapi": "3.1.0",
+        "servers": [
+            {
+                "url": "https://{region}.api.example.com/{basePath}",
+                "variables": {
+                    "region": {"default": "eu", "enum": ["eu", "us"]},
+                    "basePath": {"default": "v2"},
+                },
+            }
+        ],
+        "paths": {
+            "/pets": {
+                "get": {"operationId": "listPets", "tags": ["search", 3], "responses": {}}
+            }
+        },
+    }
+
+    (operation,) = OperationMapper().map_operations(spec)
+
+    assert operation.tags == ["search"]
+    assert operation.server_url == "https://eu.api.example.com/v2"
+    assert operation.server_template == "https://{region}.api.example.com/v2"
+    assert list(operation.server_variables) == ["region"]
+
+
+def test_operation_mapper_ignores_malformed_server_variables() -> None:
+    spec = {
+        "openapi": "3.1.0",
+        "servers": [{"url": "https://api.example.com/v1", "variables": ["region"]}],
+        "paths": {"/pets": {"get": {"operationId": "listPets", "responses": {}}}},
+    }
+
+    (operation,) = OperationMapper().map_operations(spec)
+
+    assert operation.server_url == "https://api.example.com/v1"
+    assert operation.server_variables == {}
+
+
+def test_operation_mapper_resolves_supported_security_schemes() -> None:
+    spec = {
+        "openapi": "3.1.0",
+        "servers": [{"url": "https://api.example.com/v1"}],
+        "security": [{"apiKey": []}],
+        "components": {
+            "securitySchemes": {
+                "apiKey": {"type": "apiKey", "in": "header", "name": "X-API-Key"},
+                "oauth": {
+                    "type": "oauth2",
+                    "flows": {
+                        "clientCredentials": {"tokenUrl": "/oauth/token", "scopes": {}}
+                    },
+                },
+                "basic": {"type": "http", "scheme": "basic"},
+            }
+        },
+        "paths": {
+            "/pets": {
+                "get": {"operationId": "listPets", "responses": {"200": {"description": "ok"}}},
+                "post": {
+                    "operationId": "createPet",
+                    "security": [{"basic": []}, {"oauth": ["pets:write"]}, {}],
+                    "responses": {"200": {"description": "ok"}},
+                },
+                "delete": {
+                    "operationId": "deletePets",
+                    "security": [],
+                    "responses": {"200": {"description": "ok"}},
+                },
+            }
+        },
+    }
+
+    operations = {op.operation_id: op for op in OperationMapper().map_operations(spec)}
+
+    assert operations["listPets"].security == [
+        [{"scheme": "apiKey", "type": "apiKey", "in": "header", "name": "X-API-Key"}]
+    ]
+    assert operations["createPet"].security == [
+        [
+            {
+                "scheme": "oauth",
+                "type": "oauth2",
+                "token_url": "https://api.example.com/oauth/token",
+                "scopes": ["pets:write"],
+            }
+        ],
+        [],
+    ]
+    assert operations["deletePets"].security == []
@@ -57,3 +57,48 @@ def test_runtime_metrics_renders_prometheus_payload_when_enabled() -> None:
     assert b"openapi_to_mcp_http_server_requests" in payload
     assert metrics.prometheus_content_type() is not None
     metrics.shutdown()
+
+
+def test_runtime_metrics_tracks_per_origin_gauges() -> None:
+    metrics = RuntimeMetrics(max_in_flight=8, max_connections=16)
+    metrics.on_connection_pool_leased(
+        origin="https://api.example.com:443",
+        protocol_version="2",
+        active_streams=12,
+        open_connections=2,
+    )
+
+    observed = metrics._observe_open_connections(None)  # noqa: SLF001
+    assert [(o.value, o.attributes) for o in observed] == [
+        (2.0, {"upstream.origin": "https://api.example.com:443"})
+    ]
+    metrics.on_invocation_coalesced()
+    metrics.set_circuit_state(kind="origin", key="https://api.example.com:443", state="open")
+    metrics.on_circuit_rejected(kind="origin", key="https://api.example.com:443")
+    states = metrics._observe_circuit_states(None)  # noqa: SLF001
+    assert [(o.value, o.attributes["partition.kind"]) for o in states] == [(2.0, "origin")]
+    metrics.on_hedge(winner="hedge")
+    metrics.on_endpoint_ejected(origin="https://api.example.com:443")
+    metrics.on_load_shed(reason="queue_depth")
+    metrics.on_scheduler_wait(scheduling_class="batch", wait_seconds=0.01)
+    metrics.on_deadline_exceeded()
+    metrics.on_rate_limit_wait(origin="https://api.example.com:443", wait_seconds=0.25)
+    metrics.on_retry(origin="https://api.example.com:443", reason="503")
+    metrics.on_retry_budget_exhausted(origin="https://api.example.com:443")
+    metrics.on_response_received(size_bytes=2048, truncated=False)
+    metrics.on_connection_pool_warmed(origin="https://api.example.com:443", connections=2)
+    metrics.on_dns_cache_lookup("hit")
+    metrics.on_token_refresh(scheme="oauth", mode="ahead", failed=False)
+    metrics.on_pagination_completed(style="cursor", pages=3, complete=True)
+    metrics.on_connection_pool_closed("https://api.example.com:443")
+    assert metrics._observe_open_connections(None) == []  # noqa: SLF001
+
+    metrics.set_concurrency_limit(kind="origin", key="https://api.example.com:443", limit=12)
+    limits = metrics._observe_concurrency_limits(None)  # noqa: SLF001
+    assert [(o.value, o.attributes["partition.key"]) for o in limits] == [
+        (12.0, "https://api.example.com:443")
+    ]
+    metrics.set_operation_timeout(operation="getPet", timeout_seconds=0.4)
+    timeouts = metrics._observe_operation_timeouts(None)  # noqa: SLF001
+    assert [(o.value, o.attributes["partition.key"]) for o in timeouts] == [(0.4, "getPet")]
+    metrics.shutdown()
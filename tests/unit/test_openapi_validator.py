@@ -46,6 +46,32 @@ def test_validator_rejects_missing_paths() -> None:
         validator.validate({"openapi": "3.1.0"})
 
 
+def test_validator_accepts_server_list_whose_first_entry_has_no_url() -> None:
+    result = OpenApiValidatorAdapter().validate(
+        {
+            "openapi": "3.1.0",
+            "servers": [{"description": "placeholder"}, {"url": "https://api.example.com"}],
+            "paths": {"/pets": {"get": {"operationId": "listPets", "responses": {}}}},
+        }
+    )
+
+    assert result.warnings == []
+
+
+def test_validator_warns_on_server_variables_without_default() -> None:
+    result = OpenApiValidatorAdapter().validate(
+        {
+            "openapi": "3.1.0",
+            "servers": [{"url": "https://{region}.example.com", "variables": {"region": {}}}],
+            "paths": {"/pets": {"get": {"operationId": "listPets", "responses": {}}}},
+        }
+    )
+
+    assert result.warnings == [
+        "Server URL 'https://{region}.example.com' uses variable 'region' without a default."
+    ]
+
+
 def test_validator_rejects_operation_without_resolvable_server_url() -> None:
     validator = OpenApiValidatorAdapter()
     with pytest.raises(OpenApiValidationError):
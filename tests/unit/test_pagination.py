@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Mapping, Optional
+
+import httpx
+
+from openapi_to_mcp.adapters.pagination import Paginator
+from openapi_to_mcp.domain.models import Pagination
+from openapi_to_mcp.errors import InvocationError
+
+_URL = "https://api.example.com/pets"
+
+
+def _page(json: Any, url: str = _URL, headers: Optional[dict] = None) -> httpx.Response:
+    return httpx.Response(200, json=json, headers=headers, request=httpx.Request("GET", url))
+
+
+def test_paginator_follows_cursors_until_the_last_page() -> None:
+    pages = {
+        None: {"data": [1, 2], "meta": {"next": "b"}},
+        "b": {"data": [3, 4], "meta": {"next": "c"}},
+        "c": {"data": [5], "meta": {"next": None}},
+    }
+    seen: list[dict] = []
+
+    async def fetch(url: Optional[str], params: Mapping[str, Any]) -> httpx.Response:
+        seen.append(dict(params))
+        return _page(pages[params.get("cursor")])
+
+    pagination = Pagination(
+        style="cursor", items="data", cursor_param="cursor", next_cursor="meta.next"
+    )
+    collected = asyncio.run(Paginator().collect(pagination, {"q": "cat"}, fetch))
+
+    assert collected.body == {"data": [1, 2, 3, 4, 5], "meta": {"next": "b"}}
+    assert collected.summary == {
+        "style": "cursor",
+        "pages": 3,
+        "items": 5,
+        "complete": True,
+        "next": None,
+    }
+    assert seen == [{"q": "cat"}, {"q": "cat", "cursor": "b"}, {"q": "cat", "cursor": "c"}]
+
+
+def test_paginator_follows_same_origin_links_and_stops_at_item_limit() -> None:
+    async def fetch(url: Optional[str], params: Mapping[str, Any]) -> httpx.Response:
+        if url is None:
+            return _page([1, 2], headers={"Link": '</pets?page=2>; rel="next"'})
+        if url.endswith("page=2"):
+            next_link = '<https://other.example.com/pets?page=3>; rel="next"'
+            return _page([3, 4], url, {"Link": next_link})
+        raise AssertionError(url)
+
+    collected = asyncio.run(
+        Paginator(max_items=10).collect(Pagination(style="link"), {}, fetch)
+    )
+    assert collected.body == [1, 2, 3, 4]
+    assert collected.summary is not None
+    assert collected.summary["complete"] is False
+    assert collected.summary["next"] == "https://other.example.com/pets?page=3"
+
+    trimmed = asyncio.run(Paginator(max_items=3).collect(Pagination(style="link"), {}, fetch))
+    assert trimmed.body == [1, 2, 3]
+    assert trimmed.summary is not None
+    assert (trimmed.summary["complete"], trimmed.summary["next"]) == (False, None)
+
+
+def test_paginator_fetches_offset_pages_concurrently() -> None:
+    in_flight = 0
+    peak = 0
+
+    async def fetch(url: Optional[str], params: Mapping[str, Any]) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        offset, limit = int(params.get("offset", 0)), int(params["limit"])
+        return _page({"items": list(range(offset, min(offset + limit, 25)))})
+
+    pagination = Pagination(style="offset", items="items", page_size=10)
+    collected = asyncio.run(Paginator(concurrency=3).collect(pagination, {}, fetch))
+    assert collected.body == {"items": list(range(25))}
+    assert collected.summary is not None
+    assert (collected.summary["pages"], collected.summary["complete"]) == (3, True)
+    # One window of three pages after the first; the page at offset 30 is wasted.
+    assert peak == 3
+
+    limited = asyncio.run(
+        Paginator(max_pages=2, concurrency=3).collect(pagination, {"offset": 5}, fetch)
+    )
+    assert limited.body == {"items": list(range(5, 25))}
+    assert limited.summary is not None
+    assert (limited.summary["complete"], limited.summary["next"]) == (False, 25)
+
+
+def test_paginator_returns_partial_results_when_a_later_page_fails() -> None:
+    async def fetch(url: Optional[str], params: Mapping[str, Any]) -> httpx.Response:
+        if params.get("cursor") == "b":
+            raise InvocationError("upstream down")
+        if params.get("cursor") == "c":
+            return httpx.Response(500)
+        return _page({"data": [1], "next": "b"})
+
+    pagination = Pagination(
+        style="cursor", items="data", cursor_param="cursor", next_cursor="next"
+    )
+    collected = asyncio.run(Paginator().collect(pagination, {}, fetch))
+    assert collected.body == {"data": [1], "next": "b"}
+    assert collected.summary is not None
+    assert (collected.summary["complete"], collected.summary["next"]) == (False, "b")
+
+    failed = asyncio.run(Paginator().collect(pagination, {"cursor": "c"}, fetch))
+    assert failed.summary is None and failed.first.status_code == 500
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import pytest
+
+from openapi_to_mcp.adapters.projection import Projection
+from openapi_to_mcp.errors import InvocationError
+
+_BODY = {
+    "total": 2,
+    "items": [
+        {"id": 1, "name": "Rex", "owner": {"name": "Ann", "address": {"city": "Oslo"}}},
+        {"id": 2, "name": "Tom", "tags": ["cat"]},
+    ],
+    "meta": {"next": "b"},
+}
+
+
+def test_projection_keeps_dotted_paths_across_arrays() -> None:
+    projection = Projection.from_paths(["total", "items.id", "items.owner.name"])
+
+    assert projection.apply(_BODY) == {
+        "total": 2,
+        "items": [{"id": 1, "owner": {"name": "Ann"}}, {"id": 2}],
+    }
+    # The decoded body is left untouched for other readers.
+    assert _BODY["items"][0]["name"] == "Rex"
+
+
+def test_projection_supports_json_pointers_indexes_and_wildcards() -> None:
+    assert Projection.from_paths(["/items/1/name", "/meta"]).apply(_BODY) == {
+        "items": [{"name": "Tom"}],
+        "meta": {"next": "b"},
+    }
+    assert Projection.from_paths(["/items/*/owner"]).apply(_BODY) == {
+        "items": [{"owner": {"name": "Ann", "address": {"city": "Oslo"}}}, {}]
+    }
+    # A shorter path keeps the whole subtree even when listed after a longer one.
+    assert Projection.from_paths(["meta.next.x", "meta"]).apply(_BODY) == {"meta": {"next": "b"}}
+    with pytest.raises(InvocationError, match="Invalid field path"):
+        Projection.from_paths(["items", {"path": "id"}])  # type: ignore[list-item]
+    with pytest.raises(InvocationError, match="needs a JSON body"):
+        Projection.from_paths(["items"]).apply('{"items": []}')
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+
+from openapi_to_mcp.adapters.rate_limiter import RateLimitPacer
+from openapi_to_mcp.errors import RateLimitedError
+
+_ORIGIN = "https://api.example.com:443"
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 100.0
+        self.slept: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+def _pacer(clock: _Clock, **kwargs) -> RateLimitPacer:
+    return RateLimitPacer(
+        clock=clock, wall_clock=lambda: 1_700_000_000.0, sleep=clock.sleep, **kwargs
+    )
+
+
+def test_pacer_spaces_calls_at_the_static_rate() -> None:
+    clock = _Clock()
+    pacer = _pacer(clock, static_rates={"https://api.example.com": 2.0})
+
+    async def scenario() -> None:
+        for _ in range(4):
+            await pacer.acquire(_ORIGIN)
+
+    asyncio.run(scenario())
+
+    assert clock.slept == [0.5, 0.5]
+
+
+def test_pacer_learns_remaining_quota_and_pauses_on_retry_after() -> None:
+    clock = _Clock()
+    pacer = _pacer(clock, max_wait_seconds=30.0)
+
+    async def scenario() -> None:
+        await pacer.acquire("https://other.example.com:443")
+        pacer.observe(
+            _ORIGIN,
+            httpx.Response(200, headers={"X-RateLimit-Remaining": "2", "X-RateLimit-Reset": "4"}),
+        )
+        for _ in range(3):
+            await pacer.acquire(_ORIGIN)
+        pacer.observe(_ORIGIN, httpx.Response(429, headers={"Retry-After": "7"}))
+        await pacer.acquire(_ORIGIN)
+
+    asyncio.run(scenario())
+
+    assert clock.slept[0] == pytest.approx(2.0)
+    assert clock.slept[-1] == pytest.approx(7.0)
+
+
+def test_pacer_waits_for_epoch_reset_and_fails_fast_beyond_max_wait() -> None:
+    clock = _Clock()
+    pacer = _pacer(clock, max_wait_seconds=5.0)
+    pacer.observe(
+        _ORIGIN,
+        httpx.Response(
+            200, headers={"RateLimit-Remaining": "0", "RateLimit-Reset": "1700000060"}
+        ),
+    )
+
+    with pytest.raises(RateLimitedError, match="rate limit") as raised:
+        asyncio.run(pacer.acquire(_ORIGIN))
+    assert raised.value.retry_after_seconds > 5.0
+    assert clock.slept == []
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import httpx
+
+from openapi_to_mcp.adapters.response_cache import ResponseCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _response(status_code: int = 200, content: bytes = b"{}", **headers: str) -> httpx.Response:
+    return httpx.Response(
+        status_code,
+        headers={name.replace("_", "-"): value for name, value in headers.items()},
+        content=content,
+    )
+
+
+def test_cache_honors_max_age_and_age() -> None:
+    clock = FakeClock()
+    cache = ResponseCache(max_bytes=10_000, clock=clock)
+    key = cache.key_for("getPet", "GET", "https://api.example.com/pets/1", {"a": 1}, {})
+
+    assert cache.store(key, _response(cache_control="max-age=60", age="20"))
+    entry = cache.lookup(key)
+    clock.now += 39
+    assert cache.is_fresh(entry)
+    clock.now += 1
+    assert not cache.is_fresh(entry)
+
+
+def test_cache_skips_no_store_and_responses_without_freshness_or_validators() -> None:
+    cache = ResponseCache(max_bytes=10_000)
+
+    assert not cache.store("a", _response(cache_control="no-store, max-age=60"))
+    assert not cache.store("b", _response())
+    assert not cache.store("c", _response(status_code=500, cache_control="max-age=60"))
+    assert len(cache) == 0
+
+
+def test_cache_keeps_validator_only_responses_for_revalidation() -> None:
+    cache = ResponseCache(max_bytes=10_000)
+
+    assert cache.store("k", _response(etag='"v1"', cache_control="no-cache"))
+    entry = cache.lookup("k")
+    assert not cache.is_fresh(entry)
+    assert entry.validators() == {"If-None-Match": '"v1"'}
+
+    cache.refresh("k", entry, _response(status_code=304, cache_control="max-age=30"))
+    assert cache.is_fresh(entry)
+    assert cache.size_bytes == entry.size == len(b"{}") + sum(
+        len(name) + len(value) for name, value in entry.response.headers.raw
+    )
+
+
+def test_cache_uses_expires_relative_to_date() -> None:
+    clock = FakeClock()
+    cache = ResponseCache(max_bytes=10_000, clock=clock)
+
+    cache.store(
+        "k",
+        _response(
+            date="Mon, 01 Jan 2024 00:00:00 GMT",
+            expires="Mon, 01 Jan 2024 00:00:10 GMT",
+        ),
+    )
+    entry = cache.lookup("k")
+    clock.now += 9
+    assert cache.is_fresh(entry)
+    clock.now += 2
+    assert not cache.is_fresh(entry)
+
+
+def test_cache_evicts_least_recently_used_entries_by_bytes() -> None:
+    cache = ResponseCache(max_bytes=250)
+    body = b"x" * 80
+
+    cache.store("a", _response(content=body, cache_control="max-age=60"))
+    cache.store("b", _response(content=body, cache_control="max-age=60"))
+    cache.lookup("a")
+    cache.store("c", _response(content=body, cache_control="max-age=60"))
+
+    assert cache.lookup("a") is not None
+    assert cache.lookup("b") is None
+    assert cache.lookup("c") is not None
+    assert cache.size_bytes <= 250
+    assert not cache.store("huge", _response(content=b"x" * 300, cache_control="max-age=60"))
+
+
+def test_cache_key_includes_query_headers_and_body() -> None:
+    base = ResponseCache.key_for("op", "GET", "https://a.example.com/x", {"q": 1}, {"X-A": "1"})
+
+    assert base == ResponseCache.key_for(
+        "op", "GET", "https://a.example.com/x", {"q": 1}, {"x-a": "1"}
+    )
+    assert base != ResponseCache.key_for("op", "GET", "https://a.example.com/x", {"q": 2}, {})
+    assert ResponseCache.key_for(
+        "op", "POST", "https://a.example.com/x", {}, {}, {"b": 1, "a": 2}
+    ) == ResponseCache.key_for("op", "POST", "https://a.example.com/x", {}, {}, {"a": 2, "b": 1})
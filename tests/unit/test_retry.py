@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from openapi_to_mcp.adapters.retry import RetryBudget, RetryPolicy
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_backoff_uses_full_jitter_with_exponential_ceiling() -> None:
+    policy = RetryPolicy(base_delay_seconds=0.1, max_delay_seconds=0.5)
+    ceilings: list[float] = []
+
+    def rng(low: float, high: float) -> float:
+        ceilings.append(high)
+        return low
+
+    assert [policy.backoff_seconds(attempt, rng) for attempt in (1, 2, 3, 4)] == [0.0] * 4
+    assert ceilings == [0.1, 0.2, 0.4, 0.5]
+
+
+def test_retry_after_accepts_seconds_and_http_dates() -> None:
+    policy = RetryPolicy()
+
+    assert policy.retry_after_seconds("3") == 3.0
+    assert policy.retry_after_seconds("Mon, 01 Jan 2024 00:00:00 GMT") == 0.0
+    assert policy.retry_after_seconds("soon") is None
+    assert policy.retry_after_seconds(None) is None
+
+
+def test_retry_budget_limits_retries_to_a_fraction_of_requests() -> None:
+    clock = FakeClock()
+    budget = RetryBudget(ratio=0.5, min_retries_per_second=0.1, max_tokens=2.0, clock=clock)
+
+    assert budget.try_acquire()
+    assert budget.try_acquire()
+    assert not budget.try_acquire()
+
+    budget.on_request()
+    budget.on_request()
+    assert budget.try_acquire()
+    assert not budget.try_acquire()
+
+    clock.now += 10.0
+    assert budget.try_acquire()
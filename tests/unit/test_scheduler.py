@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import asyncio
+
+from openapi_to_mcp.adapters.scheduler import DEFAULT_CLASS, FairScheduler
+
+
+def _run_order(
+    scheduler: FairScheduler, calls: list[tuple[str, str, tuple[str, ...]]]
+) -> list[str]:
+    order: list[str] = []
+    gate = asyncio.Event()
+
+    async def call(label: str, session: str, tool: str, tags: tuple[str, ...]) -> None:
+        async with scheduler.slot(session, tool, tags):
+            order.append(label)
+            await gate.wait()
+
+    async def scenario() -> None:
+        tasks = []
+        for index, (session, tool, tags) in enumerate(calls):
+            tasks.append(asyncio.create_task(call(f"{session}-{index}", session, tool, tags)))
+            await asyncio.sleep(0)
+        gate.set()
+        await asyncio.gather(*tasks)
+
+    asyncio.run(scenario())
+    return order
+
+
+def test_scheduler_interleaves_a_late_session_with_a_busy_one() -> None:
+    scheduler = FairScheduler(capacity=1)
+    calls = [("batch", "export", ())] * 4 + [("chat", "search", ())]
+
+    order = _run_order(scheduler, calls)
+
+    # The late session starts at the current virtual time, ahead of the batch backlog.
+    assert order == ["batch-0", "chat-4", "batch-1", "batch-2", "batch-3"]
+    assert scheduler.in_flight == 0
+
+
+def test_scheduler_serves_heavier_classes_more_often() -> None:
+    scheduler = FairScheduler(
+        capacity=1,
+        tag_classes={"reports": "batch", "search": "interactive"},
+        class_weights={"batch": 1, "interactive": 4},
+    )
+    calls = [("a", "export", ("reports",))] * 3 + [("b", "find", ("search",))] * 4
+
+    order = _run_order(scheduler, calls)
+
+    assert scheduler.class_for(("misc",)) == DEFAULT_CLASS
+    assert scheduler.class_for(("reports", "search")) == "interactive"
+    assert order == ["a-0", "b-3", "b-4", "b-5", "b-6", "a-1", "a-2"]
+
+
+def test_scheduler_skips_cancelled_waiters() -> None:
+    scheduler = FairScheduler(capacity=1)
+
+    async def scenario() -> None:
+        async with scheduler.slot("s", "t"):
+            waiter = asyncio.create_task(scheduler.slot("s", "t").__aenter__())
+            await asyncio.sleep(0)
+            assert scheduler.queued == 1
+            waiter.cancel()
+            await asyncio.sleep(0)
+        async with scheduler.slot("s", "t"):
+            assert scheduler.in_flight == 1
+
+    asyncio.run(scenario())
+    assert scheduler.in_flight == 0
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from openapi_to_mcp.adapters.singleflight import SingleFlight
+
+
+def test_singleflight_shares_one_call_per_key() -> None:
+    singleflight = SingleFlight()
+    calls: list[str] = []
+
+    async def scenario() -> list[str]:
+        release = asyncio.Event()
+
+        async def work(key: str) -> str:
+            calls.append(key)
+            await release.wait()
+            return f"result-{key}"
+
+        waiters = [
+            asyncio.create_task(singleflight.do(key, lambda key=key: work(key)))
+            for key in ("a", "a", "a", "b")
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        return await asyncio.gather(*waiters)
+
+    results = asyncio.run(scenario())
+
+    assert results == ["result-a", "result-a", "result-a", "result-b"]
+    assert calls == ["a", "b"]
+    assert len(singleflight) == 0
+
+
+def test_singleflight_fans_out_errors_and_survives_caller_cancellation() -> None:
+    singleflight = SingleFlight()
+
+    async def scenario() -> None:
+        release = asyncio.Event()
+
+        async def work() -> str:
+            await release.wait()
+            raise RuntimeError("upstream down")
+
+        leader = asyncio.create_task(singleflight.do("k", work))
+        follower = asyncio.create_task(singleflight.do("k", work))
+        await asyncio.sleep(0)
+        leader.cancel()
+        release.set()
+        with pytest.raises(RuntimeError, match="upstream down"):
+            await follower
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+
+    asyncio.run(scenario())
@@ -50,3 +50,4 @@ def test_startup_orchestrator_bootstraps_and_registers_tools() -> None:
     assert report.generated_count == 1
     assert len(mcp.registered_tools) == 1
     assert report.warnings == ["sample warning"]
+    assert orchestrator.upstream_urls() == ["https://api.example.com"]
@@ -1,7 +1,12 @@
 from __future__ import annotations
 
 from openapi_to_mcp.application.tool_generator import ToolGenerationService
-from openapi_to_mcp.domain.models import ApiOperation
+from openapi_to_mcp.domain.models import (
+    ApiOperation,
+    OperationTimeouts,
+    Pagination,
+    SecurityRequirement,
+)
 
 
 def test_generator_uses_operation_id_when_present() -> None:
@@ -47,5 +52,232 @@ def test_generator_uses_fallback_name_and_input_schema() -> None:
 
     assert tool.name == "post_pets_by_petId"
     assert tool.input_schema["required"] == ["body", "petId"]
+    assert tool.binding["tool_name"] == "post_pets_by_petId"
     assert tool.binding["path_params"] == ["petId"]
     assert tool.binding["query_params"] == ["includeHistory"]
+    assert tool.plan is not None
+    assert tool.plan.method == "POST"
+    assert tool.plan.base_url == "https://api.example.com"
+    assert tool.plan.path_literals == ("/pets/", "")
+    assert tool.plan.path_placeholders == ("petId",)
+    assert tool.plan.query_params == ("includeHistory",)
+
+
+def test_generator_marks_safe_methods_cacheable_with_extension_override() -> None:
+    def operation(method: str, extensions: dict) -> ApiOperation:
+        return ApiOperation(
+            method=method,
+            path="/search",
+            operation_id=f"{method}Search",
+            summary=None,
+            parameters=[],
+            request_body_schema=None,
+            request_body_required=False,
+            server_url="https://api.example.com",
+            extensions=extensions,
+        )
+
+    tools, _ = ToolGenerationService().generate(
+        [
+            operation("get", {}),
+            operation("post", {"x-mcp-idempotent": True}),
+            operation("put", {"x-mcp-cache": True}),
+            operation("head", {"x-mcp-cache": False, "x-mcp-passthrough": True}),
+        ]
+    )
+
+    assert [tool.binding["cacheable"] for tool in tools] == [True, False, True, False]
+    assert [tool.plan.passthrough for tool in tools if tool.plan] == [None, None, None, True]
+    assert [tool.binding["idempotent"] for tool in tools] == [True, True, True, True]
+    assert tools[0].plan is not None and tools[0].plan.idempotent
+
+
+def test_generator_reads_declared_operation_timeouts() -> None:
+    def operation(operation_id: str, timeout: object) -> ApiOperation:
+        return ApiOperation(
+            method="get",
+            path="/reports",
+            operation_id=operation_id,
+            summary=None,
+            parameters=[],
+            request_body_schema=None,
+            request_body_required=False,
+            server_url="https://api.example.com",
+            extensions={"x-mcp-timeout": timeout},
+        )
+
+    tools, _ = ToolGenerationService().generate(
+        [
+            operation("getReport", 60),
+            operation("getPet", {"connect": 0.2, "read": 0.5, "total": "1"}),
+            operation("listPets", True),
+        ]
+    )
+
+    assert tools[0].binding["timeouts"] == {"total": 60.0}
+    assert tools[1].binding["timeouts"] == {"connect": 0.2, "read": 0.5}
+    assert "timeouts" not in tools[2].binding
+    assert tools[1].plan is not None
+    assert tools[1].plan.timeouts == OperationTimeouts(connect=0.2, read=0.5)
+
+
+def test_generator_reads_declared_pagination() -> None:
+    def operation(operation_id: str, pagination: object) -> ApiOperation:
+        return ApiOperation(
+            method="get",
+            path="/pets",
+            operation_id=operation_id,
+            summary=None,
+            parameters=[],
+            request_body_schema=None,
+            request_body_required=False,
+            server_url="https://api.example.com",
+            extensions={"x-mcp-pagination": pagination},
+        )
+
+    tools, _ = ToolGenerationService().generate(
+        [
+            operation("listPets", {"style": "offset", "items": "data", "page_size": 50}),
+            operation("listOwners", {"style": "cursor", "items": "data"}),
+        ]
+    )
+
+    assert tools[0].binding["pagination"]["page_size"] == 50
+    assert tools[0].plan is not None
+    assert tools[0].plan.pagination == Pagination(style="offset", items="data", page_size=50)
+    assert "pagination" not in tools[1].binding
+
+
+def test_generator_adds_projection_argument_unless_the_name_is_taken() -> None:
+    def operation(operation_id: str, parameters: list) -> ApiOperation:
+        return ApiOperation(
+            method="get",
+            path="/pets",
+            operation_id=operation_id,
+            summary=None,
+            parameters=parameters,
+            request_body_schema=None,
+            request_body_required=False,
+            server_url="https://api.example.com",
+        )
+
+    tools, _ = ToolGenerationService().generate(
+        [
+            operation("listPets", []),
+            operation("listOwners", [{"name": "fields", "in": "query", "schema": {}}]),
+        ]
+    )
+
+    fields = tools[0].input_schema["properties"]["fields"]
+    assert fields["type"] == "array" and fields["items"] == {"type": "string"}
+    assert tools[0].plan is not None and tools[0].plan.projection_argument == "fields"
+    assert tools[1].input_schema["properties"]["fields"] == {}
+    assert tools[1].plan is not None and tools[1].plan.projection_argument is None
+
+
+def test_generator_compiles_security_requirements_into_the_plan() -> None:
+    security = [
+        [{"scheme": "oauth", "type": "oauth2", "token_url": "https://auth/token", "scopes": ["a"]}],
+        [],
+    ]
+    tools, _ = ToolGenerationService().generate(
+        [
+            ApiOperation(
+                method="post",
+                path="/pets",
+                operation_id="createPet",
+                summary=None,
+                parameters=[],
+                request_body_schema=None,
+                request_body_required=False,
+                server_url="https://api.example.com",
+                security=security,
+            )
+        ]
+    )
+
+    assert tools[0].binding["security"] == security
+    assert tools[0].plan is not None
+    assert tools[0].plan.security == (
+        (
+            SecurityRequirement(
+                scheme="oauth", kind="oauth2", token_url="https://auth/token", scopes=("a",)
+            ),
+        ),
+        (),
+    )
+
+
+def test_generator_compiles_alternate_servers_into_the_plan() -> None:
+    operation = ApiOperation(
+        method="get",
+        path="/pets",
+        operation_id="listPets",
+        summary=None,
+        parameters=[],
+        request_body_schema=None,
+        request_body_required=False,
+        server_url="https://eu.example.com/v1/",
+        server_urls=["https://eu.example.com/v1/", "https://us.example.com/v1"],
+    )
+
+    (tool,), _ = ToolGenerationService().generate([operation])
+
+    assert tool.binding["server_urls"] == operation.server_urls
+    assert tool.plan is not None
+    assert tool.plan.base_url == "https://eu.example.com/v1"
+    assert tool.plan.base_urls == ("https://eu.example.com/v1", "https://us.example.com/v1")
+
+
+def test_generator_exposes_enum_server_variables_as_arguments() -> None:
+    operation = ApiOperation(
+        method="get",
+        path="/pets",
+        operation_id="listPets",
+        summary=None,
+        parameters=[],
+        request_body_schema=None,
+        request_body_required=False,
+        server_url="https://eu.api.example.com/v2",
+        server_template="https://{region}.api.example.com/v2",
+        server_variables={"region": {"default": "eu", "enum": ["eu", "us"]}},
+        tags=["search"],
+    )
+
+    (tool,), _ = ToolGenerationService().generate([operation])
+
+    assert tool.input_schema["properties"]["server_region"]["enum"] == ["eu", "us"]
+    assert "server_region" not in tool.input_schema.get("required", [])
+    assert tool.plan is not None
+    assert tool.plan.server_arguments == (("server_region", "eu"),)
+    assert tool.plan.tags == ("search",)
+    assert tool.plan.server_variants == {
+        ("eu",): "https://eu.api.example.com/v2",
+        ("us",): "https://us.api.example.com/v2",
+    }
+
+
+def test_generator_hides_server_arguments_beyond_the_variant_cap() -> None:
+    operation = ApiOperation(
+        method="get",
+        path="/pets",
+        operation_id="listPets",
+        summary=None,
+        parameters=[],
+        request_body_schema=None,
+        request_body_required=False,
+        server_url="https://a0.b0.example.com",
+        server_template="https://{a}.{b}.example.com",
+        server_variables={
+            name: {"default": f"{name}0", "enum": [f"{name}{index}" for index in range(20)]}
+            for name in ("a", "b")
+        },
+    )
+
+    (tool,), _ = ToolGenerationService().generate([operation])
+
+    # 400 combinations exceed the plan's cap, so selection is not offered at all.
+    assert not any(name.startswith("server_") for name in tool.input_schema["properties"])
+    assert "server_variables" not in tool.binding
+    assert tool.plan is not None
+    assert tool.plan.server_arguments == ()
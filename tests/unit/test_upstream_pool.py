@@ -0,0 +1,289 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+
+import httpx
+import pytest
+
+from openapi_to_mcp.adapters.dns_cache import DnsCache
+from openapi_to_mcp.adapters.upstream_pool import OriginLimits, UpstreamPoolManager, origin_of
+from openapi_to_mcp.errors import InvocationError
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _mock_client(origin: str) -> httpx.AsyncClient:
+    del origin
+    return httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(200)))
+
+
+def test_origin_of_normalizes_default_ports() -> None:
+    assert origin_of("https://API.example.com/v1/pets") == "https://api.example.com:443"
+    assert origin_of("http://api.example.com:8080/v1") == "http://api.example.com:8080"
+    with pytest.raises(InvocationError):
+        origin_of("/relative/path")
+
+
+def test_pool_reuses_one_client_per_origin() -> None:
+    async def scenario() -> None:
+        pool = UpstreamPoolManager(client_factory=_mock_client)
+        async with pool.lease("https://a.example.com:443") as first:
+            pass
+        async with pool.lease("https://a.example.com:443") as second:
+            pass
+        async with pool.lease("https://b.example.com:443") as other:
+            pass
+
+        assert first is second
+        assert other is not first
+        assert pool.origins == ["https://a.example.com:443", "https://b.example.com:443"]
+        await pool.aclose()
+        assert first.is_closed
+
+    asyncio.run(scenario())
+
+
+def test_pool_evicts_only_idle_unleased_origins() -> None:
+    async def scenario() -> None:
+        clock = FakeClock()
+        pool = UpstreamPoolManager(
+            idle_timeout_seconds=30.0, client_factory=_mock_client, clock=clock
+        )
+        async with pool.lease("https://idle.example.com:443") as idle_client:
+            pass
+        async with pool.lease("https://busy.example.com:443"):
+            clock.now = 60.0
+            assert await pool.evict_idle() == 1
+
+        assert idle_client.is_closed
+        assert pool.origins == ["https://busy.example.com:443"]
+        await pool.aclose()
+
+    asyncio.run(scenario())
+
+
+def test_pool_eviction_never_closes_a_pool_leased_while_closing() -> None:
+    async def scenario() -> None:
+        clock = FakeClock()
+        pool = UpstreamPoolManager(
+            idle_timeout_seconds=30.0, client_factory=_mock_client, clock=clock
+        )
+        async with pool.lease("https://a.example.com:443") as first:
+            pass
+        async with pool.lease("https://b.example.com:443") as second:
+            pass
+        closing = asyncio.Event()
+        release = asyncio.Event()
+        close_first = first.aclose
+
+        async def slow_close() -> None:
+            closing.set()
+            await release.wait()
+            await close_first()
+
+        first.aclose = slow_close  # type: ignore[method-assign]
+        clock.now = 60.0
+        eviction = asyncio.create_task(pool.evict_idle())
+        await closing.wait()
+        # A lease taken while the first close is pending gets a fresh pool.
+        async with pool.lease("https://b.example.com:443") as leased:
+            release.set()
+            assert await eviction == 2
+            assert leased is not second and not leased.is_closed
+        assert second.is_closed
+        await pool.aclose()
+
+    asyncio.run(scenario())
+
+
+def test_pool_applies_per_origin_limits_override() -> None:
+    pool = UpstreamPoolManager(
+        max_connections=100,
+        max_keepalive_connections=20,
+        origin_limits={"https://slow.example.com": OriginLimits(5, 2)},
+    )
+
+    assert pool.limits_for("https://slow.example.com:443") == OriginLimits(5, 2)
+    assert pool.limits_for("https://other.example.com:443") == OriginLimits(100, 20)
+
+
+def test_pool_rejects_leases_after_close() -> None:
+    async def scenario() -> None:
+        pool = UpstreamPoolManager(client_factory=_mock_client)
+        await pool.start()
+        await pool.aclose()
+        with pytest.raises(InvocationError):
+            async with pool.lease("https://a.example.com:443"):
+                pass
+
+    asyncio.run(scenario())
+
+
+def test_pool_selects_http2_per_origin() -> None:
+    async def scenario() -> None:
+        pool = UpstreamPoolManager(http2_origins=["https://h2.example.com"])
+
+        assert pool.uses_http2("https://h2.example.com:443") is True
+        assert pool.uses_http2("https://h1.example.com:443") is False
+        async with pool.lease("https://h2.example.com:443"):
+            assert pool.open_connections("https://h2.example.com:443") == 0
+        await pool.aclose()
+
+    asyncio.run(scenario())
+
+
+def test_pool_enables_http2_for_all_origins() -> None:
+    pool = UpstreamPoolManager(http2_enabled=True)
+
+    assert pool.uses_http2("https://any.example.com:443") is True
+
+
+def test_pool_warms_keepalive_connections_per_distinct_origin() -> None:
+    seen: list[tuple[str, str]] = []
+
+    def client_factory(origin: str) -> httpx.AsyncClient:
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append((request.method, str(request.url)))
+            return httpx.Response(404)
+
+        return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    pool = UpstreamPoolManager(
+        max_keepalive_connections=3,
+        origin_limits={"https://small.example.com": OriginLimits(2, 1)},
+        client_factory=client_factory,
+    )
+    warmed = asyncio.run(
+        pool.warm_up(
+            [
+                "https://api.example.com/v1",
+                "https://api.example.com:443/v2",
+                "https://small.example.com",
+                "/relative",
+            ],
+            connections=4,
+        )
+    )
+
+    assert warmed == {"https://api.example.com:443": 3, "https://small.example.com:443": 1}
+    assert seen.count(("HEAD", "https://api.example.com/")) == 3
+    assert pool.origins == ["https://api.example.com:443", "https://small.example.com:443"]
+
+
+def test_pool_serves_asgi_origins_in_process_and_skips_their_warmup() -> None:
+    async def app(scope, receive, send) -> None:
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": scope["path"].encode()})
+
+    pool = UpstreamPoolManager(asgi_apps={"http://pets.internal": app})
+
+    async def scenario() -> tuple[bytes, dict[str, int]]:
+        async with pool.lease("http://pets.internal:80") as client:
+            response = await client.get("http://pets.internal/pets/1")
+        warmed = await pool.warm_up(["http://pets.internal"], connections=2)
+        await pool.aclose()
+        return response.content, warmed
+
+    body, warmed = asyncio.run(scenario())
+
+    assert body == b"/pets/1"
+    assert warmed == {"http://pets.internal:80": 0}
+
+
+def test_pool_routes_uds_origins_over_the_unix_socket(tmp_path) -> None:
+    socket_path = str(tmp_path / "upstream.sock")
+    request_lines: list[bytes] = []
+
+    async def serve(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        head = await reader.readuntil(b"\r\n\r\n")
+        request_lines.append(head.split(b"\r\n")[0])
+        writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\nConnection: close\r\n\r\nok")
+        await writer.drain()
+        writer.close()
+
+    async def scenario() -> bytes:
+        server = await asyncio.start_unix_server(serve, path=socket_path)
+        pool = UpstreamPoolManager(uds_paths={"http://sidecar.local": socket_path})
+        try:
+            async with pool.lease("http://sidecar.local:80") as client:
+                response = await client.get("http://sidecar.local/health")
+        finally:
+            await pool.aclose()
+            server.close()
+            await server.wait_closed()
+        return response.content
+
+    assert asyncio.run(scenario()) == b"ok"
+    assert request_lines == [b"GET /health HTTP/1.1"]
+
+
+def test_pool_connects_through_the_dns_cache_and_counts_open_connections() -> None:
+    resolved: list[str] = []
+
+    async def serve(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        with contextlib.suppress(asyncio.IncompleteReadError, ConnectionError):
+            while await reader.readuntil(b"\r\n\r\n"):
+                writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\nok")
+                await writer.drain()
+
+    async def resolver(host: str, port: int) -> list[str]:
+        resolved.append(host)
+        return ["127.0.0.1"]
+
+    async def scenario() -> tuple[int, int]:
+        server = await asyncio.start_server(serve, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        origin = f"http://upstream.test:{port}"
+        pool = UpstreamPoolManager(dns_cache=DnsCache(resolver=resolver))
+        try:
+            async with pool.lease(origin) as client:
+                for _ in range(2):
+                    assert (await client.get(f"{origin}/health")).content == b"ok"
+            opened = pool.open_connections(origin)
+            async with pool.lease("http://127.0.0.1:1") as client:
+                with pytest.raises(httpx.ConnectError):
+                    await client.get("http://127.0.0.1:1/")
+        finally:
+            await pool.aclose()
+            server.close()
+        return opened, pool.open_connections(origin)
+
+    assert asyncio.run(scenario()) == (1, 0)
+    assert resolved == ["upstream.test"]
+
+
+def test_pool_keeps_idle_connections_for_the_idle_timeout() -> None:
+    accepted: list[int] = []
+
+    async def serve(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        accepted.append(1)
+        with contextlib.suppress(asyncio.IncompleteReadError, ConnectionError):
+            while await reader.readuntil(b"\r\n\r\n"):
+                writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\nok")
+                await writer.drain()
+
+    async def scenario(idle_timeout_seconds: float) -> int:
+        accepted.clear()
+        server = await asyncio.start_server(serve, "127.0.0.1", 0)
+        origin = f"http://127.0.0.1:{server.sockets[0].getsockname()[1]}"
+        pool = UpstreamPoolManager(idle_timeout_seconds=idle_timeout_seconds)
+        try:
+            async with pool.lease(origin) as client:
+                await client.get(f"{origin}/")
+                await asyncio.sleep(0.1)
+                await client.get(f"{origin}/")
+        finally:
+            await pool.aclose()
+            server.close()
+        return len(accepted)
+
+    # Keep-alive expiry follows the idle timeout rather than the 5 s HTTPX default.
+    assert asyncio.run(scenario(idle_timeout_seconds=0.05)) == 2
+    assert asyncio.run(scenario(idle_timeout_seconds=300.0)) == 1